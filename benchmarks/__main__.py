@@ -0,0 +1,80 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from .runner import compare as compare_results
+from .runner import dump_results, format_comparison, load_benchmarks, load_results, module_names, run
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the stockholm benchmarks.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    def add_run_arguments(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument(
+            "-m", "--module", action="append", help="only run benchmarks from this module (for example 'core')"
+        )
+        subparser.add_argument("-k", "--keyword", help="only run benchmarks with names containing this string")
+        subparser.add_argument("--repeat", type=int, default=5, help="number of timing repetitions (default: 5)")
+        subparser.add_argument(
+            "--min-time", type=float, default=0.2, help="minimum time per repetition in seconds (default: 0.2)"
+        )
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks (default)")
+    add_run_arguments(run_parser)
+    run_parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare results against a saved baseline, exits with status 1 on regressions"
+    )
+    compare_parser.add_argument("baseline", help="JSON results file to compare against")
+    compare_parser.add_argument("current", nargs="?", help="JSON results file, benchmarks are run if omitted")
+    compare_parser.add_argument(
+        "-t", "--threshold", type=float, default=0.1, help="allowed slowdown before flagging (default: 0.1)"
+    )
+    add_run_arguments(compare_parser)
+
+    subparsers.add_parser("list", help="list benchmark modules")
+
+    argv = list(argv if argv is not None else sys.argv[1:])
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "run")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "list":
+        for name in module_names():
+            print(name[len("bench_") :])
+        return 0
+
+    if args.command == "run":
+        results = run(load_benchmarks(args.module, args.keyword), repeat=args.repeat, min_time=args.min_time)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                dump_results(results, fp)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as fp:
+        baseline = load_results(fp)
+
+    if args.current:
+        with open(args.current, encoding="utf-8") as fp:
+            current = load_results(fp)
+    else:
+        benchmarks = [b for b in load_benchmarks(args.module, args.keyword) if b[0] in baseline]
+        current = run(benchmarks, repeat=args.repeat, min_time=args.min_time, output=None)
+        if args.module or args.keyword:
+            baseline = {name: value for name, value in baseline.items() if name in current}
+
+    lines, regressions = format_comparison(compare_results(baseline, current), threshold=args.threshold)
+    print(f"{'benchmark':<60} {'baseline':>12} {'current':>12}")
+    print("\n".join(lines))
+    print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
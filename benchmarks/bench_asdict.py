@@ -0,0 +1,28 @@
+import json
+from typing import List
+
+from stockholm import Currency, Money, Rate
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", currency=Currency.EUR) for i in range(1000)]
+RATES = [Rate(f"0.{i:04d}") for i in range(1000)]
+KEYS = ("units", "nanos", "currency_code")
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("asdict: per object (1000 x Money.asdict)", lambda: [m.asdict() for m in AMOUNTS]),
+        ("asdict: batch (Money.asdict_many, 1000 values)", lambda: Money.asdict_many(AMOUNTS)),
+        ("asdict: per object, keys=units,nanos,currency_code", lambda: [m.asdict(keys=KEYS) for m in AMOUNTS]),
+        ("asdict: batch, keys=units,nanos,currency_code", lambda: Money.asdict_many(AMOUNTS, keys=KEYS)),
+        ("asdict: per object (1000 x Rate.asdict)", lambda: [r.asdict() for r in RATES]),
+        ("asdict: batch (Rate.asdict_many, 1000 values)", lambda: Rate.asdict_many(RATES)),
+        ("as_json: per object (json.dumps per Money)", lambda: "[" + ", ".join(m.as_json() for m in AMOUNTS) + "]"),
+        ("as_json: json.dumps([asdict() ...])", lambda: json.dumps([m.asdict() for m in AMOUNTS])),
+        ("as_json: batch (Money.as_json_many, 1000 values)", lambda: Money.as_json_many(AMOUNTS)),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
@@ -0,0 +1,28 @@
+import json
+from typing import List
+
+import stockholm.binary
+from stockholm import Currency, Money
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", currency=Currency.EUR) for i in range(10000)]
+PACKED = stockholm.binary.pack_many(AMOUNTS)
+JSON_STRINGS = Money.as_json_many(AMOUNTS)
+PROTOBUF_MESSAGES = [amount.as_protobuf().SerializeToString() for amount in AMOUNTS]
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("binary: pack_many (10000 values)", lambda: stockholm.binary.pack_many(AMOUNTS)),
+        ("binary: unpack_many (10000 records)", lambda: stockholm.binary.unpack_many(PACKED)),
+        ("binary: unpack_many from memoryview", lambda: stockholm.binary.unpack_many(memoryview(PACKED))),
+        ("binary: to_bytes (10000 x Money.to_bytes)", lambda: [m.to_bytes() for m in AMOUNTS]),
+        ("json: as_json_many (10000 values)", lambda: Money.as_json_many(AMOUNTS)),
+        ("json: json.loads + Money() (10000 values)", lambda: [Money(v) for v in json.loads(JSON_STRINGS)]),
+        ("protobuf: from_protobuf_many (10000 serialized)", lambda: Money.from_protobuf_many(PROTOBUF_MESSAGES)),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
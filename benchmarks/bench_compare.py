@@ -0,0 +1,30 @@
+from typing import List
+
+from stockholm import Currency, Money
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003 - 500000}.{i % 100:02d}", currency=Currency.SEK) for i in range(10000)]
+AMOUNTS_WITHOUT_CURRENCY = [Money(m.amount) for m in AMOUNTS]
+INTS = [i * 7919 % 1000003 - 500000 for i in range(10000)]
+STRINGS = [f"{i}.50 SEK" for i in INTS]
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("compare: Money == Money (10000 pairs)", lambda: [a == b for a, b in zip(AMOUNTS, reversed(AMOUNTS))]),
+        ("compare: Money < Money (10000 pairs)", lambda: [a < b for a, b in zip(AMOUNTS, reversed(AMOUNTS))]),
+        (
+            "compare: Money < Money without currency (10000 pairs)",
+            lambda: [a < b for a, b in zip(AMOUNTS, AMOUNTS_WITHOUT_CURRENCY)],
+        ),
+        ("compare: sorted(Money) (10000 values)", lambda: sorted(AMOUNTS)),
+        ("compare: Money == int (10000 pairs)", lambda: [a == b for a, b in zip(AMOUNTS, INTS)]),
+        ("compare: Money < int (10000 pairs)", lambda: [a < b for a, b in zip(AMOUNTS, INTS)]),
+        ("compare: Money == str (10000 pairs)", lambda: [a == b for a, b in zip(AMOUNTS, STRINGS)]),
+        ("compare: Money < str (10000 pairs)", lambda: [a < b for a, b in zip(AMOUNTS, STRINGS)]),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
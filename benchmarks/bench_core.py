@@ -0,0 +1,56 @@
+from decimal import Decimal
+from typing import List
+
+import stockholm.expression
+from stockholm import Currency, Money, Rate, get_currency
+
+from .runner import Benchmark, main
+
+STRINGS = [f"{i * 7919 % 1000003 - 500000}.{i % 100:02d} EUR" for i in range(1000)]
+AMOUNTS = [Money(value) for value in STRINGS]
+OTHER_AMOUNTS = list(reversed(AMOUNTS))
+DECIMALS = [amount.amount for amount in AMOUNTS]
+INTS = [int(amount) for amount in AMOUNTS]
+FLOATS = [float(amount) for amount in AMOUNTS]
+TICKERS = ["EUR", "SEK", "USD", "JPY", "XYZ"] * 200
+INTEREST_RATE = Rate("0.073")
+FEES = Money("12.50", "EUR")
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("core: Money(str) (1000 values)", lambda: [Money(value) for value in STRINGS]),
+        ("core: Money(Decimal, currency) (1000 values)", lambda: [Money(value, Currency.EUR) for value in DECIMALS]),
+        ("core: Money(int) (1000 values)", lambda: [Money(value) for value in INTS]),
+        ("core: Money(float) (1000 values)", lambda: [Money(value) for value in FLOATS]),
+        ("core: Money(Money) (1000 values)", lambda: [Money(value) for value in AMOUNTS]),
+        (
+            "core: Money(units=, nanos=) (1000 values)",
+            lambda: [Money(units=value.units, nanos=value.nanos, currency="EUR") for value in AMOUNTS],
+        ),
+        ("core: Money + Money (1000 pairs)", lambda: [a + b for a, b in zip(AMOUNTS, OTHER_AMOUNTS)]),
+        ("core: Money - Money (1000 pairs)", lambda: [a - b for a, b in zip(AMOUNTS, OTHER_AMOUNTS)]),
+        ("core: Money + str (1000 pairs)", lambda: [a + b for a, b in zip(AMOUNTS, STRINGS)]),
+        ("core: Money * int (1000 values)", lambda: [a * 3 for a in AMOUNTS]),
+        ("core: Money / Decimal (1000 values)", lambda: [a / Decimal("1.25") for a in AMOUNTS]),
+        (
+            "core: loan * (rate / 365) * 30 - fees (1000 values)",
+            lambda: [a * (INTEREST_RATE / 365) * 30 - FEES for a in AMOUNTS],
+        ),
+        (
+            "core: lazy(loan) * (rate / 365) * 30 - fees, evaluate() (1000 values)",
+            lambda: [
+                (stockholm.expression.lazy(a) * (stockholm.expression.lazy(INTEREST_RATE) / 365) * 30 - FEES).evaluate()
+                for a in AMOUNTS
+            ],
+        ),
+        ("core: Money.sum (1000 values)", lambda: Money.sum(AMOUNTS)),
+        ("core: sum() (1000 values)", lambda: sum(AMOUNTS, Money(0, "EUR"))),
+        ("core: str(Money) (1000 values)", lambda: [str(a) for a in AMOUNTS]),
+        ("core: get_currency (1000 lookups)", lambda: [get_currency(ticker) for ticker in TICKERS]),
+        ("core: Currency attribute (1000 lookups)", lambda: [Currency.EUR for _ in TICKERS]),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
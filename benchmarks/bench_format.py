@@ -0,0 +1,21 @@
+from typing import List
+
+from stockholm import Currency, Money
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003 - 500000}.{i % 1000:03d}", currency=Currency.SEK) for i in range(1000)]
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        (
+            f"format: f'{{money:{format_spec}}}' (1000 values)",
+            lambda spec=format_spec: [format(m, spec) for m in AMOUNTS],
+        )
+        for format_spec in ("m", "M", "f", ",.2f", "d", ",d", "c", "s", ">20,.2m", "+012.2f")
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
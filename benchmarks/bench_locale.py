@@ -0,0 +1,41 @@
+from typing import List
+
+import stockholm.locale
+from stockholm import Currency, Money
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003 - 500000}.{i % 1000:03d}", currency=Currency.SEK) for i in range(1000)]
+AMOUNTS_JPY = [Money(f"{i * 7919 % 1000003}.{i % 10}", currency=Currency.JPY) for i in range(1000)]
+TEXT_USD = [f"${i * 7919 % 1000003:,}.{i % 100:02d}" for i in range(1000)]
+TEXT_USD_CODES = [f"{i * 7919 % 1000003:,}.{i % 100:02d} USD" for i in range(1000)]
+TEXT_SV_SE = stockholm.locale.format_many(AMOUNTS, "sv_SE")
+
+
+def benchmarks() -> List[Benchmark]:
+    output: List[Benchmark] = []
+    for locale in ("sv_SE", "en_US", "de_CH", "en_IN", "es_ES"):
+        formatter = stockholm.locale.get_formatter(locale)
+        output += [
+            (
+                f"locale: format_many ({locale}, 1000 values)",
+                lambda formatter=formatter: formatter.format_many(AMOUNTS),
+            ),
+        ]
+    output += [
+        (
+            "locale: format_money (sv_SE, 1000 values)",
+            lambda: [stockholm.locale.format_money(m, "sv_SE") for m in AMOUNTS],
+        ),
+        ("locale: format_many (ja_JP, JPY, 1000 values)", lambda: stockholm.locale.format_many(AMOUNTS_JPY, "ja_JP")),
+        ("format: f'{money:,.2f}' (1000 values, for comparison)", lambda: [f"{m:,.2f}" for m in AMOUNTS]),
+        ("parse: Money('1,234.56 USD') (1000 values, for comparison)", lambda: [Money(v) for v in TEXT_USD_CODES]),
+        ("parse: Money.parse('$1,234.56') (1000 values)", lambda: [Money.parse(v) for v in TEXT_USD]),
+        ("parse: parse_many ('$1,234.56', 1000 values)", lambda: stockholm.locale.parse_many(TEXT_USD)),
+        ("parse: parse_many (sv_SE, 1000 values)", lambda: stockholm.locale.parse_many(TEXT_SV_SE, "sv_SE")),
+    ]
+    return output
+
+
+if __name__ == "__main__":
+    main(benchmarks())
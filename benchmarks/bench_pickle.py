@@ -0,0 +1,35 @@
+import pickle
+from typing import List
+
+from stockholm import Currency, Money, Rate
+
+from .runner import Benchmark, main
+
+COUNT = 10**6
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", currency="SEK") for i in range(COUNT)]
+AMOUNTS_WITH_CURRENCY_OBJECT = [Money(i, currency=Currency.EUR) for i in range(COUNT)]
+RATES = [Rate(f"0.{i:06d}") for i in range(COUNT)]
+
+PICKLED_AMOUNTS = pickle.dumps(AMOUNTS, protocol=pickle.HIGHEST_PROTOCOL)
+PICKLED_AMOUNTS_WITH_CURRENCY_OBJECT = pickle.dumps(AMOUNTS_WITH_CURRENCY_OBJECT, protocol=pickle.HIGHEST_PROTOCOL)
+PICKLED_RATES = pickle.dumps(RATES, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("pickle.dumps: 10^6 x Money (str currency)", lambda: pickle.dumps(AMOUNTS, protocol=5)),
+        ("pickle.loads: 10^6 x Money (str currency)", lambda: pickle.loads(PICKLED_AMOUNTS)),
+        (
+            "pickle.dumps: 10^6 x Money (Currency.EUR)",
+            lambda: pickle.dumps(AMOUNTS_WITH_CURRENCY_OBJECT, protocol=5),
+        ),
+        ("pickle.loads: 10^6 x Money (Currency.EUR)", lambda: pickle.loads(PICKLED_AMOUNTS_WITH_CURRENCY_OBJECT)),
+        ("pickle.dumps: 10^6 x Rate", lambda: pickle.dumps(RATES, protocol=5)),
+        ("pickle.loads: 10^6 x Rate", lambda: pickle.loads(PICKLED_RATES)),
+    ]
+
+
+if __name__ == "__main__":
+    print(f"pickled size of 10^6 x Money: {len(PICKLED_AMOUNTS)} bytes")
+    main(benchmarks())
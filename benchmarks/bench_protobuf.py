@@ -0,0 +1,58 @@
+# Run with both protobuf backends used in the Makefile:
+#   python -m benchmarks.bench_protobuf
+#   PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python python -m benchmarks.bench_protobuf
+from typing import List, Type, cast
+
+from stockholm import Currency, Money
+from stockholm.protobuf import GenericProtobufMessage
+
+from .runner import Benchmark, main
+
+AMOUNTS = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", currency=Currency.EUR) for i in range(1000)]
+MESSAGES = [amount.as_protobuf() for amount in AMOUNTS]
+SERIALIZED = [message.SerializeToString() for message in MESSAGES]
+
+
+def money_list_class() -> Type[GenericProtobufMessage]:
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+    pool = descriptor_pool.Default()
+    try:
+        descriptor = pool.FindMessageTypeByName("stockholm.benchmarks.MoneyList")
+    except KeyError:
+        file_descriptor = descriptor_pb2.FileDescriptorProto(
+            name="stockholm/benchmarks/money_list.proto",
+            package="stockholm.benchmarks",
+            syntax="proto3",
+            dependency=["google/type/money.proto"],
+        )
+        message = file_descriptor.message_type.add(name="MoneyList")
+        message.field.add(name="amounts", number=1, label=3, type=11, type_name=".google.type.Money")
+        pool.Add(file_descriptor)
+        descriptor = pool.FindMessageTypeByName("stockholm.benchmarks.MoneyList")
+
+    if hasattr(message_factory, "GetMessageClass"):
+        return cast(Type[GenericProtobufMessage], message_factory.GetMessageClass(descriptor))
+    return cast(Type[GenericProtobufMessage], message_factory.MessageFactory(pool).GetPrototype(descriptor))
+
+
+MoneyList = money_list_class()
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("protobuf: as_protobuf (1000 x Money.as_protobuf)", lambda: [m.as_protobuf() for m in AMOUNTS]),
+        ("protobuf: as_protobuf_many (1000 values)", lambda: Money.as_protobuf_many(AMOUNTS)),
+        (
+            "protobuf: extend_protobuf (1000 values)",
+            lambda: Money.extend_protobuf(getattr(MoneyList(), "amounts"), AMOUNTS),
+        ),
+        ("protobuf: from_protobuf (1000 x Money.from_protobuf)", lambda: [Money.from_protobuf(m) for m in MESSAGES]),
+        ("protobuf: from_protobuf_many (1000 messages)", lambda: Money.from_protobuf_many(MESSAGES)),
+        ("protobuf: from_protobuf_many (1000 serialized)", lambda: Money.from_protobuf_many(SERIALIZED)),
+        ("protobuf: Money(message) (1000 messages)", lambda: [Money(m) for m in MESSAGES]),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
@@ -0,0 +1,63 @@
+from typing import List
+
+from pydantic import BaseModel, TypeAdapter
+
+from stockholm import Currency, Money
+from stockholm.types import MoneyAsString, MoneyAsUnitsAndNanos
+
+from .runner import Benchmark, main
+
+ADAPTER = TypeAdapter(Money)
+STRINGS = [f"{i * 7919 % 1000003 - 500000}.{i % 100:02d} SEK" for i in range(1000)]
+DICTS = [Money(value).as_dict() for value in STRINGS]
+UNITS_AND_NANOS = [{"units": d["units"], "nanos": d["nanos"], "currency_code": d["currency_code"]} for d in DICTS]
+AMOUNTS = [Money(value) for value in STRINGS]
+
+
+class Ledger(BaseModel):
+    amounts: List[Money]
+
+
+class LedgerAsString(BaseModel):
+    amounts: List[MoneyAsString]
+
+
+class LedgerAsUnitsAndNanos(BaseModel):
+    amounts: List[MoneyAsUnitsAndNanos]
+
+
+LEDGER = Ledger(amounts=AMOUNTS * 10)
+LEDGER_AS_STRING = LedgerAsString(amounts=AMOUNTS * 10)
+LEDGER_AS_UNITS_AND_NANOS = LedgerAsUnitsAndNanos(amounts=AMOUNTS * 10)
+
+
+def create_model() -> None:
+    class Transaction(BaseModel):
+        amount: Money
+        fee: Money
+        currency: Currency
+
+
+def benchmarks() -> List[Benchmark]:
+    validate_python = ADAPTER.validate_python
+    return [
+        ("pydantic: validate_python(str) (1000 values)", lambda: [validate_python(v) for v in STRINGS]),
+        ("pydantic: validate_python(dict) (1000 values)", lambda: [validate_python(v) for v in DICTS]),
+        (
+            "pydantic: validate_python(units/nanos dict) (1000 values)",
+            lambda: [validate_python(v) for v in UNITS_AND_NANOS],
+        ),
+        ("pydantic: validate_python(Money) (1000 values)", lambda: [validate_python(v) for v in AMOUNTS]),
+        ("pydantic: TypeAdapter(Money)", lambda: TypeAdapter(Money)),
+        ("pydantic: model with Money and Currency fields", create_model),
+        ("pydantic: model_dump_json() List[Money] (10000 values)", LEDGER.model_dump_json),
+        ("pydantic: model_dump_json() List[MoneyAsString] (10000 values)", LEDGER_AS_STRING.model_dump_json),
+        (
+            "pydantic: model_dump_json() List[MoneyAsUnitsAndNanos] (10000 values)",
+            LEDGER_AS_UNITS_AND_NANOS.model_dump_json,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
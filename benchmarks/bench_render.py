@@ -0,0 +1,42 @@
+from typing import List
+
+from stockholm import Currency, Money, Number
+
+from .runner import Benchmark, main
+
+CURRENCIES = (Currency.JPY, Currency.SEK, Currency.KWD, Currency.CLF)
+
+VALUES = [f"{i * 7919 % 1000003 - 500000}.{i % 100:02d}" for i in range(1000)]
+FRACTIONAL_VALUES = [f"{value}1234567" for value in VALUES]
+
+
+def benchmarks() -> List[Benchmark]:
+    output: List[Benchmark] = []
+    for currency in CURRENCIES:
+        amounts = [Money(value, currency) for value in VALUES]
+        fractional_amounts = [Money(value, currency) for value in FRACTIONAL_VALUES]
+        label = f"{currency.ticker}, decimal_digits={currency.decimal_digits}"
+        output += [
+            (f"render: str(money) ({label})", lambda amounts=amounts: [str(m) for m in amounts]),
+            (
+                f"render: str(money) with 9 decimals ({label})",
+                lambda amounts=fractional_amounts: [str(m) for m in amounts],
+            ),
+            (
+                f"render: amount_as_string(2, 2) ({label})",
+                lambda amounts=amounts: [m.amount_as_string(2, 2) for m in amounts],
+            ),
+        ]
+
+    amounts = [Money(value, "SEK") for value in VALUES]
+    numbers = [Number(value) for value in VALUES]
+    output += [
+        ("render: str(money) (currency code string)", lambda: [str(m) for m in amounts]),
+        ("render: str(number)", lambda: [str(n) for n in numbers]),
+        ("render: repr(money) (currency code string)", lambda: [repr(m) for m in amounts]),
+    ]
+    return output
+
+
+if __name__ == "__main__":
+    main(benchmarks())
@@ -0,0 +1,53 @@
+from typing import Any, List, Sequence
+
+import stockholm.table
+from stockholm import Currency, Money
+
+from .runner import Benchmark, main
+
+ROWS = [
+    (
+        f"2024-01-{i % 28 + 1:02d}",
+        f"Transaction {i}",
+        Money(f"{i * 7919 % 100003 - 50000}.{i % 100:02d}", currency=Currency.SEK),
+        Money(f"{i * 104729 % 10000019}.{i % 1000:03d}", currency=Currency.SEK),
+    )
+    for i in range(10000)
+]
+HEADERS = ["Date", "Text", "Amount", "Balance"]
+FORMAT_SPECS = [None, None, ",.2m", ",m"]
+
+
+def format_twice(rows: Sequence[Sequence[Any]]) -> List[str]:
+    # reference implementation: compute the column widths first, then format each value again for output
+    widths = [len(header) for header in HEADERS]
+    for row in rows:
+        for index, (value, format_spec) in enumerate(zip(row, FORMAT_SPECS)):
+            widths[index] = max(widths[index], len(format(value, format_spec) if format_spec else str(value)))
+    return [
+        "  ".join(
+            format(value, f">{width}{format_spec}") if format_spec else str(value).ljust(width)
+            for value, format_spec, width in zip(row, FORMAT_SPECS, widths)
+        )
+        for row in rows
+    ]
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        (
+            "table: render_table (10000 rows)",
+            lambda: list(stockholm.table.render_table(ROWS, headers=HEADERS, format_specs=FORMAT_SPECS)),
+        ),
+        (
+            "table: render_table with fixed widths (10000 rows)",
+            lambda: list(
+                stockholm.table.render_table(ROWS, headers=HEADERS, format_specs=FORMAT_SPECS, widths=[10, 20, 16, 20])
+            ),
+        ),
+        ("table: format twice, for comparison (10000 rows)", lambda: format_twice(ROWS)),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+import re
+import sqlite3
+from datetime import date
+from typing import Any, List
+
+import stockholm.bankfile
+import stockholm.csv
+import stockholm.extract
+import stockholm.iso20022
+import stockholm.json
+import stockholm.sqlite
+from stockholm import Money, get_currency
+
+from .fixtures import bankfile_content, camt053_content, json_events, protobuf_messages
+from .runner import Benchmark, main
+
+BANKFILE = bankfile_content(1000)
+BANKFILE_BYTES = BANKFILE.encode() * 10
+JSON_EVENTS = json_events(1000)
+PROTOBUF_MESSAGES = protobuf_messages(1000)
+CAMT053 = camt053_content(1000)
+CSV_CONTENT = "".join(f"{i},{i * 7919 % 1000003}.{i % 100:02d},{('SEK', 'EUR', 'USD')[i % 3]}\n" for i in range(1000))
+PAIN001_PAYMENTS = [
+    stockholm.iso20022.Payment(
+        Money(f"{i * 7919 % 1000003}.{i % 100:02d}", "EUR"),
+        f"Creditor {i}",
+        "DE89370400440532013000",
+        end_to_end_id=str(i),
+    )
+    for i in range(1000)
+]
+SQLITE_VALUES = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", ("SEK", "EUR", "USD")[i % 3]) for i in range(1000)]
+EXTRACT_TEXT = "Invoice 4711: Total: 1,234.50 EUR incl. VAT (SEK 99 shipping), see Overdraft(12.00 USD). " * 100
+EXTRACT_PATTERN = re.compile(r"(?<![\w.,+-])([-+]?[0-9,.]+)[ ]+([A-Z]{3})\b|\b([A-Z]{3})[ ]+([-+]?[0-9,.]+)")
+PAYMENT_AMOUNTS = [block.minor_units for block in stockholm.bankfile.read_blocks(BANKFILE_BYTES)]
+PAYMENTS = [block.amounts for block in stockholm.bankfile.read_blocks(BANKFILE_BYTES)]
+
+
+def parse_bankfile(content: str) -> List[Money]:
+    amounts: List[Money] = []
+    total_amount = Money(0)
+    for line in content.splitlines():
+        if line.startswith("99"):
+            total_amount = Money(line[25:36], from_sub_units=True, currency=get_currency(line[36:39]))
+        elif line.startswith("4"):
+            amounts.append(Money(line[27:36], from_sub_units=True, currency=get_currency(line[50:53])))
+    if Money.sum(amounts) != total_amount:
+        raise ValueError("Sum of amounts does not match the total amount")
+    return amounts
+
+
+def decode_json_events(events: List[str]) -> List[Any]:
+    return [(Money.from_dict(event["amount"]), Money(event["fee"])) for event in map(json.loads, events)]
+
+
+def sqlite_roundtrip_text(values: List[Money]) -> List[Money]:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE payments (amount TEXT)")
+    connection.executemany("INSERT INTO payments VALUES (?)", ((str(value),) for value in values))
+    result = [Money(row[0]) for row in connection.execute("SELECT amount FROM payments")]
+    connection.close()
+    return result
+
+
+def sqlite_roundtrip_nanos(values: List[Money]) -> List[Money]:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE payments (amount INTEGER, currency TEXT)")
+    stockholm.sqlite.insert_many(connection, "payments", values)
+    result = list(stockholm.sqlite.read_money(connection.execute("SELECT amount, currency FROM payments")))
+    connection.close()
+    return result
+
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        ("workload: parse bankfile (1000 transactions)", lambda: parse_bankfile(BANKFILE)),
+        (
+            "workload: stockholm.bankfile.read_blocks (10000 transactions)",
+            lambda: [len(block) for block in stockholm.bankfile.read_blocks(BANKFILE_BYTES)],
+        ),
+        (
+            "workload: stockholm.bankfile.read_transactions (10000 transactions)",
+            lambda: list(stockholm.bankfile.read_transactions(BANKFILE_BYTES)),
+        ),
+        (
+            "workload: stockholm.bankfile.write_blocks, minor units (10000 transactions)",
+            lambda: stockholm.bankfile.write_blocks(io.BytesIO(), [("USD", amounts) for amounts in PAYMENT_AMOUNTS]),
+        ),
+        (
+            "workload: stockholm.bankfile.write_blocks, Money (10000 transactions)",
+            lambda: stockholm.bankfile.write_blocks(io.BytesIO(), [("USD", amounts) for amounts in PAYMENTS]),
+        ),
+        (
+            "workload: stockholm.iso20022.read_camt053 (1000 entries)",
+            lambda: list(stockholm.iso20022.read_camt053(CAMT053)),
+        ),
+        (
+            "workload: stockholm.iso20022.read_camt053_columns (1000 entries)",
+            lambda: list(stockholm.iso20022.read_camt053_columns(CAMT053)),
+        ),
+        (
+            "workload: stockholm.iso20022.write_pain001 (1000 payments)",
+            lambda: stockholm.iso20022.write_pain001(
+                io.BytesIO(), PAIN001_PAYMENTS, "MSG-1", "Debtor", "SE4550000000058398257466", date(2024, 2, 1)
+            ),
+        ),
+        (
+            "workload: CSV, Money(row[1], currency=row[2]) (1000 rows)",
+            lambda: [Money(row[1], currency=row[2]) for row in csv.reader(io.StringIO(CSV_CONTENT))],
+        ),
+        (
+            "workload: CSV, stockholm.csv.read_money (1000 rows)",
+            lambda: list(stockholm.csv.read_money(io.StringIO(CSV_CONTENT), 1, 2)),
+        ),
+        (
+            "workload: CSV, stockholm.csv.read_money_columns (1000 rows)",
+            lambda: list(stockholm.csv.read_money_columns(io.StringIO(CSV_CONTENT), 1, 2)),
+        ),
+        ("workload: sqlite3, str(money) roundtrip (1000 rows)", lambda: sqlite_roundtrip_text(SQLITE_VALUES)),
+        (
+            "workload: sqlite3, stockholm.sqlite.insert_many + read_money (1000 rows)",
+            lambda: sqlite_roundtrip_nanos(SQLITE_VALUES),
+        ),
+        (
+            "workload: extract amounts, re.finditer + Money(...) (300 amounts)",
+            lambda: [Money(m[0]) for m in EXTRACT_PATTERN.finditer(EXTRACT_TEXT)],
+        ),
+        (
+            "workload: extract amounts, stockholm.extract.find_amounts (300 amounts)",
+            lambda: stockholm.extract.find_amounts(EXTRACT_TEXT),
+        ),
+        ("workload: decode JSON events, from_dict (1000 events)", lambda: decode_json_events(JSON_EVENTS)),
+        (
+            "workload: decode JSON events, stockholm.json (1000 events)",
+            lambda: [stockholm.json.loads(event) for event in JSON_EVENTS],
+        ),
+        ("workload: Money.from_protobuf (1000 messages)", lambda: [Money.from_protobuf(m) for m in PROTOBUF_MESSAGES]),
+        ("workload: Money(bytes) (1000 messages)", lambda: [Money(m) for m in PROTOBUF_MESSAGES]),
+    ]
+
+
+if __name__ == "__main__":
+    main(benchmarks())
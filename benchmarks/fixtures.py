@@ -0,0 +1,88 @@
+import json
+from typing import Iterator, List
+
+from stockholm import Money
+
+# Fixed-width bank file in the format parsed in tests/examples/bankfile_test.py. Amounts are given in sub units at
+# [27:36] and the currency code at [50:53] of each transaction line, the trailer holds the total and the line count.
+BANKFILE_HEADER = "000000000000001     388461894717 OLDSCHOOLFINTECHSOLUTIONS004711{count:06d}"
+BANKFILE_TRANSACTION = "4718468277{index:02d}   9173689 9999{amount:09d}000272947     {currency}  - 3336282671946"
+BANKFILE_TRAILER = "990000000000001X{count:06d}993{total:011d}{currency}                            END"
+
+
+def bankfile_content(count: int = 1000, currency: str = "USD") -> str:
+    amounts = [(i * 7919 % 1000003) * 10 + i % 10 for i in range(count)]
+    lines = [BANKFILE_HEADER.format(count=count)]
+    lines += [
+        BANKFILE_TRANSACTION.format(index=i % 100, amount=amount, currency=currency) for i, amount in enumerate(amounts)
+    ]
+    lines.append(BANKFILE_TRAILER.format(count=count, total=sum(amounts), currency=currency))
+    return "\n".join(lines) + "\n"
+
+
+def json_events(count: int = 1000) -> List[str]:
+    currencies = ("EUR", "SEK", "USD", "JPY")
+    return [
+        json.dumps(
+            {
+                "id": f"evt_{i:08d}",
+                "type": "payment.captured",
+                "amount": Money(f"{i * 7919 % 1000003}.{i % 100:02d}", currencies[i % 4]).asdict(),
+                "fee": f"{i % 500}.{i % 10}5 {currencies[i % 4]}",
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def protobuf_messages(count: int = 1000) -> List[bytes]:
+    currencies = ("EUR", "SEK", "USD", "JPY")
+    return [
+        Money(f"{i * 7919 % 1000003}.{i % 1000:03d}", currencies[i % 4]).as_protobuf().SerializeToString()
+        for i in range(count)
+    ]
+
+
+CAMT053_NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"
+CAMT053_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="{namespace}"><BkToCstmrStmt>'
+    "<GrpHdr><MsgId>MSG-0001</MsgId><CreDtTm>2024-01-31T23:59:59</CreDtTm></GrpHdr>\n"
+)
+CAMT053_STATEMENT = (
+    "<Stmt><Id>STMT-{index:04d}</Id><CreDtTm>2024-01-31T23:59:59</CreDtTm>"
+    "<Acct><Id><IBAN>SE4550000000058398257466</IBAN></Id><Ccy>{currency}</Ccy></Acct>\n"
+)
+CAMT053_ENTRY = (
+    '<Ntry><NtryRef>{index}</NtryRef><Amt Ccy="{currency}">{amount}</Amt><CdtDbtInd>{indicator}</CdtDbtInd>'
+    "<Sts>BOOK</Sts><BookgDt><Dt>2024-01-{day:02d}</Dt></BookgDt><ValDt><Dt>2024-01-{day:02d}</Dt></ValDt>"
+    "<AcctSvcrRef>REF{index:010d}</AcctSvcrRef><BkTxCd><Prtry><Cd>PMNT</Cd></Prtry></BkTxCd>"
+    "<NtryDtls><TxDtls><Refs><EndToEndId>E2E-{index}</EndToEndId></Refs>"
+    "<RmtInf><Ustrd>Invoice {index}</Ustrd></RmtInf></TxDtls></NtryDtls></Ntry>\n"
+)
+CAMT053_FOOTER = "</BkToCstmrStmt></Document>\n"
+
+
+def camt053_chunks(
+    count: int = 1000, statements: int = 1, currency: str = "EUR", namespace: str = CAMT053_NAMESPACE
+) -> Iterator[bytes]:
+    # camt.053 bank statement with `count` entries in each statement, generated in chunks to allow writing large files
+    yield CAMT053_HEADER.format(namespace=namespace).encode()
+    for statement in range(1, statements + 1):
+        yield CAMT053_STATEMENT.format(index=statement, currency=currency).encode()
+        for start in range(0, count, 1000):
+            yield "".join(
+                CAMT053_ENTRY.format(
+                    index=i,
+                    currency=currency,
+                    amount=f"{i * 7919 % 1000003}.{i % 100:02d}",
+                    indicator="DBIT" if i % 3 == 0 else "CRDT",
+                    day=i % 28 + 1,
+                )
+                for i in range(start, min(start + 1000, count))
+            ).encode()
+        yield b"</Stmt>\n"
+    yield CAMT053_FOOTER.encode()
+
+
+def camt053_content(count: int = 1000, statements: int = 1, currency: str = "EUR") -> bytes:
+    return b"".join(camt053_chunks(count, statements=statements, currency=currency))
@@ -0,0 +1,55 @@
+import gc
+import sys
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, List, Tuple
+
+from stockholm import BaseCurrency, Currency, Money, Number, Rate, get_currency
+
+COUNT = 20_000
+
+MemoryCase = Tuple[str, Callable[[int], Any]]
+
+
+def measure_memory(factory: Callable[[int], Any], count: int = COUNT) -> Tuple[float, int]:
+    # returns the traced bytes per created value (including the values it references) and the size of a single instance
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        values = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    list_size = sys.getsizeof(values)
+    return (after - before - list_size) / count, sys.getsizeof(values[0])
+
+
+def cases() -> List[MemoryCase]:
+    eur = Currency.EUR
+    return [
+        ("Money, str currency", lambda i: Money(f"{i}.{i % 100:02d}", currency="SEK")),
+        ("Money, currency object", lambda i: Money(f"{i}.{i % 100:02d}", currency=eur)),
+        ("Money, without currency", lambda i: Money(i)),
+        ("Money, zero", lambda i: Money(0, currency="SEK")),
+        ("Money, from units and nanos", lambda i: Money._from_units_and_nanos(i, 500000000, "SEK")),
+        ("Money, Money + Money", lambda i: Money(i, currency="SEK") + Money("0.50", currency="SEK")),
+        ("Number", lambda i: Number(f"{i}.{i % 100:02d}")),
+        ("Rate", lambda i: Rate(f"0.{i:06d}")),
+        ("Decimal (reference)", lambda i: Decimal(f"{i}.{i % 100:02d}")),
+        ("BaseCurrency(...)", lambda i: BaseCurrency(f"X{i:05d}")),
+        ("get_currency(...), unknown ticker", lambda i: get_currency(f"X{i:05d}")),
+    ]
+
+
+def main(count: int = COUNT) -> None:
+    print(f"{'value':<40} {'bytes/value':>12} {'sys.getsizeof':>14} {'__dict__':>9}")
+    for name, factory in cases():
+        traced, size = measure_memory(factory, count)
+        has_dict = "yes" if hasattr(factory(1), "__dict__") else "no"
+        print(f"{name:<40} {traced:>12.1f} {size:>14} {has_dict:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# Runs the benchmark suite through pytest-benchmark, for example:
+#   pytest benchmarks/pytest_benchmarks.py --benchmark-autosave
+#   pytest benchmarks/pytest_benchmarks.py --benchmark-compare --benchmark-compare-fail=min:10%
+# The file isn't named test_*.py so that it's not collected in regular test runs.
+from typing import Any, Callable
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from .runner import load_benchmarks  # noqa: E402
+
+BENCHMARKS = load_benchmarks()
+
+
+@pytest.mark.parametrize("func", [func for _, func in BENCHMARKS], ids=[name for name, _ in BENCHMARKS])
+def test_benchmark(benchmark: Any, func: Callable[[], Any]) -> None:
+    benchmark(func)
@@ -0,0 +1,130 @@
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+import timeit
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Benchmark = Tuple[str, Callable[[], Any]]
+Comparison = Tuple[str, Optional[float], Optional[float], Optional[float]]
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> float:
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed] + timer.repeat(repeat=repeat - 1, number=number)
+    return min(timings) / number
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 5,
+    output: Optional[Any] = sys.stdout,
+    min_time: float = 0.2,
+) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, func in benchmarks:
+        results[name] = measure(func, repeat=repeat, min_time=min_time)
+        if output is not None:
+            output.write(f"{name:<60} {format_duration(results[name]):>12}\n")
+            output.flush()
+    return results
+
+
+def format_duration(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(benchmarks: List[Benchmark]) -> None:
+    run(benchmarks)
+
+
+def module_names() -> List[str]:
+    package_path = [str(p) for p in getattr(sys.modules[__package__], "__path__")]
+    return sorted(name for _, name, _ in pkgutil.iter_modules(package_path) if name.startswith("bench_"))
+
+
+def load_benchmarks(
+    modules: Optional[Sequence[str]] = None, keyword: Optional[str] = None, errors: Optional[IO[str]] = sys.stderr
+) -> List[Benchmark]:
+    # benchmark modules depending on optional packages (pydantic, protobuf) are skipped if the package is missing
+    benchmarks: List[Benchmark] = []
+    for name in module_names():
+        if modules and name not in modules and name[len("bench_") :] not in modules:
+            continue
+        try:
+            module = importlib.import_module(f"{__package__}.{name}")
+        except ImportError as exc:
+            if errors is not None:
+                errors.write(f"Skipping {name}: {exc}\n")
+            continue
+        benchmarks += [(n, f) for n, f in module.benchmarks() if not keyword or keyword.lower() in n.lower()]
+    return benchmarks
+
+
+def environment() -> Dict[str, str]:
+    from stockholm import __version__
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "stockholm": __version__,
+    }
+
+
+def dump_results(results: Dict[str, float], fp: IO[str]) -> None:
+    json.dump(
+        {"version": RESULTS_FORMAT_VERSION, "environment": environment(), "results": dict(sorted(results.items()))},
+        fp,
+        indent=2,
+        ensure_ascii=False,
+    )
+    fp.write("\n")
+
+
+def load_results(fp: IO[str]) -> Dict[str, float]:
+    data = json.load(fp)
+    if not isinstance(data, dict) or data.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError("Unsupported benchmark results file")
+    return {str(name): float(value) for name, value in data["results"].items()}
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float]) -> List[Comparison]:
+    output: List[Comparison] = []
+    for name in sorted(baseline.keys() | current.keys()):
+        baseline_value = baseline.get(name)
+        current_value = current.get(name)
+        ratio = current_value / baseline_value if baseline_value and current_value is not None else None
+        output.append((name, baseline_value, current_value, ratio))
+    return output
+
+
+def format_comparison(comparison: Iterable[Comparison], threshold: float = 0.1) -> Tuple[List[str], int]:
+    lines: List[str] = []
+    regressions = 0
+    for name, baseline_value, current_value, ratio in comparison:
+        baseline_str = format_duration(baseline_value) if baseline_value is not None else "-"
+        current_str = format_duration(current_value) if current_value is not None else "-"
+        status = ""
+        if ratio is not None:
+            status = f"{ratio:.2f}x"
+            if ratio > 1 + threshold:
+                status = f"{status}  REGRESSION"
+                regressions += 1
+            elif ratio < 1 / (1 + threshold):
+                status = f"{status}  faster"
+        lines.append(f"{name:<60} {baseline_str:>12} {current_str:>12}  {status}".rstrip())
+    return lines, regressions
@@ -0,0 +1,38 @@
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from stockholm.iso20022 import read_camt053
+
+from .fixtures import camt053_chunks
+
+ENTRIES_PER_STATEMENT = 200_000
+
+
+def main(statements: int = 4) -> None:
+    # writes a synthetic camt.053 statement file (about 80 MB per statement) and streams it, reporting the
+    # throughput and the peak memory usage of the process before and after reading the file
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            for chunk in camt053_chunks(ENTRIES_PER_STATEMENT, statements=statements):
+                fp.write(chunk)
+
+        max_rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        count = sum(1 for _ in read_camt053(path))
+        elapsed = time.perf_counter() - started
+        max_rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        print(f"file size:        {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"entries:          {count} ({count / elapsed:.0f} entries/s)")
+        print(f"max RSS (before): {max_rss_before / 1e3:.1f} MB")
+        print(f"max RSS (after):  {max_rss_after / 1e3:.1f} MB")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
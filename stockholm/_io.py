@@ -0,0 +1,21 @@
+from itertools import islice
+from typing import IO, Iterable, List
+
+__all__ = [
+    "write_lines",
+]
+
+
+def write_lines(fp: IO[str], lines: Iterable[str], chunk_size: int = 1000) -> int:
+    # writes each line followed by a newline, buffered into chunks of 'chunk_size' lines per write to the file
+    count = 0
+    iterator = iter(lines)
+
+    while True:
+        chunk: List[str] = [f"{line}\n" for line in islice(iterator, chunk_size)]
+        if not chunk:
+            break
+        fp.writelines(chunk)
+        count += len(chunk)
+
+    return count
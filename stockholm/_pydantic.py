@@ -0,0 +1,16 @@
+from typing import Any, Callable, Dict
+
+__all__ = [
+    "core_schema",
+]
+
+_core_schemas: Dict[type, Dict[str, Any]] = {}
+
+
+def core_schema(cls: type, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    # pydantic core schemas are built once per class and cached – a copy is returned, since pydantic may update the
+    # returned schema in place
+    schema = _core_schemas.get(cls)
+    if schema is None:
+        schema = _core_schemas[cls] = build()
+    return {**schema}
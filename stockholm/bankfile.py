@@ -0,0 +1,611 @@
+import io
+import itertools
+import mmap
+import os
+import tempfile
+from decimal import Decimal
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import BankFileError
+from .money import Money, MoneyModel
+
+__all__ = [
+    "Field",
+    "RecordLayout",
+    "BankFileLayout",
+    "BankFileBlock",
+    "DEFAULT_LAYOUT",
+    "read_blocks",
+    "read_transactions",
+    "BankFileWriter",
+    "write_blocks",
+]
+
+FIELD_KINDS = ("str", "int", "amount", "currency")
+
+Amount = Union[int, MoneyModel]
+CurrencyInput = Optional[Union[BaseCurrencyType, str]]
+Source = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, mmap.mmap, IO[bytes], Iterable[bytes]]
+
+
+class Field:
+    __slots__ = ("name", "start", "length", "kind")
+
+    def __init__(self, name: str, start: int, length: int, kind: str = "str") -> None:
+        if kind not in FIELD_KINDS:
+            raise ValueError(f"Invalid field kind: {kind!r}")
+        if start < 0 or length < 1:
+            raise ValueError(f"Invalid position for field {name!r}")
+        self.name = name
+        self.start = start
+        self.length = length
+        self.kind = kind
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r}, {self.start}, {self.length}, {self.kind!r})"
+
+
+class RecordLayout:
+    __slots__ = ("prefix", "fields", "length")
+
+    def __init__(self, prefix: str, fields: Sequence[Field], length: Optional[int] = None) -> None:
+        if not prefix:
+            raise ValueError("Records must have a prefix")
+        self.prefix = prefix
+        self.fields = tuple(fields)
+        self.length = length
+
+        for field in self.fields:
+            if field.start < len(prefix):
+                raise ValueError(f"Field {field.name!r} overlaps the record prefix")
+            if length is not None and field.end > length:
+                raise ValueError(f"Field {field.name!r} exceeds the record length")
+
+    def field(self, name: str) -> Optional[Field]:
+        for field in self.fields:
+            if field.name == name:
+                return field
+        return None
+
+    def first_field(self, kind: str) -> Optional[Field]:
+        for field in self.fields:
+            if field.kind == kind:
+                return field
+        return None
+
+    @property
+    def record_length(self) -> int:
+        if self.length is not None:
+            return self.length
+        return max([len(self.prefix)] + [field.end for field in self.fields])
+
+    def parse(self, line: bytes) -> Dict[str, Any]:
+        output: Dict[str, Any] = {}
+        for field in self.fields:
+            value = line[field.start : field.end]
+            if field.kind == "int" or field.kind == "amount":
+                output[field.name] = int(value)
+            elif field.kind == "currency":
+                output[field.name] = _currency(value)
+            else:
+                output[field.name] = value.decode("latin-1").strip()
+        return output
+
+    def render(self, values: Dict[str, Any]) -> bytes:
+        output = bytearray(self.prefix.encode("latin-1").ljust(self.record_length))
+        for field in self.fields:
+            output[field.start : field.end] = _render_field(field, values.get(field.name))
+        return bytes(output)
+
+
+class BankFileLayout:
+    __slots__ = ("header", "transaction", "trailer")
+
+    def __init__(self, header: RecordLayout, transaction: RecordLayout, trailer: RecordLayout) -> None:
+        if transaction.first_field("amount") is None:
+            raise ValueError("The transaction record must have an 'amount' field")
+        prefixes = (header.prefix, transaction.prefix, trailer.prefix)
+        if any(a != b and a.startswith(b) for a in prefixes for b in prefixes) or len(set(prefixes)) != 3:
+            raise ValueError("Record prefixes must be distinct and not prefixes of each other")
+        self.header = header
+        self.transaction = transaction
+        self.trailer = trailer
+
+
+# The layout of the bank files in tests/examples/bankfile_test.py. Amounts are given in minor units.
+DEFAULT_LAYOUT = BankFileLayout(
+    header=RecordLayout("00", [Field("transaction_count", 64, 6, "int")], length=70),
+    transaction=RecordLayout("4", [Field("amount", 27, 9, "amount"), Field("currency", 50, 3, "currency")], length=70),
+    trailer=RecordLayout(
+        "99",
+        [
+            Field("transaction_count", 16, 6, "int"),
+            Field("total_amount", 25, 11, "amount"),
+            Field("currency", 36, 3, "currency"),
+        ],
+        length=70,
+    ),
+)
+
+
+@lru_cache(maxsize=1024)
+def _currency(value: bytes) -> Optional[BaseCurrencyType]:
+    ticker = value.decode("ascii", "replace").strip()
+    if not ticker:
+        return None
+    if not ticker.isalpha():
+        raise ValueError(f"Invalid currency code: {ticker!r}")
+    return get_currency(ticker.upper())
+
+
+@lru_cache(maxsize=None)
+def _scale(decimal_digits: int) -> Decimal:
+    return Decimal(1).scaleb(-decimal_digits)
+
+
+def _render_field(field: Field, value: Any) -> bytes:
+    if field.kind == "int" or field.kind == "amount":
+        if value is None:
+            return b"0" * field.length
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"Value for field {field.name!r} must be an integer")
+        if value < 0:
+            raise ValueError(f"Value for field {field.name!r} cannot be negative")
+        output = b"%0*d" % (field.length, value)
+    elif value is None:
+        return b" " * field.length
+    else:
+        output = str(value).encode("ascii" if field.kind == "currency" else "latin-1")
+    if len(output) > field.length:
+        raise ValueError(f"Value for field {field.name!r} exceeds the field length")
+    return output.ljust(field.length)
+
+
+def _money(minor_units: int, currency: Optional[BaseCurrencyType]) -> Money:
+    return Money._create(
+        Decimal(minor_units) * _scale(currency.decimal_digits if currency is not None else 2), currency
+    )
+
+
+class BankFileBlock:
+    __slots__ = ("index", "start_line", "end_line", "header", "trailer", "currency", "minor_units", "error")
+
+    def __init__(self, index: int, start_line: int, header: Dict[str, Any]) -> None:
+        self.index = index
+        self.start_line = start_line
+        self.end_line = start_line
+        self.header = header
+        self.trailer: Dict[str, Any] = {}
+        self.currency: Optional[BaseCurrencyType] = None
+        self.minor_units: List[int] = []
+        self.error: Optional[BankFileError] = None
+
+    def __repr__(self) -> str:
+        return f"<stockholm.bankfile.BankFileBlock: {self.index} ({len(self.minor_units)} transactions)>"
+
+    def __len__(self) -> int:
+        return len(self.minor_units)
+
+    def __iter__(self) -> Iterator[Money]:
+        currency = self.currency
+        scale = _scale(currency.decimal_digits if currency is not None else 2)
+        create = Money._create
+        return (create(Decimal(value) * scale, currency) for value in self.minor_units)
+
+    @property
+    def amounts(self) -> List[Money]:
+        return list(self)
+
+    @property
+    def total(self) -> Money:
+        return _money(sum(self.minor_units), self.currency)
+
+
+def _lines(source: Source) -> Iterator[bytes]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=1 << 20) as fp:
+            yield from fp
+    elif isinstance(source, mmap.mmap):
+        yield from iter(source.readline, b"")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield from io.BytesIO(source)
+    else:
+        lines: Iterable[Union[bytes, str]] = source
+        for line in lines:
+            if isinstance(line, str):
+                raise TypeError("Bank files must be read in binary mode")
+            yield line
+
+
+def read_blocks(
+    source: Source, layout: BankFileLayout = DEFAULT_LAYOUT, errors: str = "raise"
+) -> Iterator[BankFileBlock]:
+    if errors not in ("raise", "collect"):
+        raise ValueError(f"Invalid value for 'errors': {errors!r}")
+
+    header_layout = layout.header
+    trailer_layout = layout.trailer
+    header_prefix = header_layout.prefix.encode("ascii")
+    transaction_prefix = layout.transaction.prefix.encode("ascii")
+    trailer_prefix = trailer_layout.prefix.encode("ascii")
+
+    amount_field = layout.transaction.first_field("amount")
+    currency_field = layout.transaction.first_field("currency")
+    if amount_field is None:
+        raise BankFileError("The transaction record must have an 'amount' field")
+    amount_start, amount_end = amount_field.start, amount_field.end
+    currency_start = currency_field.start if currency_field is not None else 0
+    currency_end = currency_field.end if currency_field is not None else 0
+
+    block: Optional[BankFileBlock] = None
+    block_index = 0
+    block_currency = b""
+    minor_units: List[int] = []
+    append = minor_units.append
+
+    def fail(message: str, line_number: int) -> Optional[BankFileBlock]:
+        error = BankFileError(message, block=block.index if block is not None else None, line_number=line_number)
+        if errors == "raise" or block is None:
+            raise error
+        if block.error is None:
+            block.error = error
+        return block
+
+    line_number = 0
+    for line_number, line in enumerate(_lines(source), 1):
+        if line.startswith(transaction_prefix):
+            if block is None:
+                fail("Transaction record outside of a block", line_number)
+                continue
+            if block.error is not None:
+                continue
+            try:
+                append(int(line[amount_start:amount_end]))
+            except ValueError:
+                fail("Invalid amount in transaction record", line_number)
+                continue
+            if currency_end and line[currency_start:currency_end] != block_currency:
+                if block_currency:
+                    fail("Multiple currency codes within the same block", line_number)
+                else:
+                    block_currency = line[currency_start:currency_end]
+        elif line.startswith(header_prefix):
+            if block is not None:
+                yield fail("Missing trailer record", line_number - 1) or block
+            block_index += 1
+            block = BankFileBlock(block_index, line_number, {})
+            block_currency = b""
+            minor_units = block.minor_units
+            append = minor_units.append
+            try:
+                block.header = header_layout.parse(line)
+            except ValueError:
+                fail("Invalid header record", line_number)
+        elif line.startswith(trailer_prefix):
+            if block is None:
+                fail("Trailer record outside of a block", line_number)
+                continue
+            block.end_line = line_number
+            if block.error is None:
+                _validate_block(block, line, trailer_layout, block_currency, line_number, fail)
+            yield block
+            block = None
+        # records of other types, for example additional information records, are skipped
+
+    if block is not None:
+        block.end_line = line_number
+        yield fail("Missing trailer record", line_number) or block
+
+
+def _validate_block(
+    block: BankFileBlock, line: bytes, trailer_layout: RecordLayout, block_currency: bytes, line_number: int, fail: Any
+) -> None:
+    try:
+        block.trailer = trailer_layout.parse(line)
+        block.currency = _currency(block_currency) if block_currency else None
+    except ValueError:
+        fail("Invalid trailer record", line_number)
+        return
+
+    trailer = block.trailer
+    count = len(block.minor_units)
+    for name, record in (("header", block.header), ("trailer", trailer)):
+        if "transaction_count" in record and record["transaction_count"] != count:
+            fail(
+                f"Transaction count does not match [{name}: {record['transaction_count']}, transactions: {count}]",
+                line_number,
+            )
+            return
+
+    total_field = trailer_layout.first_field("amount")
+    currency_field = trailer_layout.first_field("currency")
+    if currency_field is not None and block.minor_units:
+        trailer_currency = trailer[currency_field.name]
+        if block_currency and trailer_currency != block.currency:
+            fail(
+                f"Currency codes does not match [trailer: {trailer_currency}, transactions: {block.currency}]",
+                line_number,
+            )
+            return
+        block.currency = trailer_currency
+    elif currency_field is not None:
+        block.currency = trailer[currency_field.name]
+
+    if total_field is not None:
+        total = sum(block.minor_units)
+        if trailer[total_field.name] != total:
+            fail(
+                f"Sums of amounts differ [trailer: {trailer[total_field.name]}, transactions: {total}]",
+                line_number,
+            )
+
+
+def read_transactions(source: Source, layout: BankFileLayout = DEFAULT_LAYOUT) -> Iterator[Money]:
+    for block in read_blocks(source, layout=layout):
+        yield from block
+
+
+class BankFileWriter:
+    def __init__(
+        self, fp: IO[bytes], layout: BankFileLayout = DEFAULT_LAYOUT, newline: bytes = b"\n", buffer_size: int = 1 << 20
+    ) -> None:
+        self.fp = fp
+        self.layout = layout
+        self.newline = newline
+        self.buffer_size = buffer_size
+        self.block_count = 0
+        self.line_count = 0
+
+        amount_field = layout.transaction.first_field("amount")
+        if amount_field is None:
+            raise BankFileError("The transaction record must have an 'amount' field")
+        self._amount_field = amount_field
+        self._amount_format = b"%%0%dd" % amount_field.length
+        self._amount_limit = 10**amount_field.length
+        self._total_field = layout.trailer.first_field("amount")
+
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._seekable = bool(getattr(fp, "seekable", None) and fp.seekable())
+        self._output = fp
+        self._in_block = False
+        self._header: Dict[str, Any] = {}
+        self._header_offset: Optional[int] = None
+        self._header_index: Optional[int] = None
+        self._currency: Optional[BaseCurrencyType] = None
+        self._decimal_digits = 2
+        self._head = b""
+        self._tail = b""
+        self._count = 0
+        self._total = 0
+
+    def __enter__(self) -> "BankFileWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.flush()
+
+    def _error(self, message: str, line_number: int) -> BankFileError:
+        return BankFileError(message, block=self.block_count if self._in_block else None, line_number=line_number)
+
+    def _values(self, record: RecordLayout, values: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        output: Dict[str, Any] = {field.name: self._currency for field in record.fields if field.kind == "currency"}
+        if record.field("transaction_count") is not None:
+            output["transaction_count"] = self._count
+        output.update(values or {})
+        return output
+
+    def _render(self, record: RecordLayout, values: Dict[str, Any], line_number: int) -> bytes:
+        try:
+            return record.render(values) + self.newline
+        except ValueError as exc:
+            raise self._error(str(exc), line_number) from None
+
+    def _minor_units(self, amount: Any, line_number: int) -> int:
+        if not isinstance(amount, MoneyModel):
+            raise self._error(f"Invalid amount: {amount!r}", line_number)
+        currency_code = amount.currency_code
+        if currency_code and self._currency is None:
+            raise self._error(f"Amount with currency in a block without currency: {amount}", line_number)
+        if currency_code and self._currency is not None and currency_code != self._currency.ticker:
+            raise self._error(
+                f"Currency codes does not match [block: {self._currency.ticker}, amount: {currency_code}]", line_number
+            )
+        value = amount._amount.scaleb(self._decimal_digits)
+        if value != value.to_integral_value():
+            raise self._error(f"Amount cannot be represented in minor units: {amount}", line_number)
+        return int(value)
+
+    def begin_block(self, currency: CurrencyInput = None, header: Optional[Dict[str, Any]] = None) -> None:
+        if self._in_block:
+            raise self._error("Missing trailer record", self.line_count + 1)
+
+        # if the header should contain the transaction count and it isn't given, a placeholder header is written and
+        # later replaced (in the buffer or by seeking back in the file) once the block ends. blocks written to a file
+        # that isn't seekable are spooled to a temporary file until the header is known.
+        self._header = dict(header or {})
+        self._header_offset = None
+        placeholder = (
+            self.layout.header.field("transaction_count") is not None and "transaction_count" not in self._header
+        )
+        if placeholder and not self._seekable:
+            self._write_chunks()
+            self._output = cast(IO[bytes], tempfile.TemporaryFile())
+
+        self.block_count += 1
+        self.line_count += 1
+        self._in_block = True
+        self._currency = get_currency(currency) if isinstance(currency, str) else currency
+        self._decimal_digits = self._currency.decimal_digits if self._currency is not None else 2
+        self._count = 0
+        self._total = 0
+
+        template = self._render(self.layout.transaction, self._values(self.layout.transaction, None), self.line_count)
+        self._head = template[: self._amount_field.start]
+        self._tail = template[self._amount_field.end :]
+
+        if placeholder:
+            self._header_offset = self._output.tell() + self._size
+            self._header_index = len(self._chunks)
+        self._append(self._render(self.layout.header, self._values(self.layout.header, header), self.line_count))
+
+    def write_transaction(self, amount: Amount, fields: Optional[Dict[str, Any]] = None) -> None:
+        if not fields:
+            self.write_transactions((amount,))
+            return
+
+        if not self._in_block:
+            raise self._error("Transaction record outside of a block", self.line_count + 1)
+        line_number = self.line_count + 1
+        if type(amount) is not int:
+            amount = self._minor_units(amount, line_number)
+        record = self.layout.transaction
+        line = self._render(record, self._values(record, {**fields, self._amount_field.name: amount}), line_number)
+        self._count += 1
+        self._total += amount
+        self.line_count = line_number
+        self._append(line)
+
+    def write_transactions(self, amounts: Iterable[Amount]) -> None:
+        if not self._in_block:
+            raise self._error("Transaction record outside of a block", self.line_count + 1)
+
+        head, tail = self._head, self._tail
+        amount_format, limit = self._amount_format, self._amount_limit
+        lines = self._chunks
+        iterator = iter(amounts)
+
+        # amounts are written in batches to keep the buffer size in check, all amounts in a batch are validated
+        # before they're added to the buffer
+        for batch in iter(lambda: list(itertools.islice(iterator, 4096)), []):
+            output: List[bytes] = []
+            total = 0
+            for amount in batch:
+                if type(amount) is not int:
+                    amount = self._minor_units(amount, self.line_count + len(output) + 1)
+                if not 0 <= amount < limit:
+                    raise self._error(
+                        f"Amount does not fit in the {self._amount_field.name!r} field: {amount}",
+                        self.line_count + len(output) + 1,
+                    )
+                output.append(head + amount_format % amount + tail)
+                total += amount
+
+            lines += output
+            self._count += len(output)
+            self._total += total
+            self.line_count += len(output)
+            self._size += len(output) * (len(head) + len(tail) + self._amount_field.length)
+            if self._size >= self.buffer_size:
+                self._write_chunks()
+
+    def end_block(self, trailer: Optional[Dict[str, Any]] = None) -> None:
+        if not self._in_block:
+            raise self._error("Trailer record outside of a block", self.line_count + 1)
+
+        values = self._values(self.layout.trailer, None)
+        if self._total_field is not None:
+            values[self._total_field.name] = self._total
+        values.update(trailer or {})
+        line = self._render(self.layout.trailer, values, self.line_count + 1)
+
+        header_line_number = self.line_count - self._count
+        if self._header.get("transaction_count", self._count) != self._count:
+            raise self._error(
+                f"Transaction count does not match [header: {self._header['transaction_count']}, "
+                f"transactions: {self._count}]",
+                header_line_number,
+            )
+        if self._header_offset is not None:
+            header = self._render(
+                self.layout.header, self._values(self.layout.header, self._header), header_line_number
+            )
+            if self._header_index is not None:
+                self._chunks[self._header_index] = header
+            else:
+                position = self._output.tell()
+                self._output.seek(self._header_offset)
+                self._output.write(header)
+                self._output.seek(position)
+            self._header_offset = None
+
+        self.line_count += 1
+        self._in_block = False
+        self._append(line)
+        if self._output is not self.fp:
+            self._write_spool()
+        elif self._size >= self.buffer_size:
+            self._write_chunks()
+
+    def write_block(
+        self,
+        amounts: Iterable[Amount],
+        currency: CurrencyInput = None,
+        header: Optional[Dict[str, Any]] = None,
+        trailer: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if currency is None:
+            # the currency of a block given without currency is the currency of its first amount
+            iterator = iter(amounts)
+            first_amount = next(iterator, None)
+            if isinstance(first_amount, MoneyModel):
+                currency = first_amount.currency_code
+            amounts = itertools.chain(() if first_amount is None else (first_amount,), iterator)
+
+        self.begin_block(currency, header=header)
+        self.write_transactions(amounts)
+        self.end_block(trailer=trailer)
+
+    def _append(self, data: bytes) -> None:
+        self._chunks.append(data)
+        self._size += len(data)
+
+    def _write_chunks(self) -> None:
+        if self._chunks:
+            self._output.write(b"".join(self._chunks))
+            self._chunks.clear()
+            self._size = 0
+            self._header_index = None
+
+    def _write_spool(self) -> None:
+        self._write_chunks()
+        spool = self._output
+        self._output = self.fp
+        spool.seek(0)
+        for data in iter(lambda: spool.read(self.buffer_size), b""):
+            self.fp.write(data)
+        spool.close()
+
+    def flush(self) -> None:
+        self._write_chunks()
+        self.fp.flush()
+
+    def close(self) -> None:
+        if self._in_block:
+            raise self._error("Missing trailer record", self.line_count + 1)
+        self.flush()
+
+
+def write_blocks(
+    destination: Union[str, "os.PathLike[str]", IO[bytes]],
+    blocks: Iterable[Tuple[CurrencyInput, Iterable[Amount]]],
+    layout: BankFileLayout = DEFAULT_LAYOUT,
+    newline: bytes = b"\n",
+) -> int:
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as fp:
+            return write_blocks(fp, blocks, layout=layout, newline=newline)
+
+    with BankFileWriter(destination, layout=layout, newline=newline) as writer:
+        for currency, amounts in blocks:
+            writer.write_block(amounts, currency)
+    return writer.line_count
@@ -0,0 +1,90 @@
+import mmap
+import struct
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional, Type, Union
+
+from .exceptions import ConversionError
+from .money import Money, MoneyModel
+
+__all__ = [
+    "RECORD_SIZE",
+    "pack",
+    "pack_into",
+    "pack_many",
+    "pack_many_into",
+    "unpack",
+    "iter_unpack",
+    "unpack_many",
+]
+
+_record = struct.Struct("<qi4s")
+
+RECORD_SIZE = _record.size
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+@lru_cache(maxsize=1024)
+def _encoded_ticker(ticker: str) -> bytes:
+    try:
+        encoded_ticker = ticker.encode("ascii")
+    except UnicodeEncodeError:
+        raise ConversionError(f"Currency '{ticker}' cannot be stored in binary format")
+    if len(encoded_ticker) > 4:
+        raise ConversionError(f"Currency '{ticker}' cannot be stored in binary format, max length is 4 characters")
+    return encoded_ticker
+
+
+@lru_cache(maxsize=1024)
+def _decoded_ticker(encoded_ticker: bytes) -> Optional[str]:
+    try:
+        return encoded_ticker.rstrip(b"\x00").decode("ascii") or None
+    except UnicodeDecodeError:
+        raise ConversionError("Invalid currency in binary record")
+
+
+def _record_values(money: MoneyModel[Any]) -> Any:
+    units, nanos = money._units_and_nanos
+    return units, nanos, _encoded_ticker(str(money._currency)) if money._currency else b""
+
+
+def pack(money: MoneyModel[Any]) -> bytes:
+    return _record.pack(*_record_values(money))
+
+
+def pack_into(buffer: Buffer, offset: int, money: MoneyModel[Any]) -> None:
+    _record.pack_into(buffer, offset, *_record_values(money))
+
+
+def pack_many(iterable: Iterable[MoneyModel[Any]]) -> bytes:
+    record_pack = _record.pack
+    return b"".join([record_pack(*_record_values(money)) for money in iterable])
+
+
+def pack_many_into(buffer: Buffer, iterable: Iterable[MoneyModel[Any]], offset: int = 0) -> int:
+    record_pack_into = _record.pack_into
+    count = 0
+    for money in iterable:
+        record_pack_into(buffer, offset + count * RECORD_SIZE, *_record_values(money))
+        count += 1
+    return count
+
+
+def unpack(buffer: Buffer, offset: int = 0, cls: Type[MoneyModel[Any]] = Money) -> Any:
+    units, nanos, encoded_ticker = _record.unpack_from(buffer, offset)
+    return cls._from_units_and_nanos(units, nanos, _decoded_ticker(encoded_ticker))
+
+
+def iter_unpack(buffer: Buffer, cls: Type[MoneyModel[Any]] = Money) -> Iterator[Any]:
+    with memoryview(buffer) as view:
+        size = view.nbytes
+    if size % RECORD_SIZE:
+        raise ConversionError(f"Invalid buffer size, must be a multiple of {RECORD_SIZE} bytes")
+
+    from_units_and_nanos = cls._from_units_and_nanos
+    for units, nanos, encoded_ticker in _record.iter_unpack(buffer):
+        yield from_units_and_nanos(units, nanos, _decoded_ticker(encoded_ticker))
+
+
+def unpack_many(buffer: Buffer, cls: Type[MoneyModel[Any]] = Money) -> List[Any]:
+    return list(iter_unpack(buffer, cls=cls))
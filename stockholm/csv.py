@@ -0,0 +1,243 @@
+import csv
+import re
+from decimal import Decimal
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import ConversionError
+from .money import HIGHEST_SUPPORTED_AMOUNT, LOWEST_SUPPORTED_AMOUNT, Money, MoneyModel
+
+__all__ = [
+    "AMOUNT_KINDS",
+    "MoneyColumn",
+    "read_money",
+    "read_money_columns",
+    "write_rows",
+]
+
+AMOUNT_KINDS = ("decimal", "with_currency", "minor_units")
+
+Column = Union[int, str]
+CurrencyInput = Optional[Union[BaseCurrencyType, str]]
+
+# plain decimal strings within the supported range of monetary amounts, parsed without the generic input handling
+_plain_decimal = re.compile(r"-?[0-9]{1,18}(?:[.][0-9]{1,9})?")
+
+_highest_supported_amount = Decimal(HIGHEST_SUPPORTED_AMOUNT)
+_lowest_supported_amount = Decimal(LOWEST_SUPPORTED_AMOUNT)
+
+
+class MoneyColumn:
+    __slots__ = ("amounts", "currencies")
+
+    def __init__(self, amounts: List[Decimal], currencies: List[Optional[BaseCurrencyType]]) -> None:
+        if len(amounts) != len(currencies):
+            raise ValueError("Columns must be of the same length")
+        self.amounts = amounts
+        self.currencies = currencies
+
+    def __repr__(self) -> str:
+        return f"<stockholm.csv.MoneyColumn: {len(self.amounts)} values>"
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __iter__(self) -> Iterator[Money]:
+        create = Money._create
+        return map(create, self.amounts, self.currencies)
+
+    def __getitem__(self, index: int) -> Money:
+        return Money._create(self.amounts[index], self.currencies[index])
+
+    def tolist(self) -> List[Money]:
+        return list(self)
+
+
+def _column_index(column: Column, header: Optional[List[str]]) -> int:
+    if isinstance(column, int):
+        return column
+    if header is None:
+        raise ValueError(f"Column {column!r} cannot be referenced by name without a header row")
+    try:
+        return header.index(column)
+    except ValueError:
+        raise ValueError(f"Column {column!r} not found in header row") from None
+
+
+def _amount_parser(
+    kind: str,
+) -> Callable[[str, Optional[BaseCurrencyType]], Tuple[Decimal, Optional[BaseCurrencyType]]]:
+    # returns a function parsing a single cell with the (already resolved) currency of the row, values that aren't
+    # plain decimal strings are passed on to the generic input handling of Money
+    if kind == "minor_units":
+
+        def parse(value: str, currency: Optional[BaseCurrencyType]) -> Tuple[Decimal, Optional[BaseCurrencyType]]:
+            decimal_digits = currency.decimal_digits if currency is not None else 2
+            amount = Decimal(int(value)).scaleb(-decimal_digits)
+            if amount > _highest_supported_amount:
+                raise ConversionError(f"Input amount is too high, max value is {HIGHEST_SUPPORTED_AMOUNT}")
+            if amount < _lowest_supported_amount:
+                raise ConversionError(f"Input amount is too low, min value is {LOWEST_SUPPORTED_AMOUNT}")
+            return amount, currency
+
+    elif kind == "decimal":
+
+        def parse(value: str, currency: Optional[BaseCurrencyType]) -> Tuple[Decimal, Optional[BaseCurrencyType]]:
+            if _plain_decimal.fullmatch(value):
+                amount = Decimal(value)
+                if amount:
+                    return amount, currency
+            money = Money(value, currency=currency)
+            return money._amount, _currency(money.currency) if money.currency else currency
+
+    else:
+
+        def parse(value: str, currency: Optional[BaseCurrencyType]) -> Tuple[Decimal, Optional[BaseCurrencyType]]:
+            amount_value, _, currency_code = value.strip().partition(" ")
+            if currency_code and _plain_decimal.fullmatch(amount_value):
+                amount = Decimal(amount_value)
+                if amount:
+                    parsed_currency = _currency(currency_code)
+                    if currency is not None and parsed_currency.ticker != currency.ticker:
+                        raise ConversionError("Mismatching currency in input value and currency column")
+                    return amount, parsed_currency
+            money = Money(value, currency=currency)
+            return money._amount, _currency(money.currency) if money.currency else currency
+
+    return parse
+
+
+_currencies: Dict[str, BaseCurrencyType] = {}
+
+
+def _currency(value: Any) -> BaseCurrencyType:
+    if isinstance(value, BaseCurrencyType):
+        return value
+    currency = _currencies.get(value)
+    if currency is None:
+        ticker = str(value).strip()
+        if not ticker.isalpha():
+            raise ConversionError(f"Invalid currency code: {value!r}")
+        currency = get_currency(ticker.upper())
+        if len(_currencies) < 1024:
+            _currencies[value] = currency
+    return currency
+
+
+def read_money_columns(
+    fp: Iterable[str],
+    amount: Column,
+    currency: Optional[Column] = None,
+    kind: str = "decimal",
+    default_currency: CurrencyInput = None,
+    header: Optional[bool] = None,
+    chunk_size: int = 10000,
+    **fmtparams: Any,
+) -> Iterator[MoneyColumn]:
+    if kind not in AMOUNT_KINDS:
+        raise ValueError(f"Invalid value for 'kind': {kind!r}")
+    if chunk_size < 1:
+        raise ValueError("Invalid value for 'chunk_size'")
+
+    resolved_default_currency = _currency(default_currency) if default_currency else None
+    reader = csv.reader(fp, **fmtparams)
+
+    header_row: Optional[List[str]] = None
+    if header or (header is None and (isinstance(amount, str) or isinstance(currency, str))):
+        header_row = next(reader, None)
+        if header_row is None:
+            return
+    amount_index = _column_index(amount, header_row)
+    currency_index = _column_index(currency, header_row) if currency is not None else None
+
+    parse = _amount_parser(kind)
+    amounts: List[Decimal] = []
+    currencies: List[Optional[BaseCurrencyType]] = []
+
+    for row in reader:
+        if not row:
+            continue
+        try:
+            row_currency = resolved_default_currency
+            if currency_index is not None and row[currency_index]:
+                row_currency = _currency(row[currency_index])
+            value, row_currency = parse(row[amount_index], row_currency)
+        except IndexError:
+            raise ConversionError(f"Missing column on line {reader.line_num}") from None
+        except (ArithmeticError, ValueError) as exc:
+            raise ConversionError(f"Invalid monetary amount on line {reader.line_num}: {exc}") from None
+
+        amounts.append(value)
+        currencies.append(row_currency)
+        if len(amounts) >= chunk_size:
+            yield MoneyColumn(amounts, currencies)
+            amounts = []
+            currencies = []
+
+    if amounts:
+        yield MoneyColumn(amounts, currencies)
+
+
+def read_money(
+    fp: Iterable[str],
+    amount: Column,
+    currency: Optional[Column] = None,
+    kind: str = "decimal",
+    default_currency: CurrencyInput = None,
+    header: Optional[bool] = None,
+    chunk_size: int = 10000,
+    **fmtparams: Any,
+) -> Iterator[Money]:
+    for column in read_money_columns(
+        fp,
+        amount,
+        currency=currency,
+        kind=kind,
+        default_currency=default_currency,
+        header=header,
+        chunk_size=chunk_size,
+        **fmtparams,
+    ):
+        yield from column
+
+
+def write_rows(
+    fp: IO[str],
+    rows: Iterable[Sequence[Any]],
+    format_spec: Optional[str] = None,
+    split_currency: bool = False,
+    chunk_size: int = 1000,
+    **fmtparams: Any,
+) -> int:
+    # monetary amounts are written as "<amount> <currency>" by default, as two cells (amount and currency code) with
+    # split_currency=True, or formatted using the format spec
+    writer = csv.writer(fp, **fmtparams)
+    count = 0
+    chunk: List[List[Any]] = []
+
+    for row in rows:
+        output: List[Any] = []
+        for value in row:
+            if isinstance(value, MoneyModel):
+                if format_spec is not None:
+                    output.append(format(value, format_spec))
+                elif split_currency:
+                    output.append(value.amount_as_string())
+                else:
+                    output.append(str(value))
+                if split_currency:
+                    output.append(value.currency_code or "")
+            else:
+                output.append(value)
+        chunk.append(output)
+
+        if len(chunk) >= chunk_size:
+            writer.writerows(chunk)
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        writer.writerows(chunk)
+        count += len(chunk)
+
+    return count
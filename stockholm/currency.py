@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import sys
 from decimal import Decimal
+from types import MethodType
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Set, Tuple, Type, Union, cast
 
+from ._pydantic import core_schema
+
 
 class DefaultCurrencyValue(type):
     pass
@@ -21,6 +24,52 @@ class CurrencyValue(Protocol):
     preferred_ticker: Optional[str]
 
 
+def _without_instance_schemas(schema: Any) -> Any:
+    # is-instance schemas can't be used in JSON mode, so they're pruned (along with emptied containers) from the schema
+    if isinstance(schema, dict):
+        if schema.get("type") == "is-instance":
+            return None
+        output = {}
+        for key, value in schema.items():
+            value = _without_instance_schemas(value)
+            if value is not None:
+                output[key] = value
+        return output
+    elif isinstance(schema, list):
+        return [value for value in map(_without_instance_schemas, schema) if value is not None]
+    return schema
+
+
+class _CurrencyAttribute:
+    # Attributes of currency instances are stored in slots, while the currency classes (for example Currency.SEK) keep
+    # their values as class attributes. Accessing the attribute on a class returns the class value instead of the slot.
+    __slots__ = ("slot", "value")
+
+    def __init__(self, slot: Any, value: Any) -> None:
+        self.slot = slot
+        self.value = value
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self.value
+        return self.slot.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+
+class _CurrencyMethod:
+    # Binds to the currency instance, or to the currency class when accessed on a class, so that for example both
+    # Currency.SEK.money(100) and BaseCurrency("XYZ").money(100) share the same implementation.
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        return MethodType(self.func, owner if instance is None else instance)
+
+
 class MetaCurrency(type):
     ticker: str
     decimal_digits: int
@@ -48,10 +97,15 @@ class MetaCurrency(type):
                 and str(type(bases[0])) == "<class 'stockholm.currency.MetaCurrency'>"
             )
         )
-        attributedict["as_string"] = lambda: str(attributedict["ticker"])
-        attributedict["as_str"] = lambda: str(attributedict["ticker"])
 
-        return cast(Type["BaseCurrency"], super().__new__(cls, name, bases, attributedict))
+        slot_values = {
+            name: attributedict.pop(name) for name in attributedict.get("__slots__", ()) if name in attributedict
+        }
+        currency_class = super().__new__(cls, name, bases, attributedict)
+        for name, value in slot_values.items():
+            type.__setattr__(currency_class, name, _CurrencyAttribute(currency_class.__dict__[name], value))
+
+        return cast(Type["BaseCurrency"], currency_class)
 
     def money(
         self,
@@ -146,6 +200,10 @@ class MetaCurrency(type):
         _source_type: Any,
         _handler: Any,
     ) -> Any:
+        return core_schema(cls, cls._build_pydantic_core_schema)
+
+    @classmethod
+    def _build_pydantic_core_schema(cls) -> Dict[str, Any]:
         def validate_currency_code(value: Any) -> BaseCurrency:
             return get_currency(str(value))
 
@@ -173,20 +231,11 @@ class MetaCurrency(type):
             )
         ]
 
-        def json_schema(schema: Any) -> Any:
-            if isinstance(schema, dict):
-                if schema.get("type") == "is-instance":
-                    return None
-                return {k: json_schema(v) for k, v in schema.items() if json_schema(v) is not None}
-            elif isinstance(schema, list):
-                return [json_schema(v) for v in schema if json_schema(v) is not None]
-            return schema
-
         return {
             "type": "json-or-python",
             "json_schema": {
                 "type": "union",
-                "choices": json_schema(schemas),
+                "choices": _without_instance_schemas(schemas),
             },
             "python_schema": {
                 "type": "union",
@@ -206,6 +255,8 @@ class MetaCurrency(type):
 
 
 class BaseCurrencyType(metaclass=MetaCurrency):
+    __slots__ = ("ticker", "currency", "decimal_digits", "interchangeable_with", "preferred_ticker", "_meta")
+
     ticker: str
     decimal_digits: int
     interchangeable_with: Optional[Union[Tuple[str, ...], List[str], Set[str]]]
@@ -239,9 +290,9 @@ class BaseCurrencyType(metaclass=MetaCurrency):
         object.__setattr__(self, "preferred_ticker", preferred_ticker if preferred_ticker else None)
 
         object.__setattr__(self, "_meta", False)
-        object.__setattr__(self, "as_string", lambda: str(self))
-        object.__setattr__(self, "as_str", lambda: str(self))
-        object.__setattr__(self, "money", lambda *args, **kwargs: self._money(*args, **kwargs))
+
+    def _as_string(self) -> str:
+        return str(self.ticker)
 
     def _money(
         self,
@@ -266,6 +317,10 @@ class BaseCurrencyType(metaclass=MetaCurrency):
             **kwargs,
         )
 
+    as_string = _CurrencyMethod(_as_string)
+    as_str = _CurrencyMethod(_as_string)
+    money = _CurrencyMethod(_money)
+
     def __setattr__(self, *args: Any) -> None:
         raise AttributeError("Attributes of currencies cannot be changed")
 
@@ -310,6 +365,16 @@ class BaseCurrencyType(metaclass=MetaCurrency):
     def __bool__(self) -> bool:
         return bool(self.ticker)
 
+    def __reduce__(
+        self,
+    ) -> Tuple[Type[BaseCurrencyType], Tuple[str, int, Optional[Tuple[str, ...]], Optional[str]]]:
+        return BaseCurrencyType, (
+            self.ticker,
+            self.decimal_digits,
+            cast(Optional[Tuple[str, ...]], self.interchangeable_with),
+            self.preferred_ticker,
+        )
+
 
 class BaseCurrency(BaseCurrencyType):
     def __new__(
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class MoneyException(Exception):
     pass
 
@@ -12,3 +15,11 @@ class ConversionError(MoneyException, ValueError):
 
 class InvalidOperandError(MoneyException, TypeError):
     pass
+
+
+class BankFileError(ConversionError):
+    def __init__(self, message: str, block: Optional[int] = None, line_number: Optional[int] = None) -> None:
+        location = ", ".join(f"{k} {v}" for k, v in (("block", block), ("line", line_number)) if v is not None)
+        super().__init__(f"{message} [{location}]" if location else message)
+        self.block = block
+        self.line_number = line_number
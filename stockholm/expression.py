@@ -0,0 +1,202 @@
+import decimal
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional, Tuple, Type, Union, cast
+
+from .currency import CurrencyValue
+from .exceptions import ConversionError, CurrencyMismatchError, InvalidOperandError
+from .money import HIGHEST_SUPPORTED_AMOUNT, LOWEST_SUPPORTED_AMOUNT, Money, MoneyModel, _normalized_zero
+
+__all__ = [
+    "Expression",
+    "lazy",
+    "evaluate",
+]
+
+Operand = Union["Expression", MoneyModel[Any], Decimal, int, float, str]
+Value = Tuple[Decimal, Optional[Union[CurrencyValue, str]], Type[MoneyModel[Any]]]
+
+_highest_supported_amount = Decimal(HIGHEST_SUPPORTED_AMOUNT)
+_lowest_supported_amount = Decimal(LOWEST_SUPPORTED_AMOUNT)
+_operator_symbols = {"add": "+", "sub": "-", "mul": "*", "truediv": "/"}
+
+
+class Expression:
+    # node in a deferred arithmetic expression – a leaf holds a value (amount, currency and class of the operand) or an
+    # operand which is converted when the expression is evaluated, and other nodes an operator with their operands.
+    # nothing is validated until the expression is evaluated.
+    __slots__ = ("op", "left", "right", "value", "operand")
+
+    def __init__(
+        self,
+        op: Optional[str],
+        left: Optional["Expression"] = None,
+        right: Optional["Expression"] = None,
+        value: Optional[Value] = None,
+        operand: Any = None,
+    ) -> None:
+        self.op = op
+        self.left = left
+        self.right = right
+        self.value = value
+        self.operand = operand
+
+    def __repr__(self) -> str:
+        return f"<stockholm.expression.Expression: {self}>"
+
+    def __str__(self) -> str:
+        if self.value is not None:
+            amount, currency, _ = self.value
+            return f"{amount} {currency}" if currency else str(amount)
+        if self.op == "operand":
+            return str(self.operand)
+        if self.op in _operator_symbols:
+            return f"({self.left} {_operator_symbols[self.op]} {self.right})"
+        return f"{self.op}({self.left})"
+
+    def __add__(self, other: Operand) -> "Expression":
+        return Expression("add", self, _operand(other))
+
+    def __radd__(self, other: Operand) -> "Expression":
+        return Expression("add", _operand(other), self)
+
+    def __sub__(self, other: Operand) -> "Expression":
+        return Expression("sub", self, _operand(other))
+
+    def __rsub__(self, other: Operand) -> "Expression":
+        return Expression("sub", _operand(other), self)
+
+    def __mul__(self, other: Operand) -> "Expression":
+        return Expression("mul", self, _operand(other))
+
+    def __rmul__(self, other: Operand) -> "Expression":
+        return Expression("mul", _operand(other), self)
+
+    def __truediv__(self, other: Operand) -> "Expression":
+        return Expression("truediv", self, _operand(other))
+
+    def __neg__(self) -> "Expression":
+        return Expression("neg", self)
+
+    def __pos__(self) -> "Expression":
+        return self
+
+    def __abs__(self) -> "Expression":
+        return Expression("abs", self)
+
+    def _convert(self, other: Value, allow_currency_mismatch: bool = False) -> Value:
+        # operands that aren't Money, Rate or Number objects are converted with the class of the value they're combined
+        # with and checked for mismatching currencies, as in Money._convert_other() – the result is always a Money
+        # object as the classes differ
+        if self.op != "operand":
+            return self._evaluate()
+        other_amount, other_currency, other_cls = other
+        try:
+            converted = other_cls(self.operand)
+        except ConversionError as ex:
+            other_repr = repr(other_cls._create(other_amount, other_currency))
+            raise InvalidOperandError(f"Unable to perform operations on {other_repr} with {self.operand!r}") from ex
+        currency = converted._currency
+        if not allow_currency_mismatch and other_currency and currency and other_currency != currency:
+            raise CurrencyMismatchError("Unable to perform operations on values with differing currencies")
+        return converted._amount, currency, Money
+
+    def _evaluate(self) -> Value:
+        if self.value is not None:
+            return self.value
+
+        op = self.op
+        if op == "operand":
+            return lazy(self.operand)._evaluate()
+
+        left, right = cast(Expression, self.left), cast(Expression, self.right)
+        if op == "neg":
+            amount, currency, cls = left._evaluate()
+            return _checked(-amount), currency, cls
+        if op == "abs":
+            amount, currency, cls = left._evaluate()
+            return _checked(abs(amount)), currency, cls
+
+        allow_currency_mismatch = op == "truediv"
+        if left.op == "operand":
+            # reflected operation, for example `10 - lazy(amount)` – the currency of the right operand takes precedence
+            other_amount, other_currency, other_cls = right._evaluate()
+            amount, currency, cls = left._convert((other_amount, other_currency, other_cls), allow_currency_mismatch)
+            preferred_currency = other_currency or currency
+        else:
+            amount, currency, cls = left._evaluate()
+            other_amount, other_currency, other_cls = right._convert((amount, currency, cls), allow_currency_mismatch)
+            preferred_currency = currency or other_currency
+        result_cls = cls if cls is other_cls else Money
+
+        # currencies and operands are validated as in the arithmetic of Money objects
+        if op == "truediv":
+            if other_amount == 0:
+                raise ZeroDivisionError("division by zero")
+            return _checked(amount / other_amount), None if other_currency is not None else currency, result_cls
+        if op == "mul":
+            if currency is not None and other_currency is not None:
+                raise InvalidOperandError("Unable to multiply two monetary amounts with each other")
+            return _checked(amount * other_amount), preferred_currency, result_cls
+        if currency and other_currency and currency != other_currency:
+            raise CurrencyMismatchError("Unable to perform operations on values with differing currencies")
+        if op == "add":
+            return _checked(amount + other_amount), preferred_currency, result_cls
+        return _checked(amount - other_amount), preferred_currency, result_cls
+
+    def evaluate(
+        self, precision: Optional[int] = None, decimals: Optional[int] = None, rounding: str = ROUND_HALF_UP
+    ) -> MoneyModel[Any]:
+        # evaluates the expression within a single decimal context (with 'precision' significant digits, defaults to
+        # the precision of the current context) and rounds the result once to 'decimals' decimals, if given. without
+        # 'precision' the result is the same as the result of the arithmetic on the operands themselves.
+        context = decimal.getcontext().copy()
+        if precision is not None:
+            context.prec = precision
+
+        with decimal.localcontext(context):
+            amount, currency, cls = self._evaluate()
+            if precision is not None:
+                amount = +amount
+            if decimals is not None:
+                amount = amount.quantize(Decimal(1).scaleb(-decimals), rounding=rounding)
+
+        return cast(MoneyModel[Any], cls._create(_checked(amount), currency))
+
+
+def _checked(amount: Decimal) -> Decimal:
+    # range checks and zero normalization of intermediate results, as when Money objects are created
+    if amount > _highest_supported_amount:
+        raise ConversionError(f"Input amount is too high, max value is {HIGHEST_SUPPORTED_AMOUNT}")
+    if amount < _lowest_supported_amount:
+        raise ConversionError(f"Input amount is too low, min value is {LOWEST_SUPPORTED_AMOUNT}")
+    return _normalized_zero(amount)
+
+
+def _operand(value: Operand) -> Expression:
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, MoneyModel):
+        return Expression(None, value=(value._amount, value._currency, type(value)))
+    # integers and decimals are converted the same by all classes – other operands are converted once the class of the
+    # value they're combined with is known
+    if (type(value) is int or (isinstance(value, Decimal) and value.is_finite())) and (
+        _lowest_supported_amount <= value <= _highest_supported_amount
+    ):
+        return Expression(None, value=(_checked(Decimal(value)), None, Money))
+    return Expression("operand", operand=value)
+
+
+def lazy(value: Operand) -> Expression:
+    # starts a deferred expression – arithmetic on the returned expression builds an expression tree which is evaluated
+    # with evaluate(), for example `(lazy(loan_amount) * (interest_rate / 365) * days - fees).evaluate(decimals=2)`
+    expression = _operand(value)
+    if expression.op == "operand":
+        money = Money(value)
+        return Expression(None, value=(money._amount, money._currency, Money))
+    return expression
+
+
+def evaluate(
+    expression: Operand, precision: Optional[int] = None, decimals: Optional[int] = None, rounding: str = ROUND_HALF_UP
+) -> MoneyModel[Any]:
+    return lazy(expression).evaluate(precision=precision, decimals=decimals, rounding=rounding)
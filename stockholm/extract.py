@@ -0,0 +1,115 @@
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from .currency import BaseCurrencyType, Currency, get_currency
+from .money import Money, _normalized_zero
+
+__all__ = [
+    "AmountMatch",
+    "find_amounts",
+    "finditer",
+]
+
+# amounts as accepted by Money – optionally signed, with comma separated groups of thousands and at most 18 integer
+# digits. an amount directly followed by another digit (also after a comma or a period) isn't matched at all.
+_amount = r"[-+]?(?:[0-9]{1,3}(?:,[0-9]{3}){1,5}|[0-9]{1,18})(?:[.][0-9]{1,9})?(?![.,]?[0-9])"
+
+_known_tickers = frozenset(
+    name
+    for name, value in vars(Currency).items()
+    if isinstance(value, type) and issubclass(value, BaseCurrencyType) and name.isalpha() and name.isupper()
+)
+
+
+class AmountMatch:
+    __slots__ = ("money", "start", "end", "text")
+
+    def __init__(self, money: Money, start: int, end: int, text: str) -> None:
+        self.money = money
+        self.start = start
+        self.end = end
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f'<stockholm.extract.AmountMatch: "{self.money}" ({self.start}, {self.end})>'
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AmountMatch):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def span(self) -> Tuple[int, int]:
+        return self.start, self.end
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    # alternation of the words with common prefixes factored out ("SEK|SGD" -> "S(?:EK|GD)"), so that a word is matched
+    # in a single pass over its characters instead of trying every ticker in turn
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:{}){}".format("|".join(branches), "?" if "" in node else "")
+
+    return render(trie)
+
+
+@lru_cache(maxsize=32)
+def _pattern(tickers: FrozenSet[str], ignore_case: bool) -> Pattern[str]:
+    ticker = r"\b{}\b".format(_trie_pattern(tickers))
+    if ignore_case:
+        ticker = f"(?i:{ticker})"
+    return re.compile(
+        rf"""
+        (?P<class>Money|Overdraft)[(](?:
+            (?P<amount_1>{_amount})[ ]+(?P<currency_1>{ticker})
+            | (?P<currency_2>{ticker})[ ]+(?P<amount_2>{_amount})
+            | (?P<quote>['"])(?P<amount_3>{_amount})(?P=quote),[ ]*['"]?(?P<currency_3>{ticker})['"]?
+        )[)]
+        | (?<![\w.,+-])(?P<amount_4>{_amount})[ ]+(?P<currency_4>{ticker})
+        | (?P<currency_5>{ticker})[ ]+(?P<amount_5>{_amount})
+        """,
+        re.VERBOSE,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _currency(ticker: str) -> BaseCurrencyType:
+    return get_currency(ticker.upper())
+
+
+def finditer(text: str, currencies: Optional[Iterable[str]] = None, ignore_case: bool = False) -> Iterator[AmountMatch]:
+    # yields each monetary amount in the text together with its position – amounts must be given together with a
+    # currency code, either before or after the amount ("SEK 99", "1,234.50 EUR") or as in the repr of Money objects
+    # ("Money(12.00 USD)", "Overdraft(12.00 USD)"). by default only upper case codes of the known currencies are matched.
+    tickers = frozenset(ticker.upper() for ticker in currencies) if currencies is not None else _known_tickers
+    if not tickers:
+        return
+    create = Money._create
+
+    for match in _pattern(tickers, ignore_case).finditer(text):
+        groups = match.groupdict()
+        for index in "12345":
+            amount = groups[f"amount_{index}"]
+            if amount is not None:
+                break
+        value = Decimal(amount.replace(",", ""))
+        if groups["class"] == "Overdraft":
+            value = value.copy_negate()
+        value = _normalized_zero(value)
+        yield AmountMatch(create(value, _currency(groups[f"currency_{index}"])), match.start(), match.end(), match[0])
+
+
+def find_amounts(text: str, currencies: Optional[Iterable[str]] = None, ignore_case: bool = False) -> List[Money]:
+    return [match.money for match in finditer(text, currencies=currencies, ignore_case=ignore_case)]
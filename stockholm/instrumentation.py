@@ -0,0 +1,105 @@
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+__all__ = [
+    "enable",
+    "disable",
+    "is_enabled",
+    "reset",
+    "snapshot",
+    "to_prometheus",
+]
+
+# Counters are only updated while instrumentation is enabled. The hot paths check this flag before doing anything else,
+# which keeps the overhead to a single attribute lookup when disabled.
+enabled = False
+
+_metrics: Dict[str, Tuple[str, str]] = {
+    "init_inputs": ("kind", "Monetary amounts created through the constructor, by input kind."),
+    "conversion_fallbacks": ("kind", "Operands converted through the constructor before an operation, by input kind."),
+    "currency_mismatches": ("", "Operations rejected because of differing currencies."),
+    "cache_hits": ("cache", "Cache hits, by cache."),
+    "cache_misses": ("cache", "Cache misses, by cache."),
+}
+
+_counters: Dict[Tuple[str, str], int] = {}
+_caches: Dict[str, Callable[..., Any]] = {}
+_cache_offsets: Dict[str, Tuple[int, int]] = {}
+
+
+def enable() -> None:
+    global enabled
+    if not enabled:
+        reset()
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    if enabled:
+        _counters.update(_cache_counters())
+    enabled = False
+
+
+def is_enabled() -> bool:
+    return enabled
+
+
+def reset() -> None:
+    _counters.clear()
+    for name, func in _caches.items():
+        cache_info = getattr(func, "cache_info")()
+        _cache_offsets[name] = (cache_info.hits, cache_info.misses)
+
+
+def increment(metric: str, label: str = "") -> None:
+    key = (metric, label)
+    _counters[key] = _counters.get(key, 0) + 1
+
+
+def register_cache(name: str, func: Callable[..., Any]) -> None:
+    # the hits and misses of lru_cache decorated functions are read from cache_info() when a snapshot is taken
+    _caches[name] = func
+    cache_info = getattr(func, "cache_info")()
+    _cache_offsets[name] = (cache_info.hits, cache_info.misses)
+
+
+def _cache_counters() -> Dict[Tuple[str, str], int]:
+    output: Dict[Tuple[str, str], int] = {}
+    for name, func in _caches.items():
+        cache_info = getattr(func, "cache_info")()
+        hits_offset, misses_offset = _cache_offsets.get(name, (0, 0))
+        output[("cache_hits", name)] = cache_info.hits - hits_offset
+        output[("cache_misses", name)] = cache_info.misses - misses_offset
+    return output
+
+
+def snapshot() -> Dict[str, Union[int, Dict[str, int]]]:
+    counters = {**_counters, **_cache_counters()} if enabled else _counters
+    labeled: Dict[str, Dict[str, int]] = {metric: {} for metric, (label_name, _) in _metrics.items() if label_name}
+    for (metric, label), value in sorted(counters.items()):
+        if metric in labeled:
+            labeled[metric][label] = value
+
+    return {
+        metric: labeled[metric] if label_name else counters.get((metric, ""), 0)
+        for metric, (label_name, _) in _metrics.items()
+    }
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_prometheus(prefix: str = "stockholm") -> str:
+    lines: List[str] = []
+    for metric, metric_value in snapshot().items():
+        label_name, description = _metrics[metric]
+        name = f"{prefix}_{metric}_total" if prefix else f"{metric}_total"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        if isinstance(metric_value, dict):
+            for label, value in metric_value.items():
+                lines.append(f'{name}{{{label_name}="{_escape_label_value(label)}"}} {value}')
+        else:
+            lines.append(f"{name} {metric_value}")
+    return "\n".join(lines) + "\n"
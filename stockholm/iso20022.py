@@ -0,0 +1,471 @@
+import itertools
+import os
+import re
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache, partial
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+from xml.etree.ElementTree import Element, XMLPullParser
+from xml.sax.saxutils import escape, quoteattr
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import BankFileError
+from .money import Money
+
+__all__ = [
+    "StatementEntry",
+    "read_camt053",
+    "read_camt053_columns",
+    "Payment",
+    "write_pain001",
+]
+
+Source = Union[str, "os.PathLike[str]", bytes, bytearray, IO[bytes]]
+
+ENTRY_COLUMNS = (
+    "amount",
+    "currency",
+    "credit_debit",
+    "status",
+    "booking_date",
+    "value_date",
+    "reference",
+    "account_servicer_reference",
+    "end_to_end_id",
+    "remittance_information",
+    "statement_id",
+    "account",
+)
+
+# ActiveOrHistoricCurrencyAndAmount – 18 digits in total, of which at most 5 fraction digits
+_amount_pattern = re.compile(r"[0-9]{1,18}(?:[.][0-9]{0,5})?")
+
+RawEntry = Tuple[
+    Decimal,
+    BaseCurrencyType,
+    str,
+    Optional[str],
+    Optional[date],
+    Optional[date],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+]
+
+
+class StatementEntry:
+    __slots__ = ENTRY_COLUMNS[:1] + ENTRY_COLUMNS[2:]
+
+    def __init__(
+        self,
+        amount: Money,
+        credit_debit: str,
+        status: Optional[str] = None,
+        booking_date: Optional[date] = None,
+        value_date: Optional[date] = None,
+        reference: Optional[str] = None,
+        account_servicer_reference: Optional[str] = None,
+        end_to_end_id: Optional[str] = None,
+        remittance_information: Optional[str] = None,
+        statement_id: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> None:
+        self.amount = amount
+        self.credit_debit = credit_debit
+        self.status = status
+        self.booking_date = booking_date
+        self.value_date = value_date
+        self.reference = reference
+        self.account_servicer_reference = account_servicer_reference
+        self.end_to_end_id = end_to_end_id
+        self.remittance_information = remittance_information
+        self.statement_id = statement_id
+        self.account = account
+
+    def __repr__(self) -> str:
+        return f'<stockholm.iso20022.StatementEntry: "{self.signed_amount}" ({self.booking_date})>'
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StatementEntry):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    @property
+    def signed_amount(self) -> Money:
+        return -self.amount if self.credit_debit == "DBIT" else self.amount
+
+
+@lru_cache(maxsize=256)
+def _currency(value: str) -> BaseCurrencyType:
+    ticker = value.strip().upper()
+    if not ticker.isalpha():
+        raise ValueError(f"Invalid currency code: {value!r}")
+    return get_currency(ticker)
+
+
+def _date(element: Optional[Element]) -> Optional[date]:
+    # <BookgDt> and <ValDt> holds either a <Dt> or a <DtTm> element
+    if element is None or not len(element):
+        return None
+    text = element[0].text
+    return date.fromisoformat(text.strip()[:10]) if text else None
+
+
+def _text(element: Optional[Element]) -> Optional[str]:
+    if element is None or element.text is None:
+        return None
+    return element.text.strip() or None
+
+
+def _read_chunks(source: Source, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            yield from iter(lambda: fp.read(chunk_size), b"")
+    elif isinstance(source, (bytes, bytearray)):
+        yield bytes(source)
+    else:
+        yield from iter(lambda: source.read(chunk_size), b"")
+
+
+def _child_text(element: Element, *tags: str) -> Optional[str]:
+    for tag in tags:
+        found = element.find(tag)
+        if found is None:
+            return None
+        element = found
+    return _text(element)
+
+
+def _iter_entries(source: Source) -> Iterator[RawEntry]:
+    parser: "XMLPullParser[Element]" = XMLPullParser(events=("start", "end"))
+    read_events = cast(Callable[[], Iterator[Tuple[str, Element]]], parser.read_events)
+
+    ns = ""
+    root: Optional[Element] = None
+    statement_container: Optional[Element] = None
+    statement: Optional[Element] = None
+    statement_index = 0
+    statement_id: Optional[str] = None
+    account: Optional[str] = None
+    entry_index = 0
+
+    container_tag = stmt_tag = ntry_tag = ""
+    amt_tag = cdt_dbt_ind_tag = sts_tag = cd_tag = bookg_dt_tag = val_dt_tag = ntry_ref_tag = acct_svcr_ref_tag = ""
+    ntry_dtls_tag = tx_dtls_tag = refs_tag = end_to_end_id_tag = rmt_inf_tag = ustrd_tag = ""
+    id_tag = acct_tag = iban_tag = othr_tag = ""
+
+    def fail(message: str) -> BankFileError:
+        return BankFileError(message, block=statement_index or None)
+
+    for chunk in _read_chunks(source):
+        parser.feed(chunk)
+        for event, element in read_events():
+            tag = element.tag
+            if event == "start":
+                if tag == ntry_tag:
+                    if not entry_index and statement is not None:
+                        # the statement's <Id> and <Acct> elements precede the entries and are complete at this point
+                        statement_id = _child_text(statement, id_tag)
+                        account = _child_text(statement, acct_tag, id_tag, iban_tag) or _child_text(
+                            statement, acct_tag, id_tag, othr_tag, id_tag
+                        )
+                elif tag == stmt_tag:
+                    statement = element
+                    statement_index += 1
+                    statement_id = None
+                    account = None
+                    entry_index = 0
+                elif tag == container_tag:
+                    statement_container = element
+                elif root is None:
+                    # the document root defines the namespace, which differs between versions of camt.053
+                    root = element
+                    ns = tag[: tag.index("}") + 1] if tag.startswith("{") else ""
+                    container_tag, stmt_tag, ntry_tag = f"{ns}BkToCstmrStmt", f"{ns}Stmt", f"{ns}Ntry"
+                    amt_tag, cdt_dbt_ind_tag, sts_tag, cd_tag = f"{ns}Amt", f"{ns}CdtDbtInd", f"{ns}Sts", f"{ns}Cd"
+                    bookg_dt_tag, val_dt_tag = f"{ns}BookgDt", f"{ns}ValDt"
+                    ntry_ref_tag, acct_svcr_ref_tag = f"{ns}NtryRef", f"{ns}AcctSvcrRef"
+                    ntry_dtls_tag, tx_dtls_tag, refs_tag = f"{ns}NtryDtls", f"{ns}TxDtls", f"{ns}Refs"
+                    end_to_end_id_tag, rmt_inf_tag, ustrd_tag = f"{ns}EndToEndId", f"{ns}RmtInf", f"{ns}Ustrd"
+                    id_tag, acct_tag, iban_tag, othr_tag = f"{ns}Id", f"{ns}Acct", f"{ns}IBAN", f"{ns}Othr"
+                continue
+
+            if tag == ntry_tag:
+                entry_index += 1
+                amount_element = element.find(amt_tag)
+                if amount_element is None:
+                    raise fail(f"Missing <Amt> element in entry {entry_index}")
+                text = (amount_element.text or "").strip()
+                if not _amount_pattern.fullmatch(text):
+                    raise fail(f"Invalid amount in entry {entry_index}: {text!r}")
+                try:
+                    currency = _currency(amount_element.get("Ccy") or "")
+                except ValueError:
+                    raise fail(f"Invalid currency code in entry {entry_index}: {amount_element.get('Ccy')!r}") from None
+
+                credit_debit = _text(element.find(cdt_dbt_ind_tag))
+                if credit_debit != "CRDT" and credit_debit != "DBIT":
+                    raise fail(f"Invalid credit or debit indicator in entry {entry_index}: {credit_debit!r}")
+
+                # <Sts> is a code element in camt.053.001.08 and later, and a text element in previous versions
+                status_element = element.find(sts_tag)
+                status = _text(status_element)
+                if status is None and status_element is not None:
+                    status = _child_text(status_element, cd_tag)
+
+                try:
+                    booking_date = _date(element.find(bookg_dt_tag))
+                    value_date = _date(element.find(val_dt_tag))
+                except ValueError:
+                    raise fail(f"Invalid booking or value date in entry {entry_index}") from None
+
+                end_to_end_id = remittance_information = None
+                transaction_details = element.find(ntry_dtls_tag)
+                if transaction_details is not None:
+                    transaction_details = transaction_details.find(tx_dtls_tag)
+                if transaction_details is not None:
+                    end_to_end_id = _child_text(transaction_details, refs_tag, end_to_end_id_tag)
+                    remittance_information = _child_text(transaction_details, rmt_inf_tag, ustrd_tag)
+
+                yield (
+                    Decimal(text),
+                    currency,
+                    credit_debit,
+                    status,
+                    booking_date,
+                    value_date,
+                    _text(element.find(ntry_ref_tag)),
+                    _text(element.find(acct_svcr_ref_tag)),
+                    end_to_end_id,
+                    remittance_information,
+                    statement_id,
+                    account,
+                )
+
+                # processed entries are removed from the tree to keep memory usage constant while streaming
+                element.clear()
+                if statement is not None:
+                    statement.remove(element)
+            elif tag == stmt_tag:
+                element.clear()
+                if statement_container is not None:
+                    statement_container.remove(element)
+                statement = None
+
+    parser.close()
+
+
+def read_camt053(source: Source) -> Iterator[StatementEntry]:
+    create = Money._create
+    for values in _iter_entries(source):
+        yield StatementEntry(create(values[0], values[1]), *values[2:])
+
+
+def read_camt053_columns(source: Source, batch_size: int = 10000) -> Iterator[Dict[str, List[Any]]]:
+    if batch_size < 1:
+        raise ValueError("Invalid value for 'batch_size'")
+
+    columns: Dict[str, List[Any]] = {name: [] for name in ENTRY_COLUMNS}
+    appenders = [columns[name].append for name in ENTRY_COLUMNS]
+    count = 0
+    for values in _iter_entries(source):
+        for append, value in zip(appenders, values):
+            append(value)
+        count += 1
+        if count == batch_size:
+            yield columns
+            columns = {name: [] for name in ENTRY_COLUMNS}
+            appenders = [columns[name].append for name in ENTRY_COLUMNS]
+            count = 0
+    if count:
+        yield columns
+
+
+PAIN001_NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:pain.001.001.03"
+
+# the totals are written as fixed width fields (padded with whitespace between the elements) so that the header can
+# be rewritten in place once all payments have been written: Max15NumericText and DecimalNumber with 18 digits
+_count_width = len("<NbOfTxs></NbOfTxs>") + 15
+_sum_width = len("<CtrlSum></CtrlSum>") + 19
+
+
+class Payment:
+    __slots__ = ("amount", "creditor_name", "creditor_iban", "creditor_bic", "end_to_end_id", "remittance_information")
+
+    def __init__(
+        self,
+        amount: Money,
+        creditor_name: str,
+        creditor_iban: str,
+        creditor_bic: Optional[str] = None,
+        end_to_end_id: Optional[str] = None,
+        remittance_information: Optional[str] = None,
+    ) -> None:
+        self.amount = amount
+        self.creditor_name = creditor_name
+        self.creditor_iban = creditor_iban
+        self.creditor_bic = creditor_bic
+        self.end_to_end_id = end_to_end_id
+        self.remittance_information = remittance_information
+
+    def __repr__(self) -> str:
+        return f'<stockholm.iso20022.Payment: "{self.amount}" ({self.creditor_name})>'
+
+
+def _decimal_text(value: int, decimal_digits: int) -> str:
+    if not decimal_digits:
+        return str(value)
+    units, fraction = divmod(value, 10**decimal_digits)
+    return f"{units}.{fraction:0{decimal_digits}d}"
+
+
+def _pain001_header(
+    count: int,
+    control_sum: str,
+    message_id: str,
+    created_at: str,
+    initiating_party: str,
+    payment_information_id: str,
+    execution_date: str,
+    debtor_name: str,
+    debtor_iban: str,
+    debtor_bic: Optional[str],
+) -> bytes:
+    number_of_transactions = f"<NbOfTxs>{count}</NbOfTxs>".ljust(_count_width)
+    control_sum = f"<CtrlSum>{control_sum}</CtrlSum>".ljust(_sum_width)
+    if len(number_of_transactions) > _count_width or len(control_sum) > _sum_width:
+        raise BankFileError("Payment totals exceeds the maximum length of <NbOfTxs> or <CtrlSum>")
+    debtor_agent = f"<BIC>{escape(debtor_bic)}</BIC>" if debtor_bic else "<Othr><Id>NOTPROVIDED</Id></Othr>"
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="{PAIN001_NAMESPACE}"><CstmrCdtTrfInitn>\n'
+        f"<GrpHdr><MsgId>{escape(message_id)}</MsgId><CreDtTm>{created_at}</CreDtTm>"
+        f"{number_of_transactions}{control_sum}<InitgPty><Nm>{escape(initiating_party)}</Nm></InitgPty></GrpHdr>\n"
+        f"<PmtInf><PmtInfId>{escape(payment_information_id)}</PmtInfId><PmtMtd>TRF</PmtMtd>"
+        f"{number_of_transactions}{control_sum}<ReqdExctnDt>{execution_date}</ReqdExctnDt>"
+        f"<Dbtr><Nm>{escape(debtor_name)}</Nm></Dbtr><DbtrAcct><Id><IBAN>{escape(debtor_iban)}</IBAN></Id></DbtrAcct>"
+        f"<DbtrAgt><FinInstnId>{debtor_agent}</FinInstnId></DbtrAgt><ChrgBr>SLEV</ChrgBr>\n"
+    ).encode("utf-8")
+
+
+def write_pain001(
+    destination: Union[str, "os.PathLike[str]", IO[bytes]],
+    payments: Iterable[Payment],
+    message_id: str,
+    debtor_name: str,
+    debtor_iban: str,
+    execution_date: date,
+    debtor_bic: Optional[str] = None,
+    payment_information_id: Optional[str] = None,
+    initiating_party: Optional[str] = None,
+    created_at: Optional[datetime] = None,
+    buffer_size: int = 1 << 20,
+) -> Tuple[int, Decimal]:
+    # a payment information block must contain at least one credit transfer – checked before anything is written
+    iterator = iter(payments)
+    first_payment = next(iterator, None)
+    if first_payment is None:
+        raise BankFileError("Payment files must contain at least one payment")
+    payments = itertools.chain((first_payment,), iterator)
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as fp:
+            return write_pain001(
+                fp,
+                payments,
+                message_id,
+                debtor_name,
+                debtor_iban,
+                execution_date,
+                debtor_bic=debtor_bic,
+                payment_information_id=payment_information_id,
+                initiating_party=initiating_party,
+                created_at=created_at,
+                buffer_size=buffer_size,
+            )
+
+    render_header = partial(
+        _pain001_header,
+        message_id=message_id,
+        created_at=(created_at or datetime.now()).replace(microsecond=0).isoformat(),
+        initiating_party=initiating_party if initiating_party is not None else debtor_name,
+        payment_information_id=payment_information_id if payment_information_id is not None else message_id,
+        execution_date=execution_date.isoformat(),
+        debtor_name=debtor_name,
+        debtor_iban=debtor_iban,
+        debtor_bic=debtor_bic,
+    )
+
+    # totals are patched into the header by seeking back to it once all payments have been written, output that
+    # isn't seekable is written in two passes – payments are spooled to a temporary file until the totals are known
+    seekable = destination.seekable() if hasattr(destination, "seekable") else False
+    if seekable:
+        output = destination
+        start = destination.tell()
+        header = render_header(0, "0")
+        output.write(header)
+    else:
+        output = cast(IO[bytes], tempfile.TemporaryFile())
+
+    # control sums are accumulated exactly as integer minor units, grouped by the number of decimal digits
+    sums: Dict[int, int] = {}
+    count = 0
+    chunks: List[str] = []
+    size = 0
+
+    for payment in payments:
+        count += 1
+        amount = payment.amount
+        currency = amount.currency
+        if not isinstance(currency, BaseCurrencyType):
+            if not currency:
+                raise BankFileError(f"Payment {count} is missing a currency")
+            currency = get_currency(str(currency))
+        decimal_digits = currency.decimal_digits
+        value = amount.amount.scaleb(decimal_digits)
+        if value < 0 or value != value.to_integral_value():
+            raise BankFileError(f"Invalid amount for payment {count}: {amount}")
+        minor_units = int(value)
+        sums[decimal_digits] = sums.get(decimal_digits, 0) + minor_units
+
+        remittance_information = payment.remittance_information
+        chunk = (
+            f"<CdtTrfTxInf><PmtId><EndToEndId>{escape(payment.end_to_end_id or 'NOTPROVIDED')}</EndToEndId></PmtId>"
+            f"<Amt><InstdAmt Ccy={quoteattr(currency.ticker)}>{_decimal_text(minor_units, decimal_digits)}</InstdAmt>"
+            "</Amt>"
+            f"{f'<CdtrAgt><FinInstnId><BIC>{escape(payment.creditor_bic)}</BIC></FinInstnId></CdtrAgt>' if payment.creditor_bic else ''}"
+            f"<Cdtr><Nm>{escape(payment.creditor_name)}</Nm></Cdtr>"
+            f"<CdtrAcct><Id><IBAN>{escape(payment.creditor_iban)}</IBAN></Id></CdtrAcct>"
+            f"{f'<RmtInf><Ustrd>{escape(remittance_information)}</Ustrd></RmtInf>' if remittance_information else ''}"
+            "</CdtTrfTxInf>\n"
+        )
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            output.write("".join(chunks).encode("utf-8"))
+            chunks.clear()
+            size = 0
+
+    chunks.append("</PmtInf>\n</CstmrCdtTrfInitn></Document>\n")
+    output.write("".join(chunks).encode("utf-8"))
+
+    decimal_digits = max(sums, default=0)
+    total = sum(value * 10 ** (decimal_digits - digits) for digits, value in sums.items())
+    header = render_header(count, _decimal_text(total, decimal_digits))
+
+    if seekable:
+        end = output.tell()
+        output.seek(start)
+        output.write(header)
+        output.seek(end)
+    else:
+        destination.write(header)
+        output.seek(0)
+        for data in iter(lambda: output.read(buffer_size), b""):
+            destination.write(data)
+        output.close()
+
+    return count, Decimal(total).scaleb(-decimal_digits)
@@ -0,0 +1,74 @@
+import json
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from ._io import write_lines
+from .currency import BaseCurrencyType
+from .money import Money, MoneyModel
+
+__all__ = [
+    "JSONEncoder",
+    "default",
+    "object_hook",
+    "dumps",
+    "loads",
+    "write_ndjson",
+    "read_ndjson",
+]
+
+_money_dict_keys = frozenset(("value", "units", "nanos", "currency_code"))
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, MoneyModel):
+        return value.asdict()
+    if isinstance(value, BaseCurrencyType):
+        return str(value)
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def object_hook(value: Dict[str, Any]) -> Any:
+    if "units" not in value or "nanos" not in value or not value.keys() <= _money_dict_keys:
+        return value
+    if type(value["units"]) is not int or type(value["nanos"]) is not int:
+        return value
+
+    money = Money._from_units_and_nanos(value["units"], value["nanos"], value.get("currency_code"))
+    if "value" in value and value["value"] != money.value:
+        # the amount in 'value' is validated against 'units' and 'nanos' as when decoded with Money(**value)
+        return Money(**value)
+    return money
+
+
+class JSONEncoder(json.JSONEncoder):
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (MoneyModel, BaseCurrencyType)):
+            return default(o)
+        return super().default(o)
+
+
+def dumps(value: Any, **kwargs: Any) -> str:
+    kwargs.setdefault("cls", JSONEncoder)
+    return json.dumps(value, **kwargs)
+
+
+def loads(value: Union[str, bytes], **kwargs: Any) -> Any:
+    kwargs.setdefault("object_hook", object_hook)
+    return json.loads(value, **kwargs)
+
+
+def write_ndjson(fp: IO[str], values: Iterable[Any], chunk_size: int = 1000) -> int:
+    encode = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    return write_lines(fp, map(encode, values), chunk_size)
+
+
+def read_ndjson(
+    fp: Union[IO[str], IO[bytes]], object_hook: Optional[Callable[[Dict[str, Any]], Any]] = object_hook
+) -> Iterator[Any]:
+    decode = json.JSONDecoder(object_hook=object_hook).decode
+
+    for line in fp:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        yield decode(line)
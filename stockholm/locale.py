@@ -0,0 +1,425 @@
+import re
+import unicodedata
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple, Type, cast
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import ConversionError
+from .money import HIGHEST_SUPPORTED_AMOUNT, Money, MoneyModel, _normalized_zero, _render_amount
+from .rate import NumericType
+
+__all__ = [
+    "LocaleFormatter",
+    "LocaleParser",
+    "available_locales",
+    "get_formatter",
+    "get_parser",
+    "format_money",
+    "format_many",
+    "parse_money",
+    "parse_many",
+]
+
+# Compact locale pattern table, based on the CLDR number and currency data. Parsed on first use.
+#   locale | decimal symbol | group symbol | grouping sizes (primary;secondary) | minimum grouping digits |
+#   positive pattern | negative pattern (if not "-" + positive pattern) | currency symbols
+# The "¤" in a pattern is replaced with the currency symbol and "#" with the formatted number. The first locale
+# listed for a language is used when only a language code is given.
+_locale_table = """
+en_US|.|,|3|1|¤#||USD=$
+en_GB|.|,|3|1|¤#||GBP=£
+en_AU|.|,|3|1|¤#||AUD=$
+en_CA|.|,|3|1|¤#||CAD=$
+en_IE|.|,|3|1|¤#||EUR=€
+en_IN|.|,|3;2|1|¤#||INR=₹
+en_NZ|.|,|3|1|¤#||NZD=$
+en_SG|.|,|3|1|¤#||SGD=$
+en_ZA|,|\u00a0|3|1|¤#||ZAR=R
+sv_SE|,|\u00a0|3|1|#\u00a0¤|−#\u00a0¤|SEK=kr
+sv_FI|,|\u00a0|3|1|#\u00a0¤|−#\u00a0¤|EUR=€
+nb_NO|,|\u00a0|3|1|#\u00a0¤|−#\u00a0¤|NOK=kr
+da_DK|,|.|3|1|#\u00a0¤||DKK=kr.
+fi_FI|,|\u00a0|3|1|#\u00a0¤|−#\u00a0¤|EUR=€
+de_DE|,|.|3|1|#\u00a0¤||EUR=€;USD=$
+de_AT|,|\u00a0|3|1|¤\u00a0#|-¤\u00a0#|EUR=€;USD=$
+de_CH|.|’|3|1|¤\u00a0#|¤-#|CHF=CHF;EUR=€;USD=$
+fr_FR|,|\u202f|3|1|#\u00a0¤||EUR=€;USD=$US;GBP=£GB
+fr_BE|,|\u202f|3|1|#\u00a0¤||EUR=€;USD=$US;GBP=£GB
+fr_CA|,|\u00a0|3|1|#\u00a0¤||CAD=$;USD=$\u00a0US
+fr_CH|,|\u202f|3|1|#\u00a0¤||CHF=CHF;EUR=€;USD=$US
+nl_NL|,|.|3|1|¤\u00a0#|¤\u00a0-#|EUR=€;USD=US$
+nl_BE|,|.|3|1|¤\u00a0#|¤\u00a0-#|EUR=€;USD=US$
+es_ES|,|.|3|2|#\u00a0¤||EUR=€;USD=US$
+es_MX|.|,|3|1|¤#||MXN=$;USD=USD
+it_IT|,|.|3|1|#\u00a0¤||EUR=€;USD=USD
+pt_PT|,|\u00a0|3|2|#\u00a0¤||EUR=€;USD=US$
+pt_BR|,|.|3|1|¤\u00a0#|-¤\u00a0#|BRL=R$;USD=US$
+pl_PL|,|\u00a0|3|2|#\u00a0¤||PLN=zł;USD=USD
+cs_CZ|,|\u00a0|3|1|#\u00a0¤||CZK=Kč;USD=US$
+ru_RU|,|\u00a0|3|1|#\u00a0¤||RUB=₽;USD=$
+tr_TR|,|.|3|1|¤#||TRY=₺;USD=$
+ja_JP|.|,|3|1|¤#||JPY=￥;USD=$;CNY=元
+zh_CN|.|,|3|1|¤#||CNY=¥;USD=US$;JPY=JP¥
+ko_KR|.|,|3|1|¤#||KRW=₩;USD=US$;JPY=JP¥
+"""
+
+# Currency symbols used in locales where the currency isn't given a symbol of its own.
+_currency_symbols = {
+    "AUD": "A$",
+    "BRL": "R$",
+    "CAD": "CA$",
+    "CNY": "CN¥",
+    "EUR": "€",
+    "GBP": "£",
+    "HKD": "HK$",
+    "ILS": "₪",
+    "INR": "₹",
+    "JPY": "¥",
+    "KRW": "₩",
+    "MXN": "MX$",
+    "NZD": "NZ$",
+    "PHP": "₱",
+    "TWD": "NT$",
+    "USD": "US$",
+    "VND": "₫",
+}
+
+CURRENCY_DISPLAY_OPTIONS = ("symbol", "code", "none")
+
+
+class _LocaleData:
+    __slots__ = (
+        "locale",
+        "decimal_symbol",
+        "group_symbol",
+        "primary_grouping",
+        "secondary_grouping",
+        "min_grouping",
+        "positive_pattern",
+        "negative_pattern",
+        "currency_symbols",
+    )
+
+    def __init__(self, row: str) -> None:
+        locale, decimal_symbol, group_symbol, grouping, min_grouping, positive, negative, symbols = row.split("|")
+        primary_grouping, _, secondary_grouping = grouping.partition(";")
+
+        self.locale = locale
+        self.decimal_symbol = decimal_symbol
+        self.group_symbol = group_symbol
+        self.primary_grouping = int(primary_grouping)
+        self.secondary_grouping = int(secondary_grouping or primary_grouping)
+        self.min_grouping = int(min_grouping)
+        self.positive_pattern = positive
+        self.negative_pattern = negative or f"-{positive}"
+        self.currency_symbols = dict(item.split("=", 1) for item in symbols.split(";") if item)
+
+
+@lru_cache(maxsize=1)
+def _locales() -> Tuple[Dict[str, _LocaleData], Dict[str, str]]:
+    locales: Dict[str, _LocaleData] = {}
+    languages: Dict[str, str] = {}
+    for row in _locale_table.strip().splitlines():
+        data = _LocaleData(row)
+        locales[data.locale] = data
+        languages.setdefault(data.locale.split("_")[0], data.locale)
+    return locales, languages
+
+
+def _normalized_locale(locale: str) -> str:
+    if not isinstance(locale, str):
+        raise ValueError(f"Invalid locale: {locale!r}")
+
+    locales, languages = _locales()
+    language, _, territory = locale.strip().split(".")[0].replace("-", "_").partition("_")
+    value = f"{language.lower()}_{territory.upper()}" if territory else languages.get(language.lower(), "")
+    if value not in locales:
+        raise ValueError(f"Unsupported locale: {locale!r}")
+    return value
+
+
+def available_locales() -> List[str]:
+    return list(_locales()[0].keys())
+
+
+def _is_symbol_character(character: str) -> bool:
+    return unicodedata.category(character).startswith("S")
+
+
+def _currency_decimal_digits(currency: Any) -> int:
+    if isinstance(currency, BaseCurrencyType):
+        return currency.decimal_digits
+    value = get_currency(currency) if currency.isalpha() else None
+    return value.decimal_digits if isinstance(value, BaseCurrencyType) else 2
+
+
+class LocaleFormatter:
+    __slots__ = ("locale", "currency_display", "_data", "_patterns", "_grouped")
+
+    def __init__(self, locale: str, currency_display: str = "symbol") -> None:
+        if currency_display not in CURRENCY_DISPLAY_OPTIONS:
+            raise ValueError(f"Invalid value for 'currency_display': {currency_display!r}")
+
+        self._data = _locales()[0][_normalized_locale(locale)]
+        self.locale = self._data.locale
+        self.currency_display = currency_display
+        self._patterns: Dict[Any, Tuple[Optional[int], str, str, str, str]] = {}
+        self._grouped = (
+            self._data.primary_grouping == self._data.secondary_grouping == 3 and self._data.min_grouping == 1
+        )
+
+    def __repr__(self) -> str:
+        return f'<stockholm.LocaleFormatter: "{self.locale}">'
+
+    def _pattern(self, currency: Any) -> Tuple[Optional[int], str, str, str, str]:
+        decimals: Optional[int] = None
+        symbol = ""
+        if currency:
+            ticker = currency if isinstance(currency, str) else str(currency.ticker)
+            decimals = _currency_decimal_digits(currency)
+            if self.currency_display == "symbol":
+                symbol = self._data.currency_symbols.get(ticker) or _currency_symbols.get(ticker) or ticker
+            elif self.currency_display == "code":
+                symbol = ticker
+
+        output: List[str] = []
+        for pattern in (self._data.positive_pattern, self._data.negative_pattern):
+            prefix, _, suffix = pattern.partition("#")
+            if not symbol:
+                prefix, suffix = prefix.replace("¤", "").strip(), suffix.replace("¤", "").strip()
+            elif prefix.endswith("¤") and not _is_symbol_character(symbol[-1]):
+                prefix = f"{prefix}\u00a0"
+            elif suffix.startswith("¤") and not _is_symbol_character(symbol[0]):
+                suffix = f"\u00a0{suffix}"
+            output += [prefix.replace("¤", symbol), suffix.replace("¤", symbol)]
+
+        return decimals, output[0], output[1], output[2], output[3]
+
+    def _group(self, integral: str) -> str:
+        data = self._data
+        if self._grouped:
+            return integral if len(integral) < 4 else f"{int(integral):,}".replace(",", data.group_symbol)
+
+        primary = data.primary_grouping
+        if len(integral) < primary + data.min_grouping:
+            return integral
+
+        parts = [integral[-primary:]]
+        integral = integral[:-primary]
+        secondary = data.secondary_grouping
+        while len(integral) > secondary:
+            parts.append(integral[-secondary:])
+            integral = integral[:-secondary]
+        parts.append(integral)
+        return data.group_symbol.join(reversed(parts))
+
+    def format(self, value: MoneyModel[Any], decimals: Optional[int] = None) -> str:
+        currency = value._currency
+        key: Any = currency
+        if currency is not None and not isinstance(currency, str):
+            key = (currency.ticker, currency.decimal_digits)
+        pattern = self._patterns.get(key)
+        if pattern is None:
+            pattern = self._patterns[key] = self._pattern(currency)
+
+        currency_decimals, prefix, suffix, negative_prefix, negative_suffix = pattern
+        if decimals is None:
+            decimals = currency_decimals
+        if decimals is None:
+            amount = value.amount_as_string()
+        else:
+            amount = _render_amount(value._amount, decimals, decimals)
+
+        if amount[0] == "-":
+            amount = amount[1:]
+            prefix, suffix = negative_prefix, negative_suffix
+
+        integral, _, fraction = amount.partition(".")
+        if fraction:
+            return f"{prefix}{self._group(integral)}{self._data.decimal_symbol}{fraction}{suffix}"
+        return f"{prefix}{self._group(integral)}{suffix}"
+
+    def format_many(self, values: Iterable[MoneyModel[Any]], decimals: Optional[int] = None) -> List[str]:
+        format_ = self.format
+        return [format_(value, decimals) for value in values]
+
+
+@lru_cache(maxsize=256)
+def get_formatter(locale: str, currency_display: str = "symbol") -> LocaleFormatter:
+    return LocaleFormatter(locale, currency_display=currency_display)
+
+
+def format_money(
+    value: MoneyModel[Any], locale: str, decimals: Optional[int] = None, currency_display: str = "symbol"
+) -> str:
+    return get_formatter(locale, currency_display).format(value, decimals)
+
+
+def format_many(
+    values: Iterable[MoneyModel[Any]], locale: str, decimals: Optional[int] = None, currency_display: str = "symbol"
+) -> List[str]:
+    return get_formatter(locale, currency_display).format_many(values, decimals)
+
+
+# Currencies for symbols that are used by more than one currency (for example "$"), when parsing without a locale that
+# uses the symbol. Symbols that aren't listed here (for example "kr") must be resolved by the locale or the 'symbols'
+# argument.
+_ambiguous_symbol_defaults = {
+    "$": "USD",
+    "¥": "JPY",
+}
+
+_minus_signs = "-\u2212"
+_space_characters = " \u00a0\u202f"
+_highest_supported_amount = Decimal(HIGHEST_SUPPORTED_AMOUNT)
+
+
+@lru_cache(maxsize=1)
+def _symbol_currencies() -> Dict[str, Optional[str]]:
+    # symbol -> currency code for all symbols known from the locale table, where ambiguous symbols map to None unless
+    # there's a default currency for the symbol
+    candidates: Dict[str, FrozenSet[str]] = {}
+    symbol_tables = [_currency_symbols] + [data.currency_symbols for data in _locales()[0].values()]
+    for table in symbol_tables:
+        for ticker, symbol in table.items():
+            candidates[symbol] = candidates.get(symbol, frozenset()) | {ticker}
+
+    output: Dict[str, Optional[str]] = {}
+    for symbol, tickers in candidates.items():
+        output[symbol] = next(iter(tickers)) if len(tickers) == 1 else _ambiguous_symbol_defaults.get(symbol)
+    return output
+
+
+@lru_cache(maxsize=1024)
+def _currency(ticker: str) -> BaseCurrencyType:
+    return get_currency(ticker)
+
+
+class LocaleParser:
+    __slots__ = ("locale", "symbols", "_decimal_symbol", "_group_symbols", "_grouping", "_regex", "_group_regex")
+
+    def __init__(self, locale: Optional[str] = None, symbols: Optional[Dict[str, str]] = None) -> None:
+        # without a locale, amounts are parsed with "." as decimal symbol and "," as group symbol
+        data = _locales()[0][_normalized_locale(locale)] if locale is not None else None
+        self.locale = data.locale if data is not None else None
+
+        self.symbols = dict(_symbol_currencies())
+        if data is not None:
+            self.symbols.update({symbol: ticker for ticker, symbol in data.currency_symbols.items()})
+        if symbols:
+            self.symbols.update({symbol: str(ticker).upper() for symbol, ticker in symbols.items()})
+
+        self._decimal_symbol = data.decimal_symbol if data is not None else "."
+        group_symbol = data.group_symbol if data is not None else ","
+        if group_symbol in _space_characters:
+            self._group_symbols = _space_characters
+        elif group_symbol == "’":
+            self._group_symbols = "’'"
+        else:
+            self._group_symbols = group_symbol
+        self._grouping = (data.primary_grouping, data.secondary_grouping) if data is not None else (3, 3)
+
+        space = f"[{_space_characters}]*"
+        sign = f"[{_minus_signs}+]"
+        currency = "|".join(map(re.escape, sorted(self.symbols, key=lambda symbol: (-len(symbol), symbol))))
+        currency = f"(?:{currency}|[A-Za-z]{{3,4}}\\b)"
+        group = f"[{re.escape(self._group_symbols)}]"
+        self._group_regex = re.compile(group)
+        number = f"[0-9]+(?:{group}[0-9]+)*(?:{re.escape(self._decimal_symbol)}[0-9]+)?"
+        self._regex: Pattern[str] = re.compile(
+            rf"(?P<sign_1>{sign})?{space}(?P<prefix>{currency})?{space}(?P<sign_2>{sign})?{space}"
+            rf"(?P<number>{number}){space}(?P<suffix>{currency})?"
+        )
+
+    def __repr__(self) -> str:
+        return f'<stockholm.LocaleParser: "{self.locale}">'
+
+    def _amount(self, number: str) -> str:
+        integral, _, fraction = number.partition(self._decimal_symbol)
+        parts = self._group_regex.split(integral) if len(integral) > 3 else [integral]
+        if len(parts) > 1:
+            # groups must follow the grouping sizes of the locale, for example "12,34,567" for en_IN
+            primary, secondary = self._grouping
+            if (
+                len(parts[-1]) != primary
+                or any(len(part) != secondary for part in parts[1:-1])
+                or not 0 < len(parts[0]) <= secondary
+            ):
+                raise ConversionError("Input value cannot be used as monetary amount")
+            integral = "".join(parts)
+        return f"{integral}.{fraction}" if fraction else integral
+
+    def parse(self, value: str, currency: Optional[Any] = None, cls: Type[MoneyModel[Any]] = Money) -> MoneyModel[Any]:
+        match = self._regex.fullmatch(value.strip())
+        if match is None:
+            raise ConversionError("Input value cannot be used as monetary amount")
+
+        sign_1, prefix, sign_2, number, suffix = match.group("sign_1", "prefix", "sign_2", "number", "suffix")
+        if (prefix and suffix) or (sign_1 and sign_2) or (sign_2 and not prefix):
+            raise ConversionError("Input value cannot be used as monetary amount")
+
+        symbol = prefix or suffix
+        ticker: Optional[str] = None
+        if symbol:
+            ticker = self.symbols.get(symbol, "")
+            if ticker is None:
+                raise ConversionError(f"Ambiguous currency symbol in input value: {symbol!r}")
+            ticker = ticker or symbol.upper()
+
+        output_currency: Optional[BaseCurrencyType] = _currency(ticker) if ticker else None
+        if currency is not None:
+            currency_code = currency.ticker if isinstance(currency, BaseCurrencyType) else str(currency).upper()
+            if output_currency is not None and output_currency.ticker != currency_code:
+                raise ConversionError("Mismatching currency in input value and 'currency' argument")
+            if output_currency is None:
+                output_currency = currency if isinstance(currency, BaseCurrencyType) else _currency(currency_code)
+
+        if output_currency is not None and issubclass(cls, NumericType):
+            raise ConversionError("Rates and numbers does not have a currency")
+
+        amount = Decimal(self._amount(number))
+        if amount > _highest_supported_amount:
+            raise ConversionError(f"Input amount is too high, max value is {HIGHEST_SUPPORTED_AMOUNT}")
+        if (sign_1 or sign_2 or "+") in _minus_signs:
+            amount = amount.copy_negate()
+        return cast(MoneyModel[Any], cls._create(_normalized_zero(amount), output_currency))
+
+    def parse_many(
+        self, values: Iterable[str], currency: Optional[Any] = None, cls: Type[MoneyModel[Any]] = Money
+    ) -> List[MoneyModel[Any]]:
+        parse = self.parse
+        return [parse(value, currency, cls) for value in values]
+
+
+def _symbols_key(symbols: Optional[Dict[str, str]]) -> Optional[Tuple[Tuple[str, str], ...]]:
+    return tuple(sorted(symbols.items())) if symbols else None
+
+
+@lru_cache(maxsize=256)
+def _parser(locale: Optional[str], symbols: Optional[Tuple[Tuple[str, str], ...]]) -> LocaleParser:
+    return LocaleParser(locale, symbols=dict(symbols) if symbols else None)
+
+
+def get_parser(locale: Optional[str] = None, symbols: Optional[Dict[str, str]] = None) -> LocaleParser:
+    return _parser(locale, _symbols_key(symbols))
+
+
+def parse_money(
+    value: str,
+    locale: Optional[str] = None,
+    currency: Optional[Any] = None,
+    symbols: Optional[Dict[str, str]] = None,
+    cls: Type[MoneyModel[Any]] = Money,
+) -> MoneyModel[Any]:
+    return _parser(locale, _symbols_key(symbols)).parse(value, currency, cls)
+
+
+def parse_many(
+    values: Iterable[str],
+    locale: Optional[str] = None,
+    currency: Optional[Any] = None,
+    symbols: Optional[Dict[str, str]] = None,
+    cls: Type[MoneyModel[Any]] = Money,
+) -> List[MoneyModel[Any]]:
+    return _parser(locale, _symbols_key(symbols)).parse_many(values, currency, cls)
@@ -3,11 +3,20 @@ from __future__ import annotations
 import decimal
 import json
 import re
+import sys
 from decimal import ROUND_HALF_UP, Decimal
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast
 
-from .currency import BaseCurrencyType, CurrencyValue, DefaultCurrency, DefaultCurrencyValue
+from . import instrumentation
+from ._pydantic import core_schema
+from .currency import (
+    BaseCurrencyType,
+    CurrencyValue,
+    DefaultCurrency,
+    DefaultCurrencyValue,
+    _without_instance_schemas,
+)
 from .exceptions import ConversionError, CurrencyMismatchError, InvalidOperandError
 from .protobuf import GenericProtobufMessage, MoneyProtobufMessage
 
@@ -23,6 +32,18 @@ LOWEST_SUPPORTED_AMOUNT = "-999999999999999999.999999999"
 
 RoundingContext = decimal.Context(rounding=ROUND_HALF_UP)
 
+_quantize_exponents = tuple(Decimal(f"1e-{decimals}") for decimals in range(UNITS_MAX_LENGTH + NANOS_LENGTH + 1))
+_quantized_zeros = tuple(f"{Decimal(0).quantize(exponent):f}" for exponent in _quantize_exponents)
+
+_nanos_exponent = _quantize_exponents[NANOS_LENGTH]
+
+# Shared instances for common amounts, to avoid keeping an identical Decimal object per value.
+_small_decimals = tuple(Decimal(i) for i in range(101))
+_decimal_zero = _small_decimals[0]
+_nanos_per_unit = 10**NANOS_LENGTH
+_units_limit = 10**UNITS_MAX_LENGTH
+_units_and_nanos_keys = frozenset(("units", "nanos", "currency_code"))
+
 _parse_format_specifier_regex = re.compile(
     r"""\A
 (?:
@@ -41,6 +62,146 @@ _parse_format_specifier_regex = re.compile(
 )
 
 
+def _render_amount(amount: Decimal, min_decimals: int, max_decimals: int) -> str:
+    if 0 <= min_decimals < len(_quantize_exponents):
+        value = amount.quantize(_quantize_exponents[min_decimals], ROUND_HALF_UP)
+    else:
+        value = amount.quantize(Decimal(f"1e-{min_decimals}"), ROUND_HALF_UP)
+
+    if max_decimals > min_decimals and value != amount:
+        if 0 <= max_decimals < len(_quantize_exponents):
+            max_value = amount.quantize(_quantize_exponents[max_decimals], ROUND_HALF_UP)
+        else:
+            max_value = amount.quantize(Decimal(f"1e-{max_decimals}"), ROUND_HALF_UP)
+        if max_value != value:
+            return f"{max_value:f}".rstrip("0")
+
+    if not value:
+        if 0 <= min_decimals < len(_quantized_zeros):
+            return _quantized_zeros[min_decimals]
+        return f"{Decimal(0).quantize(Decimal(f'1e-{min_decimals}')):f}"
+    return f"{value:f}"
+
+
+class _FormatSpec:
+    __slots__ = ("type", "fill", "align", "sign", "minimumwidth", "precision", "thousands_sep", "zeropad", "pad")
+
+    def __init__(self, format_spec: str) -> None:
+        m = _parse_format_specifier_regex.match(format_spec)
+        if m is None:
+            raise ValueError(f"Invalid format specifier: {format_spec}")
+
+        format_dict = m.groupdict()
+
+        fill = format_dict["fill"]
+        align = format_dict["align"]
+        zeropad = format_dict["zeropad"] is not None
+        if zeropad:
+            if fill is not None:
+                raise ValueError(f"Fill character conflicts with '0' in format specifier: {format_spec}")
+            if align is not None:
+                raise ValueError(f"Alignment conflicts with '0' in format specifier: {format_spec}")
+            fill = "0"
+            align = ">"
+
+        format_type = format_dict["type"] or "s"
+        precision = int(format_dict["precision"]) if format_dict["precision"] is not None else None
+        if format_type == "d":
+            format_type = "f"
+            precision = 0
+
+        if format_type not in ("m", "M", "f", "F"):
+            if format_dict["sign"]:
+                raise ValueError("Sign not allowed in string format specifier")
+            if zeropad or format_dict["align"] == "=":
+                raise ValueError("'=' alignment not allowed in string format specifier")
+            if format_dict["thousands_sep"]:
+                raise ValueError("Cannot specify ',' in string format specifier")
+
+        self.type = format_type
+        self.fill = fill or " "
+        self.align = align or ">"
+        self.sign = format_dict["sign"] or "-"
+        self.minimumwidth = int(format_dict["minimumwidth"] or 0)
+        self.precision = precision
+        self.thousands_sep = format_dict["thousands_sep"] or ""
+        self.zeropad = zeropad or format_dict["align"] == "="
+
+        # numeric values given an explicit alignment are padded after the currency has been added
+        self.pad = ""
+        if self.minimumwidth and not self.zeropad:
+            self.pad = "after" if format_dict["align"] else "before"
+            if format_type not in ("m", "M", "f", "F") and not format_dict["align"]:
+                self.pad = ""
+
+    def render(self, money: MoneyModel[Any]) -> str:
+        format_type = self.type
+
+        if format_type == "s":
+            output = money.as_string()
+        elif format_type == "c":
+            output = str(money._currency or "")
+        elif format_type == "C":
+            output = ""
+        else:
+            output = self._render_amount(money)
+
+        if self.pad == "after":
+            output = f"{output:{self.fill}{self.align}{self.minimumwidth}}"
+
+        return output
+
+    def _render_amount(self, money: MoneyModel[Any]) -> str:
+        with decimal.localcontext(RoundingContext):
+            if self.precision is not None:
+                output = money.amount_as_string(min_decimals=self.precision, max_decimals=self.precision)
+            else:
+                output = money.amount_as_string()
+
+        negative = output.startswith("-")
+
+        if self.thousands_sep:
+            integral, separator, decimals = output.partition(".")
+            if len(integral) - negative > 3:
+                output = f"{int(integral):{self.thousands_sep}d}{separator}{decimals}"
+
+        fill = self.fill
+        sign = self.sign
+        minimumwidth = self.minimumwidth
+
+        if self.zeropad:
+            if negative:
+                output = f"-{output[1:].rjust(minimumwidth - 1, fill)}"
+            else:
+                output = output.rjust(minimumwidth, fill)
+                if sign != "-":
+                    if output.startswith(fill) and not output.startswith("0."):
+                        output = f"{sign}{output[1:]}"
+                    else:
+                        output = f"{sign}{output}"
+        elif sign != "-" and not negative:
+            output = f"{sign}{output}"
+
+        if self.pad == "before":
+            output = f"{output:{fill}{self.align}{minimumwidth}}"
+
+        if money._currency:
+            if self.type == "m":
+                output = f"{output} {money._currency}"
+            elif self.type == "M":
+                output = f"{money._currency} {output}"
+
+        return output
+
+
+@lru_cache(maxsize=512)
+def _compiled_format_spec(format_spec: str) -> _FormatSpec:
+    return _FormatSpec(format_spec)
+
+
+instrumentation.register_cache("format_spec", _compiled_format_spec)
+
+
 MoneyType = TypeVar("MoneyType", bound="MoneyModel")
 ProtobufMessageType = TypeVar("ProtobufMessageType", bound=GenericProtobufMessage)
 
@@ -50,6 +211,18 @@ class MoneyModel(Generic[MoneyType]):
     _amount: Decimal
     _currency: Optional[Union[CurrencyValue, str]]
 
+    _asdict_default_keys: Tuple[str, ...] = ("value", "units", "nanos", "currency_code")
+    _asdict_key_handlers: Dict[str, Callable[[Any, Tuple[int, int]], Optional[Union[str, int, bool]]]] = {
+        "value": lambda money, _: money.value,
+        "units": lambda _, units_and_nanos: units_and_nanos[0],
+        "nanos": lambda _, units_and_nanos: units_and_nanos[1],
+        "amount": lambda money, _: money.amount_as_string(),
+        "currency": lambda money, _: money.currency_code,
+        "currency_code": lambda money, _: money.currency_code,
+        "from_sub_units": lambda *_: False,
+        "sub_units": lambda money, _: money.to_sub_units().amount_as_string(min_decimals=0),
+    }
+
     @classmethod
     def sort(cls, iterable: Iterable, reverse: bool = False) -> Iterable:
         return sorted(iterable, key=lambda x: x if isinstance(x, cls) else cls(x), reverse=reverse)
@@ -72,6 +245,33 @@ class MoneyModel(Generic[MoneyType]):
             ),
         )
 
+    @classmethod
+    def asdict_many(
+        cls, iterable: Iterable, keys: Optional[Union[List[str], Tuple[str, ...]]] = None
+    ) -> List[Dict[str, Optional[Union[str, int, bool]]]]:
+        exporter = _asdict_exporter(cls, tuple(keys) if keys is not None else cls._asdict_default_keys)
+        return [exporter(e if isinstance(e, cls) else cls(e)) for e in iterable]
+
+    @classmethod
+    def as_json_many(cls, iterable: Iterable, keys: Optional[Union[List[str], Tuple[str, ...]]] = None) -> str:
+        return json.dumps(cls.asdict_many(iterable, keys=keys))
+
+    @classmethod
+    def as_protobuf_many(
+        cls, iterable: Iterable, proto_class: Type[ProtobufMessageType] = MoneyProtobufMessage
+    ) -> List[ProtobufMessageType]:
+        encoder = _protobuf_encoder(cls, proto_class)
+        return [proto_class(**encoder(e if isinstance(e, cls) else cls(e))) for e in iterable]
+
+    @classmethod
+    def extend_protobuf(
+        cls, repeated_field: Any, iterable: Iterable, proto_class: Type[GenericProtobufMessage] = MoneyProtobufMessage
+    ) -> None:
+        encoder = _protobuf_encoder(cls, proto_class)
+        add = repeated_field.add
+        for e in iterable:
+            add(**encoder(e if isinstance(e, cls) else cls(e)))
+
     @classmethod
     def _is_unknown_amount_type(
         cls, amount: Optional[Union[MoneyType, "MoneyModel[Any]", Decimal, int, float, str, object]]
@@ -89,6 +289,33 @@ class MoneyModel(Generic[MoneyType]):
     ) -> MoneyType:
         return cls(amount=amount, currency=currency, from_sub_units=True, value=value, **kwargs)
 
+    @classmethod
+    def _create(
+        cls: Type[MoneyType], amount: Decimal, currency: Optional[Union[CurrencyValue, str]] = None
+    ) -> MoneyType:
+        money = object.__new__(cls)
+        object.__setattr__(money, "_amount", amount)
+        object.__setattr__(money, "_currency", currency)
+        return money
+
+    @classmethod
+    def _from_units_and_nanos(
+        cls: Type[MoneyType], units: int, nanos: int, currency: Optional[Union[CurrencyValue, str]] = None
+    ) -> MoneyType:
+        if type(units) is not int or type(nanos) is not int:
+            raise ConversionError("Invalid values for 'units' and 'nanos'")
+        if (units > 0 and nanos < 0) or (units < 0 and nanos > 0):
+            raise ConversionError("Invalid values for 'units' and 'nanos'")
+        if not -_nanos_per_unit < nanos < _nanos_per_unit or not -_units_limit < units < _units_limit:
+            raise ConversionError("Invalid values for 'units' and 'nanos'")
+
+        if isinstance(currency, str):
+            currency = _normalized_currency_code(currency)
+        elif currency is not None and not isinstance(currency, BaseCurrencyType):
+            raise ConversionError("Invalid 'currency' value")
+
+        return cast(MoneyType, cls._create(Decimal(units * _nanos_per_unit + nanos).scaleb(-NANOS_LENGTH), currency))
+
     @classmethod
     def from_dict(cls: Type[MoneyType], input_dict: Dict) -> MoneyType:
         return cls(**input_dict)
@@ -106,22 +333,49 @@ class MoneyModel(Generic[MoneyType]):
         if input_value is not None and isinstance(input_value, bytes):
             input_value = proto_class.FromString(input_value)
 
-        return cls(
-            **{
-                k: getattr(input_value, k)
-                for k in (
-                    "value",
-                    "units",
-                    "nanos",
-                    "amount",
-                    "currency",
-                    "currency_code",
-                    "from_sub_units",
-                    "sub_units",
+        if isinstance(input_value, GenericProtobufMessage):
+            fields = _protobuf_message_fields(input_value.__class__)
+            if fields == _google_type_money_fields:
+                return cast(
+                    MoneyType,
+                    cls._from_units_and_nanos(
+                        getattr(input_value, "units"),
+                        getattr(input_value, "nanos"),
+                        getattr(input_value, "currency_code"),
+                    ),
                 )
-                if hasattr(input_value, k)
-            }
-        )
+            return cls(**{k: getattr(input_value, k) for k in fields})
+
+        return cls(**{k: getattr(input_value, k) for k in _protobuf_input_keys if hasattr(input_value, k)})
+
+    @classmethod
+    def from_bytes(
+        cls: Type[MoneyType], input_value: Union[bytes, bytearray, memoryview], offset: int = 0
+    ) -> MoneyType:
+        from . import binary
+
+        return cast(MoneyType, binary.unpack(input_value, offset, cls=cls))
+
+    @classmethod
+    def parse(
+        cls: Type[MoneyType],
+        value: str,
+        locale: Optional[str] = None,
+        currency: Optional[Union[CurrencyValue, str]] = None,
+        symbols: Optional[Dict[str, str]] = None,
+    ) -> MoneyType:
+        # parses localized amounts with currency symbols, for example "$1,234.56" or "1 234,56 kr" (locale="sv_SE")
+        from .locale import parse_money
+
+        return cast(MoneyType, parse_money(value, locale, currency=currency, symbols=symbols, cls=cls))
+
+    @classmethod
+    def from_protobuf_many(
+        cls: Type[MoneyType],
+        iterable: Iterable[Union[str, bytes, object]],
+        proto_class: Type[GenericProtobufMessage] = MoneyProtobufMessage,
+    ) -> List[MoneyType]:
+        return [cast(MoneyType, cls.from_protobuf(message, proto_class=proto_class)) for message in iterable]
 
     @classmethod
     def from_proto(
@@ -142,6 +396,9 @@ class MoneyModel(Generic[MoneyType]):
         currency_code: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
+        if instrumentation.enabled:
+            instrumentation.increment("init_inputs", _init_input_kind(amount, units, nanos, value))
+
         validate_amounts = []
 
         if units is not None or nanos is not None:
@@ -238,24 +495,7 @@ class MoneyModel(Generic[MoneyType]):
                 pass
 
         if amount is not None and isinstance(amount, GenericProtobufMessage):
-            amount = str(
-                self.__class__.from_dict(
-                    {
-                        k: getattr(amount, k)
-                        for k in (
-                            "value",
-                            "units",
-                            "nanos",
-                            "amount",
-                            "currency",
-                            "currency_code",
-                            "from_sub_units",
-                            "sub_units",
-                        )
-                        if hasattr(amount, k)
-                    }
-                )
-            )
+            amount = str(self.__class__.from_protobuf(amount))
 
         if Money._is_unknown_amount_type(amount):
             try:
@@ -297,7 +537,7 @@ class MoneyModel(Generic[MoneyType]):
                 amount = str(amount)
 
         if amount is not None and isinstance(amount, int) and not isinstance(amount, bool):
-            output_amount = Decimal(amount)
+            output_amount = _small_decimals[amount] if 0 <= amount < len(_small_decimals) else Decimal(amount)
         elif amount is not None and isinstance(amount, float):
             output_amount = Decimal(str(amount))
         elif amount is not None and isinstance(amount, str) and amount.strip():
@@ -378,8 +618,10 @@ class MoneyModel(Generic[MoneyType]):
         if output_currency and not re.match(r"^[A-Za-z]+$", str(output_currency)):
             raise ConversionError("Invalid 'currency' or 'currency_code'")
 
-        if output_amount == 0 and output_amount.is_signed():
-            output_amount = Decimal(0)
+        if isinstance(output_currency, str):
+            output_currency = sys.intern(output_currency)
+
+        output_amount = _normalized_zero(output_amount)
 
         if any([output_amount != a for a in validate_amounts]):
             raise ConversionError("Values in input arguments does not match")
@@ -415,15 +657,24 @@ class MoneyModel(Generic[MoneyType]):
 
         return units_str, nanos_str
 
+    @property
+    def _units_and_nanos(self) -> Tuple[int, int]:
+        total_nanos = int(self._amount.quantize(_nanos_exponent, ROUND_HALF_UP).scaleb(NANOS_LENGTH))
+        if total_nanos < 0:
+            units, nanos = divmod(-total_nanos, _nanos_per_unit)
+            return -units, -nanos
+        units, nanos = divmod(total_nanos, _nanos_per_unit)
+        return units, nanos
+
     @property
     def units(self) -> int:
-        units, _ = self._amount_tuple
-        return int(units)
+        units, _ = self._units_and_nanos
+        return units
 
     @property
     def nanos(self) -> int:
-        _, nanos = self._amount_tuple
-        return int(nanos)
+        _, nanos = self._units_and_nanos
+        return nanos
 
     @property
     def value(self) -> str:
@@ -446,24 +697,7 @@ class MoneyModel(Generic[MoneyType]):
     def asdict(
         self, keys: Union[List[str], Tuple[str, ...]] = ("value", "units", "nanos", "currency_code")
     ) -> Dict[str, Optional[Union[str, int, bool]]]:
-        output: Dict[str, Optional[Union[str, int, bool]]] = {}
-        for key in keys:
-            if key == "value":
-                output[key] = self.value
-            elif key == "units":
-                output[key] = self.units
-            elif key == "nanos":
-                output[key] = self.nanos
-            elif key == "amount":
-                output[key] = self.amount_as_string()
-            elif key in ("currency", "currency_code"):
-                output[key] = self.currency_code
-            elif key == "from_sub_units":
-                output[key] = False
-            elif key == "sub_units":
-                output[key] = self.to_sub_units().amount_as_string(min_decimals=0)
-
-        return output
+        return _asdict_exporter(self.__class__, tuple(keys))(self)
 
     def as_dict(
         self, keys: Union[List[str], Tuple[str, ...]] = ("value", "units", "nanos", "currency_code")
@@ -501,20 +735,13 @@ class MoneyModel(Generic[MoneyType]):
     def json(self, keys: Union[List[str], Tuple[str, ...]] = ("value", "units", "nanos", "currency_code")) -> str:
         return self.as_json(keys=keys)
 
-    def as_protobuf(self, proto_class: Type[ProtobufMessageType] = MoneyProtobufMessage) -> ProtobufMessageType:
-        message: ProtobufMessageType = proto_class()
+    def to_bytes(self) -> bytes:
+        from . import binary
 
-        values = self.asdict(keys=tuple(proto_class.DESCRIPTOR.fields_by_name.keys()))
-        for k, v in values.items():
-            if v is None:
-                continue
-            if hasattr(message, k):
-                try:
-                    setattr(message, k, type(getattr(message, k))(v))
-                except TypeError:  # pragma: no cover
-                    pass
+        return binary.pack(self)
 
-        return message
+    def as_protobuf(self, proto_class: Type[ProtobufMessageType] = MoneyProtobufMessage) -> ProtobufMessageType:
+        return proto_class(**_protobuf_encoder(self.__class__, proto_class)(self))
 
     def as_proto(self, proto_class: Type[ProtobufMessageType] = MoneyProtobufMessage) -> ProtobufMessageType:
         return self.as_protobuf(proto_class=proto_class)
@@ -563,35 +790,26 @@ class MoneyModel(Generic[MoneyType]):
         raise AttributeError("Attributes of monetary amounts cannot be deleted")
 
     def amount_as_string(self, min_decimals: Optional[int] = None, max_decimals: Optional[int] = None) -> str:
-        if min_decimals is None and max_decimals is None:
-            if self._currency and isinstance(self._currency, BaseCurrencyType):
-                min_decimals = self._currency.decimal_digits
-            min_decimals = DEFAULT_MIN_DECIMALS if min_decimals is None else min_decimals
-            max_decimals = max(min_decimals, DEFAULT_MAX_DECIMALS)
-        elif min_decimals is None and max_decimals is not None:
-            if self._currency and isinstance(self._currency, BaseCurrencyType):
-                min_decimals = self._currency.decimal_digits
-            min_decimals = DEFAULT_MIN_DECIMALS if min_decimals is None else min_decimals
-            min_decimals = min(min_decimals, max_decimals)
-        elif min_decimals is not None and max_decimals is None:
+        if min_decimals is None:
+            currency = self._currency
+            if currency is None or type(currency) is str or not currency:
+                min_decimals = DEFAULT_MIN_DECIMALS
+            elif isinstance(currency, BaseCurrencyType):
+                min_decimals = currency.decimal_digits
+            else:
+                min_decimals = DEFAULT_MIN_DECIMALS
+
+            if max_decimals is None:
+                max_decimals = max(min_decimals, DEFAULT_MAX_DECIMALS)
+            else:
+                min_decimals = min(min_decimals, max_decimals)
+        elif max_decimals is None:
             max_decimals = max(min_decimals, DEFAULT_MAX_DECIMALS)
 
-        min_decimals = cast(int, min_decimals)
-        max_decimals = cast(int, max_decimals)
         if min_decimals > max_decimals:
             raise ValueError("Invalid values for min_decimals and max_decimals")
 
-        amount = self._amount.quantize(Decimal(f"1e-{min_decimals}"), ROUND_HALF_UP)
-        if amount == 0:
-            amount = Decimal(0).quantize(Decimal(f"1e-{min_decimals}"))
-        if max_decimals > min_decimals and amount != self._amount.quantize(
-            Decimal(f"1e-{max_decimals}"), ROUND_HALF_UP
-        ):
-            amount = self._amount.quantize(Decimal(f"1e-{max_decimals}"), ROUND_HALF_UP)
-            value = f"{amount:f}".rstrip("0")
-        else:
-            value = f"{amount:f}"
-        return value
+        return _render_amount(self._amount, min_decimals, max_decimals)
 
     def __repr__(self) -> str:
         return f'<stockholm.{self.__class__.__name__}: "{self}">'
@@ -602,104 +820,7 @@ class MoneyModel(Generic[MoneyType]):
     def __format__(self, format_spec: str) -> str:
         if not format_spec:
             return str(self)
-
-        m = _parse_format_specifier_regex.match(format_spec)
-        if m is None:
-            raise ValueError(f"Invalid format specifier: {format_spec}")
-
-        format_dict = m.groupdict()
-
-        fill = format_dict["fill"]
-        align = format_dict["align"]
-        zeropad = format_dict["zeropad"] is not None
-        if zeropad:
-            if fill is not None:
-                raise ValueError(f"Fill character conflicts with '0' in format specifier: {format_spec}")
-            if align is not None:
-                raise ValueError(f"Alignment conflicts with '0' in format specifier: {format_spec}")
-            fill = "0"
-            align = ">"
-        fill = fill or " "
-        align = align or ">"
-
-        sign = format_dict["sign"] or "-"
-
-        minimumwidth = int(format_dict["minimumwidth"] or 0)
-        precision = int(format_dict["precision"]) if format_dict["precision"] is not None else None
-
-        thousands_sep = format_dict["thousands_sep"] if format_dict["thousands_sep"] is not None else ""
-
-        output = ""
-
-        if format_dict["type"] == "c":
-            output = str(self._currency or "")
-
-        if format_dict["type"] == "d":
-            format_dict["type"] = "f"
-            precision = 0
-
-        with decimal.localcontext(RoundingContext):
-            if format_dict["type"] in ("m", "M", "f", "F"):
-                if precision is not None:
-                    output = self.amount_as_string(min_decimals=precision, max_decimals=precision)
-                else:
-                    output = self.amount_as_string()
-
-                output_amount = Money(output).amount
-
-                if thousands_sep and (output_amount >= 1000 or output_amount <= -1000):
-                    integral = int(output.split(".")[0])
-                    try:
-                        decimals = output.split(".")[1]
-                        output = f"{integral:{thousands_sep}.0f}.{decimals}"
-                    except IndexError:
-                        output = f"{integral:{thousands_sep}.0f}"
-
-                if format_dict["align"] == "=":
-                    format_dict["align"] = ""
-                    zeropad = True
-
-                if zeropad:
-                    if output.startswith("-"):
-                        output = output[1:].rjust(minimumwidth - 1, fill)
-                        output = f"-{output}"
-                    else:
-                        output = output.rjust(minimumwidth, fill)
-                    if sign != "-" and output_amount >= 0:
-                        if output.startswith(fill) and not output.startswith("0."):
-                            output = f"{sign}{output[1:]}"
-                        else:
-                            output = f"{sign}{output}"
-                elif sign != "-" and output_amount >= 0:
-                    output = f"{sign}{output}"
-
-                if not zeropad and not format_dict["align"] and align and fill and minimumwidth:
-                    output = f"{output:{fill}{align}{minimumwidth}}"
-
-                zeropad = False
-                sign = ""
-                thousands_sep = ""
-
-                if self._currency:
-                    if format_dict["type"] == "m":
-                        output = f"{output} {self._currency}"
-                    elif format_dict["type"] == "M":
-                        output = f"{self._currency} {output}"
-            elif format_dict["type"] in ("s", "", None):
-                format_dict["type"] = "s"
-                output = self.as_string()
-
-        if sign and format_dict["sign"]:
-            raise ValueError("Sign not allowed in string format specifier")
-        if zeropad or format_dict["align"] == "=":
-            raise ValueError("'=' alignment not allowed in string format specifier")
-        if thousands_sep:
-            raise ValueError("Cannot specify ',' in string format specifier")
-
-        if format_dict["align"] and align and fill and minimumwidth:
-            output = f"{output:{fill}{align}{minimumwidth}}"
-
-        return output
+        return _compiled_format_spec(format_spec).render(self)
 
     def __hash__(self) -> int:
         return hash((f"stockholm.{self.__class__.__name__}", str(self._amount), self._currency))
@@ -709,6 +830,8 @@ class MoneyModel(Generic[MoneyType]):
 
     def _convert_other(self, other: Any, allow_currency_mismatch: bool = False) -> MoneyType:
         if not isinstance(other, Money):
+            if instrumentation.enabled:
+                instrumentation.increment("conversion_fallbacks", _input_kind(other))
             try:
                 converted_other: MoneyType = cast(MoneyType, self.__class__(other))
             except ConversionError as ex:
@@ -724,6 +847,8 @@ class MoneyModel(Generic[MoneyType]):
             and converted_other._currency
             and self._currency != converted_other._currency
         ):
+            if instrumentation.enabled:
+                instrumentation.increment("currency_mismatches")
             raise CurrencyMismatchError("Unable to perform operations on values with differing currencies")
 
         return converted_other
@@ -733,7 +858,22 @@ class MoneyModel(Generic[MoneyType]):
         currency = other._currency if not currency and other._currency and isinstance(other, BaseCurrencyType) else None
         return currency or self._currency or other._currency
 
+    def _comparable_amount(self, other: Any) -> Optional[Union[Decimal, int]]:
+        other_type = type(other)
+        if other_type is type(self):
+            currency = self._currency
+            other_currency = other._currency
+            if currency is other_currency or currency is None or other_currency is None:
+                return cast(Decimal, other._amount)
+        elif other_type is int and -_units_limit < other < _units_limit:
+            return cast(int, other)
+        return None
+
     def __eq__(self, other: Any) -> bool:
+        other_amount = self._comparable_amount(other)
+        if other_amount is not None:
+            return self._amount == other_amount
+
         try:
             converted_other = self._convert_other(other, allow_currency_mismatch=True)
         except (ConversionError, InvalidOperandError):
@@ -750,20 +890,28 @@ class MoneyModel(Generic[MoneyType]):
         return not self == other
 
     def __lt__(self, other: Any) -> bool:
-        converted_other = self._convert_other(other)
-        return self._amount < converted_other._amount
+        other_amount = self._comparable_amount(other)
+        if other_amount is None:
+            other_amount = self._convert_other(other)._amount
+        return self._amount < other_amount
 
     def __le__(self, other: Any) -> bool:
-        converted_other = self._convert_other(other)
-        return self._amount <= converted_other._amount
+        other_amount = self._comparable_amount(other)
+        if other_amount is None:
+            other_amount = self._convert_other(other)._amount
+        return self._amount <= other_amount
 
     def __gt__(self, other: Any) -> bool:
-        converted_other = self._convert_other(other)
-        return self._amount > converted_other._amount
+        other_amount = self._comparable_amount(other)
+        if other_amount is None:
+            other_amount = self._convert_other(other)._amount
+        return self._amount > other_amount
 
     def __ge__(self, other: Any) -> bool:
-        converted_other = self._convert_other(other)
-        return self._amount >= converted_other._amount
+        other_amount = self._comparable_amount(other)
+        if other_amount is None:
+            other_amount = self._convert_other(other)._amount
+        return self._amount >= other_amount
 
     def __add__(self, other: Any) -> MoneyType:
         cls: Type[MoneyType] = self.__class__ if self.__class__ == other.__class__ else Money
@@ -909,8 +1057,11 @@ class MoneyModel(Generic[MoneyType]):
 
     def __reduce__(
         self,
-    ) -> Tuple[Type[MoneyType], Tuple[str, Optional[Union[CurrencyValue, str]]]]:
-        return cast(Type[MoneyType], self.__class__), (str(self._amount), self._currency)
+    ) -> Tuple[Callable[..., Any], Tuple[Type[MoneyType], str, Optional[Union[CurrencyValue, str]]]]:
+        currency = self._currency
+        if type(currency) is str:
+            currency = sys.intern(currency)
+        return _unpickle, (cast(Type[MoneyType], self.__class__), str(self._amount), currency)
 
     def __copy__(self) -> MoneyModel[MoneyType]:
         return self
@@ -918,18 +1069,27 @@ class MoneyModel(Generic[MoneyType]):
     def __deepcopy__(self, memo: Dict) -> MoneyModel[MoneyType]:
         return self
 
+    def __composite_values__(self) -> Tuple[Decimal, Optional[str]]:
+        # column values (amount and currency code) when used as a composite attribute in SQLAlchemy models
+        return self._amount, self.currency_code
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls,
         _source_type: Any,
         _handler: Any,
     ) -> Any:
+        return core_schema(cls, cls._build_pydantic_core_schema)
+
+    @classmethod
+    def _build_pydantic_core_schema(cls) -> Dict[str, Any]:
+        from_units_and_nanos = cls._from_units_and_nanos
+
         def validate_money(value: Any) -> MoneyModel[MoneyType]:
+            if type(value) is dict and value.keys() <= _units_and_nanos_keys and ("units" in value or "nanos" in value):
+                return from_units_and_nanos(value.get("units", 0), value.get("nanos", 0), value.get("currency_code"))
             return cls(value)
 
-        def serialize(value: MoneyModel[MoneyType]) -> Dict:
-            return value.asdict()
-
         money_validator_function_schema = {
             "type": "function-plain",
             "function": {"type": "no-info", "function": validate_money},
@@ -1027,20 +1187,11 @@ class MoneyModel(Generic[MoneyType]):
             )
         ]
 
-        def json_schema(schema: Any) -> Any:
-            if isinstance(schema, dict):
-                if schema.get("type") == "is-instance":
-                    return None
-                return {k: json_schema(v) for k, v in schema.items() if json_schema(v) is not None}
-            elif isinstance(schema, list):
-                return [json_schema(v) for v in schema if json_schema(v) is not None]
-            return schema
-
         return {
             "type": "json-or-python",
             "json_schema": {
                 "type": "union",
-                "choices": json_schema(schemas),
+                "choices": _without_instance_schemas(schemas),
             },
             "python_schema": {
                 "type": "union",
@@ -1050,11 +1201,24 @@ class MoneyModel(Generic[MoneyType]):
                 ],
                 "strict": True,
             },
-            "serialization": {
-                "type": "function-plain",
-                "function": serialize,
-                "when_used": "json-unless-none",
-            },
+            "serialization": cls._pydantic_serialization_schema(),
+        }
+
+    @classmethod
+    def _pydantic_serialization_schema(cls, mode: str = "dict") -> Dict[str, Any]:
+        if mode == "string":
+            return {"type": "to-string", "when_used": "json-unless-none"}
+        keys: Tuple[str, ...]
+        if mode == "dict":
+            keys = ("value", "units", "nanos", "currency_code")
+        elif mode == "units_and_nanos":
+            keys = ("units", "nanos", "currency_code")
+        else:
+            raise ValueError(f"Invalid serialization mode: {mode!r}")
+        return {
+            "type": "function-plain",
+            "function": _asdict_exporter(cls, keys),
+            "when_used": "json-unless-none",
         }
 
     @classmethod
@@ -1062,7 +1226,138 @@ class MoneyModel(Generic[MoneyType]):
         return handler(value)
 
 
+@lru_cache(maxsize=1024)
+def _normalized_currency_code(currency_code: str) -> Optional[str]:
+    output_currency = currency_code.strip()
+    if not output_currency:
+        return None
+    if not re.match(r"^[A-Za-z]+$", output_currency):
+        raise ConversionError("Invalid 'currency' or 'currency_code'")
+    return output_currency.upper() if len(output_currency) == 3 else output_currency
+
+
+instrumentation.register_cache("currency_code", _normalized_currency_code)
+
+
+def _input_kind(value: Any) -> str:
+    if value is None:
+        return "none"
+    if isinstance(value, MoneyModel):
+        return "money"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, Decimal):
+        return "decimal"
+    if isinstance(value, str):
+        return "json" if value[:1] == "{" else "str"
+    if isinstance(value, bytes):
+        return "json" if value[:1] == b"{" else "protobuf_bytes"
+    if isinstance(value, dict):
+        return "dict"
+    if isinstance(value, GenericProtobufMessage):
+        return "protobuf"
+    if hasattr(value, "amount"):
+        return "duck_typed"
+    return "other"
+
+
+def _init_input_kind(amount: Any, units: Optional[int], nanos: Optional[int], value: Any) -> str:
+    if units is not None or nanos is not None:
+        return "units_and_nanos"
+    if amount is None and value is not None:
+        return _input_kind(value)
+    return _input_kind(amount)
+
+
+def _normalized_zero(amount: Decimal) -> Decimal:
+    # negative zeros and zeros without decimals are replaced with a shared zero instance, as in the Money constructor –
+    # also used for amounts which are passed directly to _create()
+    if amount == 0 and (amount.is_signed() or not amount.as_tuple().exponent):
+        return _decimal_zero
+    return amount
+
+
+def _unpickle(cls: Type[MoneyModel[Any]], amount: str, currency: Optional[Union[CurrencyValue, str]] = None) -> Any:
+    return cls._create(Decimal(amount), currency)
+
+
+_AsDictExporter = Callable[[MoneyModel[Any]], Dict[str, Optional[Union[str, int, bool]]]]
+
+
+def _asdict_exporter(cls: Type[MoneyModel[Any]], keys: Tuple[str, ...]) -> _AsDictExporter:
+    return _compiled_asdict_exporter((cls, keys))
+
+
+@lru_cache(maxsize=256)
+def _compiled_asdict_exporter(cls_and_keys: Tuple[Type[MoneyModel[Any]], Tuple[str, ...]]) -> _AsDictExporter:
+    cls, keys = cls_and_keys
+    key_handlers = cls._asdict_key_handlers
+    handlers = tuple((key, key_handlers[key]) for key in keys if key in key_handlers)
+    decompose = any(key in ("units", "nanos") for key, _ in handlers)
+    no_decomposition = (0, 0)
+
+    def exporter(money: MoneyModel[Any]) -> Dict[str, Optional[Union[str, int, bool]]]:
+        units_and_nanos = money._units_and_nanos if decompose else no_decomposition
+        return {key: handler(money, units_and_nanos) for key, handler in handlers}
+
+    return exporter
+
+
+_protobuf_input_keys = ("value", "units", "nanos", "amount", "currency", "currency_code", "from_sub_units", "sub_units")
+_google_type_money_fields = ("units", "nanos", "currency_code")
+_protobuf_message_fields_cache: Dict[Type[GenericProtobufMessage], Tuple[str, ...]] = {}
+
+
+def _protobuf_message_fields(message_class: Type[GenericProtobufMessage]) -> Tuple[str, ...]:
+    fields = _protobuf_message_fields_cache.get(message_class)
+    if fields is None:
+        fields_by_name = getattr(message_class, "DESCRIPTOR").fields_by_name
+        fields = tuple(k for k in _protobuf_input_keys if k in fields_by_name)
+        _protobuf_message_fields_cache[message_class] = fields
+    return fields
+
+
+_ProtobufEncoder = Callable[[MoneyModel[Any]], Dict[str, Any]]
+_protobuf_encoders: Dict[Tuple[Type[MoneyModel[Any]], Type[GenericProtobufMessage]], _ProtobufEncoder] = {}
+
+
+def _protobuf_encoder(cls: Type[MoneyModel[Any]], proto_class: Type[GenericProtobufMessage]) -> _ProtobufEncoder:
+    cached_encoder = _protobuf_encoders.get((cls, proto_class))
+    if cached_encoder is not None:
+        return cached_encoder
+
+    default_message = proto_class()
+    field_types: Dict[str, Type] = {}
+    for k in getattr(proto_class, "DESCRIPTOR").fields_by_name.keys():
+        default_value = getattr(default_message, k, None)
+        if isinstance(default_value, (bool, int, float, str, bytes)):
+            field_types[k] = default_value.__class__
+
+    if field_types.keys() == set(_google_type_money_fields) and field_types.keys() <= cls._asdict_key_handlers.keys():
+
+        def encoder(money: MoneyModel[Any]) -> Dict[str, Any]:
+            units, nanos = money._units_and_nanos
+            if not money._currency:
+                return {"units": units, "nanos": nanos}
+            return {"currency_code": str(money._currency), "units": units, "nanos": nanos}
+
+    else:
+        exporter = _asdict_exporter(cls, tuple(field_types))
+
+        def encoder(money: MoneyModel[Any]) -> Dict[str, Any]:
+            return {k: field_types[k](v) for k, v in exporter(money).items() if v is not None}
+
+    _protobuf_encoders[(cls, proto_class)] = encoder
+    return encoder
+
+
 class Money(MoneyModel["Money"]):
+    __slots__ = ()
+
     def to_currency(self, currency: Optional[Union[CurrencyValue, str]]) -> "Money":
         return cast("Money", super().to_currency(currency=currency))
 
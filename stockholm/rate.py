@@ -1,11 +1,11 @@
 import decimal
 import json
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 from .currency import CurrencyValue, DefaultCurrency, DefaultCurrencyValue
 from .exceptions import ConversionError
-from .money import Money, MoneyModel, MoneyType
+from .money import Money, MoneyModel, MoneyType, _asdict_exporter, _render_amount
 
 DEFAULT_MIN_DECIMALS = 0
 DEFAULT_MAX_DECIMALS = 9
@@ -14,8 +14,18 @@ RoundingContext = decimal.Context(rounding=ROUND_HALF_UP)
 
 
 class NumericType(MoneyModel[MoneyType]):
+    __slots__ = ()
+
     _currency: None
 
+    _asdict_default_keys = ("value", "units", "nanos")
+    _asdict_key_handlers = {
+        "value": lambda number, _: number.value,
+        "amount": lambda number, _: number.value,
+        "units": lambda _, units_and_nanos: units_and_nanos[0],
+        "nanos": lambda _, units_and_nanos: units_and_nanos[1],
+    }
+
     @classmethod
     def from_sub_units(
         cls,
@@ -27,6 +37,14 @@ class NumericType(MoneyModel[MoneyType]):
     ) -> MoneyType:
         raise ConversionError("Rates and numbers cannot be created from sub units")
 
+    @classmethod
+    def _from_units_and_nanos(
+        cls: Type[MoneyType], units: int, nanos: int, currency: Optional[Union[CurrencyValue, str]] = None
+    ) -> MoneyType:
+        if currency:
+            raise ConversionError("Rates and numbers does not have a currency")
+        return cast(MoneyType, super()._from_units_and_nanos(units, nanos))
+
     def __init__(
         self,
         amount: Optional[Union[MoneyType, MoneyModel[Any], Decimal, Dict, int, float, str, object]] = None,
@@ -67,16 +85,7 @@ class NumericType(MoneyModel[MoneyType]):
     def asdict(
         self, keys: Union[List[str], Tuple[str, ...]] = ("value", "units", "nanos")
     ) -> Dict[str, Optional[Union[str, int]]]:
-        output: Dict[str, Optional[Union[str, int]]] = {}
-        for key in keys:
-            if key in ("value", "amount"):
-                output[key] = self.value
-            elif key == "units":
-                output[key] = self.units
-            elif key == "nanos":
-                output[key] = self.nanos
-
-        return output
+        return _asdict_exporter(self.__class__, tuple(keys))(self)
 
     def as_dict(
         self, keys: Union[List[str], Tuple[str, ...]] = ("value", "units", "nanos")
@@ -94,7 +103,9 @@ class NumericType(MoneyModel[MoneyType]):
             min_decimals = DEFAULT_MIN_DECIMALS
         if max_decimals is None:
             max_decimals = DEFAULT_MAX_DECIMALS
-        return super().amount_as_string(min_decimals=min_decimals, max_decimals=max_decimals)
+        if min_decimals > max_decimals:
+            raise ValueError("Invalid values for min_decimals and max_decimals")
+        return _render_amount(self._amount, min_decimals, max_decimals)
 
     def to_currency(self, currency: Optional[Union[CurrencyValue, str]]) -> Money:
         return Money(self, currency=currency)
@@ -110,11 +121,11 @@ class NumericType(MoneyModel[MoneyType]):
 
 
 class Rate(NumericType["Rate"]):
-    pass
+    __slots__ = ()
 
 
 ExchangeRate = Rate
 
 
 class Number(NumericType["Number"]):
-    pass
+    __slots__ = ()
@@ -0,0 +1,127 @@
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union, cast
+
+from sqlalchemy import BigInteger, Numeric, and_, or_
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Composite, composite
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BindParameter, ColumnElement
+from sqlalchemy.sql.operators import OperatorType
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import ConversionError, CurrencyMismatchError
+from .money import Money, MoneyModel
+from .sqlite import to_nanos
+
+__all__ = [
+    "STORAGE_TYPES",
+    "SQLMoney",
+    "MoneyComparator",
+    "money_composite",
+]
+
+STORAGE_TYPES = ("nanos", "numeric")
+
+_nanos_exponent = Decimal(1).scaleb(-9)
+
+
+@lru_cache(maxsize=1024)
+def _currency(value: str) -> Optional[BaseCurrencyType]:
+    ticker = value.strip()
+    if not ticker:
+        return None
+    if not ticker.isalpha():
+        raise ConversionError(f"Invalid currency code: {value!r}")
+    return get_currency(ticker.upper())
+
+
+class SQLMoney(TypeDecorator):
+    # column type for monetary amounts, stored as integer nanos (BIGINT) or as NUMERIC with 9 decimals. with a fixed
+    # currency the loaded values get that currency and values of other currencies are rejected when bound – without a
+    # currency, store the currency code in a separate column (see money_composite)
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, storage: str = "nanos", currency: Optional[Union[BaseCurrencyType, str]] = None) -> None:
+        if storage not in STORAGE_TYPES:
+            raise ValueError(f"Invalid value for 'storage': {storage!r}")
+        super().__init__()
+        self.storage = storage
+        self.currency = str(currency).strip().upper() if currency else None
+        self._nanos = storage == "nanos"
+        self._currency = _currency(self.currency) if self.currency else None
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if self._nanos:
+            return dialect.type_descriptor(BigInteger())
+        return dialect.type_descriptor(Numeric(precision=27, scale=9, asdecimal=True))
+
+    def coerce_compared_value(self, op: Optional[OperatorType], value: Any) -> TypeEngine[Any]:
+        # compared values (for example `Account.balance > Money("100 EUR")`) are bound through this type as well
+        return self
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[Union[int, Decimal]]:
+        if value is None:
+            return None
+        money: MoneyModel = value if isinstance(value, MoneyModel) else Money(value)
+        if self.currency is not None and money._currency and money.currency_code != self.currency:
+            raise CurrencyMismatchError(f"Cannot store a {money.currency_code} amount in a {self.currency} column")
+        if self._nanos:
+            return to_nanos(money)
+        return money._amount.quantize(_nanos_exponent, ROUND_HALF_UP)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[Money]:
+        if value is None:
+            return None
+        if self._nanos:
+            return Money._create(Decimal(value).scaleb(-9), self._currency)
+        return Money._create(value if isinstance(value, Decimal) else Decimal(str(value)), self._currency)
+
+
+def _compose(amount: Any, currency: Optional[str]) -> Optional[Money]:
+    if amount is None:
+        return None
+    if isinstance(amount, MoneyModel):
+        amount = amount._amount
+    elif not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return Money._create(amount, _currency(currency) if currency else None)
+
+
+class MoneyComparator(Composite.Comparator):
+    # amounts are only comparable within the same currency – ordering operators compare the amount column and require
+    # the currency column to equal the currency of the compared value
+    def _compare(self, operator: OperatorType, other: Any) -> ColumnElement[bool]:
+        amount_column, currency_column = self._comparable_elements
+        if other is None:
+            if operator is operators.ne:
+                return amount_column.isnot(None)
+            return amount_column.is_(None)
+        if not isinstance(other, MoneyModel):
+            other = Money(other)
+
+        comparison: ColumnElement[bool] = operator(amount_column, other._amount)
+        if not other._currency:
+            return comparison
+        if operator is operators.ne:
+            return or_(comparison, currency_column != other.currency_code)
+        return and_(comparison, currency_column == other.currency_code)
+
+    def _bulk_update_tuples(self, value: Any) -> List[Tuple[Any, Any]]:
+        # values for `update(Account).values(balance=Money(...))` statements
+        if isinstance(value, BindParameter):
+            value = value.value
+        if value is None:
+            return [(column, None) for column in self._comparable_elements]
+        if not isinstance(value, MoneyModel):
+            value = Money(value)
+        return list(zip(self._comparable_elements, value.__composite_values__()))
+
+
+def money_composite(amount_column: Any, currency_column: Any, **kwargs: Any) -> Composite[Money]:
+    # maps an amount column (preferably a SQLMoney column without currency) and a currency code column to a single
+    # attribute holding Money values
+    kwargs.setdefault("comparator_factory", MoneyComparator)
+    return composite(cast(Callable[..., Money], _compose), amount_column, currency_column, **kwargs)
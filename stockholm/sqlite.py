@@ -0,0 +1,148 @@
+import sqlite3
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .currency import BaseCurrencyType, get_currency
+from .exceptions import ConversionError, CurrencyMismatchError
+from .money import Money, MoneyModel
+
+__all__ = [
+    "NANOS",
+    "MONEY",
+    "to_nanos",
+    "from_nanos",
+    "money_params",
+    "insert_many",
+    "read_money",
+    "MoneySum",
+    "register",
+    "connect",
+]
+
+# declared column types (or column name types with PARSE_COLNAMES) handled by the registered converters – NANOS for
+# amounts stored as integer nanos and MONEY for "<amount> <currency>" text such as the output of money_sum()
+NANOS = "NANOS"
+MONEY = "MONEY"
+
+_nanos_exponent = Decimal(1).scaleb(-9)
+_int64_min = -(2**63)
+_int64_max = 2**63 - 1
+
+
+@lru_cache(maxsize=1024)
+def _currency(value: str) -> Optional[BaseCurrencyType]:
+    ticker = value.strip()
+    if not ticker:
+        return None
+    if not ticker.isalpha():
+        raise ConversionError(f"Invalid currency code: {value!r}")
+    return get_currency(ticker.upper())
+
+
+def to_nanos(value: MoneyModel) -> int:
+    # SQLite integers are 64-bit – amounts up to about ±9.2 billion can be stored as nanos
+    nanos = int(value._amount.quantize(_nanos_exponent, ROUND_HALF_UP).scaleb(9))
+    if not _int64_min <= nanos <= _int64_max:
+        raise ConversionError("Amount is too large to be stored as a 64-bit integer of nanos")
+    return nanos
+
+
+def from_nanos(nanos: int, currency: Optional[Union[BaseCurrencyType, str]] = None) -> Money:
+    if isinstance(currency, str):
+        currency = _currency(currency)
+    return Money._create(Decimal(nanos).scaleb(-9), currency)
+
+
+def _convert_nanos(value: bytes) -> Money:
+    return Money._create(Decimal(int(value)).scaleb(-9))
+
+
+def _convert_money(value: bytes) -> Money:
+    return Money(value.decode("utf-8"))
+
+
+def _adapt(value: MoneyModel) -> int:
+    # a bound parameter holds a single value – to not lose the currency, amounts with a currency are bound as nanos
+    # with the currency code as a separate parameter, see money_params()
+    if value._currency is not None:
+        raise ConversionError(
+            "Money objects with a currency cannot be bound as a single parameter, use money_params() to bind the "
+            "amount and currency code as separate parameters"
+        )
+    return to_nanos(value)
+
+
+def money_params(values: Iterable[MoneyModel]) -> Iterator[Tuple[int, Optional[str]]]:
+    for value in values:
+        yield to_nanos(value), value.currency_code
+
+
+def _quote(identifier: str) -> str:
+    return '"{}"'.format(identifier.replace('"', '""'))
+
+
+def insert_many(
+    connection: Union[sqlite3.Connection, sqlite3.Cursor],
+    table: str,
+    values: Iterable[MoneyModel],
+    amount_column: str = "amount",
+    currency_column: str = "currency",
+) -> int:
+    statement = f"INSERT INTO {_quote(table)} ({_quote(amount_column)}, {_quote(currency_column)}) VALUES (?, ?)"
+    return connection.executemany(statement, money_params(values)).rowcount
+
+
+def read_money(rows: Iterable[Sequence[Any]], amount_index: int = 0, currency_index: int = 1) -> Iterator[Money]:
+    create = Money._create
+    for row in rows:
+        nanos = row[amount_index]
+        if nanos is None:
+            raise ConversionError("Missing value in amount column")
+        ticker = row[currency_index]
+        yield create(Decimal(nanos).scaleb(-9), _currency(ticker) if ticker else None)
+
+
+class MoneySum:
+    # aggregate function summing integer nanos exactly – money_sum(amount) or money_sum(amount, currency), returning
+    # the sum as "<amount> <currency>" text which isn't limited to the range of 64-bit integers. currency codes are
+    # compared case insensitively and rows with and without a currency can't be summed together.
+    def __init__(self) -> None:
+        self.total = 0
+        self.count = 0
+        self.currency: Optional[str] = None
+
+    def step(self, nanos: Optional[int], currency: Optional[str] = None) -> None:
+        if nanos is None:
+            return
+        currency = (currency or "").strip().upper() or None
+        if self.count and currency != self.currency:
+            raise CurrencyMismatchError(
+                f"Cannot sum amounts of different currencies: {self.currency or 'no currency'}, "
+                f"{currency or 'no currency'}"
+            )
+        self.currency = currency
+        self.total += nanos
+        self.count += 1
+
+    def finalize(self) -> Optional[str]:
+        if not self.count:
+            return None
+        return str(from_nanos(self.total, self.currency))
+
+
+def register(connection: Optional[sqlite3.Connection] = None) -> None:
+    # adapters and converters are registered globally in the sqlite3 module, the aggregate per connection. the adapter
+    # only binds amounts without a currency (as nanos) – see money_params() for amounts with a currency
+    sqlite3.register_adapter(Money, _adapt)
+    sqlite3.register_converter(NANOS, _convert_nanos)
+    sqlite3.register_converter(MONEY, _convert_money)
+    if connection is not None:
+        connection.create_aggregate("money_sum", -1, MoneySum)  # type: ignore[arg-type]
+
+
+def connect(database: str, **kwargs: Any) -> sqlite3.Connection:
+    kwargs.setdefault("detect_types", sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+    connection: sqlite3.Connection = sqlite3.connect(database, **kwargs)
+    register(connection)
+    return connection
@@ -0,0 +1,208 @@
+from decimal import Decimal
+from itertools import chain
+from typing import IO, Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ._io import write_lines
+from .money import MoneyModel
+
+__all__ = [
+    "render_table",
+    "render_columns",
+    "write_table",
+]
+
+CellFormat = Optional[Union[str, Callable[[Any], str]]]
+FormatSpecs = Optional[Union[str, Callable[[Any], str], Sequence[CellFormat]]]
+
+_numeric_types = (MoneyModel, Decimal, int, float)
+
+
+def _split_amount(value: str, decimal_point: str) -> Tuple[str, str]:
+    # split a rendered amount at its decimal point, or right after the last digit if there are no decimals
+    end = len(value)
+    while end and not value[end - 1].isdigit():
+        end -= 1
+    start = end
+    while start and value[start - 1].isdigit():
+        start -= 1
+    if (
+        start > len(decimal_point)
+        and value.endswith(decimal_point, 0, start)
+        and value[start - 1 - len(decimal_point)].isdigit()
+    ):
+        end = start - len(decimal_point)
+    return value[:end], value[end:]
+
+
+def _cell_formats(format_specs: FormatSpecs, count: int) -> List[CellFormat]:
+    if format_specs is None or isinstance(format_specs, str) or callable(format_specs):
+        return [format_specs] * count
+    cell_formats = list(format_specs)
+    return cell_formats + [None] * (count - len(cell_formats))
+
+
+def _render_cell(value: Any, cell_format: CellFormat) -> str:
+    if value is None:
+        return ""
+    if cell_format is None:
+        return str(value)
+    if isinstance(cell_format, str):
+        return format(value, cell_format) if isinstance(value, MoneyModel) else str(value)
+    return cell_format(value)
+
+
+def _is_numeric(value: Any) -> bool:
+    return isinstance(value, _numeric_types) and not isinstance(value, bool)
+
+
+def _align_amount(left: str, right: str, left_width: int, right_width: int, width: int) -> str:
+    # amounts are aligned on their decimal point – integer part right justified and decimals left justified
+    return f"{left.rjust(left_width)}{right.ljust(right_width)}".rjust(width)
+
+
+def _render_headers(
+    headers: Sequence[str], widths: Sequence[int], numeric_columns: Sequence[bool], separator: str
+) -> str:
+    return separator.join(
+        header.rjust(width) if numeric else header.ljust(width)
+        for header, width, numeric in zip(headers, widths, numeric_columns)
+    ).rstrip()
+
+
+def render_table(
+    rows: Iterable[Sequence[Any]],
+    headers: Optional[Sequence[str]] = None,
+    format_specs: FormatSpecs = None,
+    widths: Optional[Sequence[int]] = None,
+    separator: str = "  ",
+    decimal_point: str = ".",
+) -> Iterator[str]:
+    if widths is not None:
+        yield from _render_table_streaming(rows, headers, format_specs, widths, separator, decimal_point)
+        return
+
+    column_count = len(headers) if headers is not None else 0
+    rendered_rows: List[List[Union[str, Tuple[str, str]]]] = []
+    text_widths: List[int] = [len(header) for header in headers] if headers is not None else []
+    left_widths: List[int] = [0] * column_count
+    right_widths: List[int] = [0] * column_count
+    numeric_columns: List[bool] = [False] * column_count
+    cell_formats: List[CellFormat] = _cell_formats(format_specs, column_count)
+
+    for row in rows:
+        if len(row) > column_count:
+            added_count = len(row) - column_count
+            text_widths += [0] * added_count
+            left_widths += [0] * added_count
+            right_widths += [0] * added_count
+            numeric_columns += [False] * added_count
+            cell_formats = _cell_formats(format_specs, len(row))
+            column_count = len(row)
+
+        rendered_row: List[Union[str, Tuple[str, str]]] = []
+        for index, value in enumerate(row):
+            cell = _render_cell(value, cell_formats[index])
+            if _is_numeric(value):
+                left, right = _split_amount(cell, decimal_point)
+                if len(left) > left_widths[index]:
+                    left_widths[index] = len(left)
+                if len(right) > right_widths[index]:
+                    right_widths[index] = len(right)
+                numeric_columns[index] = True
+                rendered_row.append((left, right))
+            else:
+                if len(cell) > text_widths[index]:
+                    text_widths[index] = len(cell)
+                rendered_row.append(cell)
+        rendered_rows.append(rendered_row)
+
+    column_widths = [
+        max(text_width, left_width + right_width)
+        for text_width, left_width, right_width in zip(text_widths, left_widths, right_widths)
+    ]
+
+    if headers is not None:
+        yield _render_headers(headers, column_widths, numeric_columns, separator)
+
+    for rendered_row in rendered_rows:
+        cells: List[str] = []
+        for index, rendered_cell in enumerate(rendered_row):
+            if isinstance(rendered_cell, tuple):
+                left, right = rendered_cell
+                cells.append(_align_amount(left, right, left_widths[index], right_widths[index], column_widths[index]))
+            else:
+                cells.append(rendered_cell.ljust(column_widths[index]))
+        yield separator.join(cells).rstrip()
+
+
+def _render_table_streaming(
+    rows: Iterable[Sequence[Any]],
+    headers: Optional[Sequence[str]],
+    format_specs: FormatSpecs,
+    widths: Sequence[int],
+    separator: str,
+    decimal_point: str,
+) -> Iterator[str]:
+    cell_formats = _cell_formats(format_specs, len(widths))
+    numeric_columns: List[bool] = [False] * len(widths)
+    right_widths: List[int] = [0] * len(widths)
+
+    # without the full table at hand, numeric columns and the number of decimals to align amounts on are given by the
+    # first row – amounts with more decimals than the amount in the first row will extend past the column width.
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is not None:
+        for index, (value, cell_format) in enumerate(zip(first_row, cell_formats)):
+            if _is_numeric(value):
+                numeric_columns[index] = True
+                right_widths[index] = len(_split_amount(_render_cell(value, cell_format), decimal_point)[1])
+
+    if headers is not None:
+        yield _render_headers(headers, widths, numeric_columns, separator)
+
+    if first_row is None:
+        return
+
+    for row in chain((first_row,), rows):
+        cells: List[str] = []
+        for index, (value, cell_format, width) in enumerate(zip(row, cell_formats, widths)):
+            cell = _render_cell(value, cell_format)
+            if _is_numeric(value):
+                left, right = _split_amount(cell, decimal_point)
+                cells.append(_align_amount(left, right, width - right_widths[index], right_widths[index], width))
+            else:
+                cells.append(cell.ljust(width))
+        yield separator.join(cells).rstrip()
+
+
+def render_columns(
+    columns: Mapping[str, Iterable[Any]],
+    format_specs: Union[FormatSpecs, Mapping[str, CellFormat]] = None,
+    widths: Optional[Sequence[int]] = None,
+    separator: str = "  ",
+    decimal_point: str = ".",
+    headers: bool = True,
+) -> Iterator[str]:
+    if isinstance(format_specs, Mapping):
+        format_specs = [format_specs.get(name) for name in columns.keys()]
+    return render_table(
+        zip(*columns.values()),
+        headers=list(columns.keys()) if headers else None,
+        format_specs=format_specs,
+        widths=widths,
+        separator=separator,
+        decimal_point=decimal_point,
+    )
+
+
+def write_table(
+    fp: IO[str],
+    rows: Iterable[Sequence[Any]],
+    headers: Optional[Sequence[str]] = None,
+    format_specs: FormatSpecs = None,
+    widths: Optional[Sequence[int]] = None,
+    separator: str = "  ",
+    decimal_point: str = ".",
+    chunk_size: int = 1000,
+) -> int:
+    return write_lines(fp, render_table(rows, headers, format_specs, widths, separator, decimal_point), chunk_size)
@@ -10,9 +10,11 @@ from .money import Money, MoneyModel
 from .rate import Number, NumericType
 
 if sys.version_info < (3, 11):
-    from typing_extensions import NotRequired, Required, TypedDict  # pragma: no cover
+    from typing_extensions import Annotated, NotRequired, Required, TypedDict  # pragma: no cover
 else:
-    from typing import NotRequired, Required, TypedDict  # pragma: no cover
+    from typing import Annotated, NotRequired, Required, TypedDict  # pragma: no cover
+
+SERIALIZATION_MODES = ("dict", "string", "units_and_nanos")
 
 SchemaT = TypeVar("SchemaT", bound=Union[MoneyModel, MetaCurrency])
 GetT = TypeVar("GetT")
@@ -40,6 +42,24 @@ class ConvertibleTypeDescriptor(Generic[SchemaT, GetT, SetT]):
         return _source_type.__args__[0].__get_pydantic_core_schema__(_source_type.__args__[0], _handler)
 
 
+class MoneySerializer:
+    __slots__ = ("mode",)
+
+    def __init__(self, mode: str = "dict") -> None:
+        if mode not in SERIALIZATION_MODES:
+            raise ValueError(f"Invalid serialization mode: {mode!r}")
+        self.mode = mode
+
+    def __repr__(self) -> str:
+        return f"MoneySerializer({self.mode!r})"
+
+    def __get_pydantic_core_schema__(self, _source_type: Any, _handler: Callable) -> Any:
+        money_class = getattr(_source_type, "__args__", (_source_type,))[0]
+        if not isinstance(money_class, type) or not issubclass(money_class, MoneyModel):
+            raise TypeError(f"MoneySerializer can't be used with {_source_type!r}")
+        return {**_handler(_source_type), "serialization": money_class._pydantic_serialization_schema(self.mode)}
+
+
 class NumberDictWithAmount(TypedDict):
     amount: Required[Union[Money, MoneyModel[Any], int, float, Decimal, str]]
     units: NotRequired[int]
@@ -198,3 +218,7 @@ ConvertibleToMoneyWithRequiredCurrency = ConvertibleTypeDescriptor[
 
 ConvertibleToCurrencyT = Union[CurrencyValue, str]
 ConvertibleToCurrency = ConvertibleTypeDescriptor[MetaCurrency, BaseCurrency, ConvertibleToCurrencyT]
+
+MoneyAsString = Annotated[Money, MoneySerializer("string")]
+MoneyAsUnitsAndNanos = Annotated[Money, MoneySerializer("units_and_nanos")]
+NumberAsString = Annotated[Number, MoneySerializer("string")]
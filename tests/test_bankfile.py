@@ -0,0 +1,373 @@
+import io
+import mmap
+from typing import Any, List, Optional
+
+import pytest
+
+from stockholm import Currency, Money
+from stockholm.bankfile import (
+    DEFAULT_LAYOUT,
+    BankFileLayout,
+    BankFileWriter,
+    Field,
+    RecordLayout,
+    read_blocks,
+    read_transactions,
+    write_blocks,
+)
+from stockholm.exceptions import BankFileError, ConversionError
+
+HEADER = b"000000000000001     388461894717 OLDSCHOOLFINTECHSOLUTIONS004711%06d\n"
+TRANSACTION = b"471846827769   9173689 9999%09d000272947     %s  - 3336282671946\n"
+TRAILER = b"990000000000001X%06d993%011d%s                            END\n"
+
+
+def block(
+    amounts: List[int],
+    currency: bytes = b"USD",
+    count: Optional[int] = None,
+    total: Optional[int] = None,
+    trailer_currency: Optional[bytes] = None,
+) -> bytes:
+    content = HEADER % (len(amounts) if count is None else count)
+    content += b"".join(TRANSACTION % (amount, currency) for amount in amounts)
+    content += TRAILER % (
+        len(amounts) if count is None else count,
+        sum(amounts) if total is None else total,
+        currency if trailer_currency is None else trailer_currency,
+    )
+    return content
+
+
+def test_read_transactions() -> None:
+    content = b"\n" + block([192000, 824618, 116301])
+    assert list(read_transactions(content)) == [
+        Money("1920.00", "USD"),
+        Money("8246.18", "USD"),
+        Money("1163.01", "USD"),
+    ]
+    assert [str(m) for m in read_transactions(content)] == ["1920.00 USD", "8246.18 USD", "1163.01 USD"]
+    assert all(m.currency is Currency.USD for m in read_transactions(content))
+
+
+def test_read_transactions_example_content() -> None:
+    from tests.examples.bankfile_test import example_content, get_transaction_amounts
+
+    assert list(read_transactions(example_content.encode())) == get_transaction_amounts(example_content)
+
+
+def test_read_blocks() -> None:
+    content = block([100, 250]) + block([1], currency=b"JPY") + block([])
+    blocks = list(read_blocks(content))
+
+    assert len(blocks) == 3
+    assert [b.index for b in blocks] == [1, 2, 3]
+    assert [(b.start_line, b.end_line) for b in blocks] == [(1, 4), (5, 7), (8, 9)]
+    assert [len(b) for b in blocks] == [2, 1, 0]
+    assert all(b.error is None for b in blocks)
+
+    assert blocks[0].minor_units == [100, 250]
+    assert blocks[0].amounts == [Money("1.00", "USD"), Money("2.50", "USD")]
+    assert blocks[0].total == Money("3.50", "USD")
+    assert blocks[0].header == {"transaction_count": 2}
+    assert blocks[0].trailer == {"transaction_count": 2, "total_amount": 350, "currency": Currency.USD}
+
+    assert blocks[1].currency is Currency.JPY
+    assert str(blocks[1].total) == "1 JPY"
+    assert blocks[2].currency is Currency.USD
+    assert blocks[2].amounts == []
+
+
+def test_read_sources(tmp_path: Any) -> None:
+    content = block([100, 250]) + block([1])
+    path = tmp_path / "bankfile.txt"
+    path.write_bytes(content)
+    expected = [Money("1.00", "USD"), Money("2.50", "USD"), Money("0.01", "USD")]
+
+    assert list(read_transactions(path)) == expected
+    assert list(read_transactions(str(path))) == expected
+    assert list(read_transactions(bytearray(content))) == expected
+    assert list(read_transactions(memoryview(content))) == expected
+    assert list(read_transactions(io.BytesIO(content))) == expected
+    assert list(read_transactions(content.splitlines())) == expected
+
+    with open(path, "rb") as fp:
+        assert list(read_transactions(fp)) == expected
+
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert list(read_transactions(mm)) == expected
+
+    with open(path, "r") as fp:
+        with pytest.raises(TypeError):
+            list(read_transactions(fp))
+
+    with pytest.raises(ValueError):
+        list(read_blocks(content, errors="ignore"))
+
+
+@pytest.mark.parametrize(
+    "content, message, line_number",
+    [
+        (block([100, 250], count=3), "Transaction count does not match [header: 3, transactions: 2]", 4),
+        (block([100, 250], total=351), "Sums of amounts differ [trailer: 351, transactions: 350]", 4),
+        (block([100], trailer_currency=b"EUR"), "Currency codes does not match [trailer: EUR, transactions: USD]", 3),
+        (block([100]) + TRANSACTION % (1, b"EUR"), "Transaction record outside of a block", 4),
+        (block([100])[:-71], "Missing trailer record", 2),
+        (block([100]).replace(b"000000100", b"0000001X0"), "Invalid amount in transaction record", 2),
+        (block([100]).replace(b"USD ", b"U$D "), "Invalid trailer record", 3),
+    ],
+)
+def test_errors(content: bytes, message: str, line_number: int) -> None:
+    with pytest.raises(BankFileError) as exc_info:
+        list(read_blocks(content))
+
+    assert isinstance(exc_info.value, ConversionError)
+    assert str(exc_info.value).startswith(message)
+    assert exc_info.value.line_number == line_number
+
+
+def test_mixed_currencies() -> None:
+    content = block([100, 200]).replace(b"USD ", b"EUR ", 1)
+
+    with pytest.raises(BankFileError) as exc_info:
+        list(read_transactions(content))
+
+    assert str(exc_info.value) == "Multiple currency codes within the same block [block 1, line 3]"
+    assert exc_info.value.block == 1
+    assert exc_info.value.line_number == 3
+
+
+def test_collect_errors() -> None:
+    content = block([100]) + block([200, 300], total=1) + block([400], count=2) + block([500])[:-71] + block([600])
+    blocks = list(read_blocks(content, errors="collect"))
+
+    assert [b.index for b in blocks] == [1, 2, 3, 4, 5]
+    assert [str(b.error) if b.error else None for b in blocks] == [
+        None,
+        "Sums of amounts differ [trailer: 1, transactions: 500] [block 2, line 7]",
+        "Transaction count does not match [header: 2, transactions: 1] [block 3, line 10]",
+        "Missing trailer record [block 4, line 12]",
+        None,
+    ]
+    assert [b.error.block for b in blocks if b.error] == [2, 3, 4]
+    assert [m for b in blocks if b.error is None for m in b] == [Money("1.00", "USD"), Money("6.00", "USD")]
+
+    # records outside of any block can't be attributed to a block and are always raised
+    with pytest.raises(BankFileError, match="Trailer record outside of a block"):
+        list(read_blocks(block([100]) + TRAILER % (0, 0, b"USD"), errors="collect"))
+
+
+def test_custom_layout() -> None:
+    layout = BankFileLayout(
+        header=RecordLayout("H", [Field("date", 1, 8), Field("transaction_count", 9, 4, "int")]),
+        transaction=RecordLayout("T", [Field("reference", 1, 6), Field("amount", 8, 8, "amount")]),
+        trailer=RecordLayout("S", [Field("total_amount", 1, 10, "amount"), Field("currency", 11, 3, "currency")]),
+    )
+    content = b"H202401010002\nTref001 00001250\nXcomment\nTref002 00000250\nS0000001500SEK\n"
+
+    blocks = list(read_blocks(content, layout=layout))
+    assert blocks[0].header == {"date": "20240101", "transaction_count": 2}
+    assert blocks[0].amounts == [Money("12.50", "SEK"), Money("2.50", "SEK")]
+    assert blocks[0].currency is Currency.SEK
+    assert layout.transaction.parse(b"Tref001 00001250") == {"reference": "ref001", "amount": 1250}
+
+    with pytest.raises(BankFileError, match="Sums of amounts differ"):
+        list(read_blocks(content.replace(b"S0000001500", b"S0000001501"), layout=layout))
+
+
+def test_layout_validation() -> None:
+    assert DEFAULT_LAYOUT.transaction.field("amount") == DEFAULT_LAYOUT.transaction.first_field("amount")
+    assert DEFAULT_LAYOUT.transaction.field("missing") is None
+
+    with pytest.raises(ValueError):
+        Field("amount", 0, 10, "decimal")
+    with pytest.raises(ValueError):
+        Field("amount", 1, 0)
+    with pytest.raises(ValueError):
+        RecordLayout("", [])
+    with pytest.raises(ValueError):
+        RecordLayout("4", [Field("amount", 0, 9, "amount")])
+    with pytest.raises(ValueError):
+        RecordLayout("4", [Field("amount", 27, 9, "amount")], length=30)
+    with pytest.raises(ValueError):
+        BankFileLayout(DEFAULT_LAYOUT.header, RecordLayout("4", []), DEFAULT_LAYOUT.trailer)
+    with pytest.raises(ValueError):
+        BankFileLayout(DEFAULT_LAYOUT.header, DEFAULT_LAYOUT.transaction, RecordLayout("4", []))
+    with pytest.raises(ValueError):
+        BankFileLayout(DEFAULT_LAYOUT.header, DEFAULT_LAYOUT.transaction, RecordLayout("0", []))
+
+    # layouts changed after they were validated
+    layout = BankFileLayout(DEFAULT_LAYOUT.header, DEFAULT_LAYOUT.transaction, DEFAULT_LAYOUT.trailer)
+    layout.transaction = RecordLayout("4", [])
+    with pytest.raises(BankFileError, match="The transaction record must have an 'amount' field"):
+        BankFileWriter(io.BytesIO(), layout=layout)
+    with pytest.raises(BankFileError, match="The transaction record must have an 'amount' field"):
+        list(read_blocks(b"", layout=layout))
+
+
+def test_write_blocks() -> None:
+    fp = io.BytesIO()
+    line_count = write_blocks(fp, [("USD", [192000, Money("8246.18", "USD"), 116301]), (Currency.JPY, [Money(5)])])
+    content = fp.getvalue()
+
+    assert line_count == 8
+    assert content.splitlines() == [
+        b"00" + b" " * 62 + b"000003",
+        b"4" + b" " * 26 + b"000192000" + b" " * 14 + b"USD" + b" " * 17,
+        b"4" + b" " * 26 + b"000824618" + b" " * 14 + b"USD" + b" " * 17,
+        b"4" + b" " * 26 + b"000116301" + b" " * 14 + b"USD" + b" " * 17,
+        b"99" + b" " * 14 + b"000003" + b" " * 3 + b"00001132919USD" + b" " * 31,
+        b"00" + b" " * 62 + b"000001",
+        b"4" + b" " * 26 + b"000000005" + b" " * 14 + b"JPY" + b" " * 17,
+        b"99" + b" " * 14 + b"000001" + b" " * 3 + b"00000000005JPY" + b" " * 31,
+    ]
+    assert [b.amounts for b in read_blocks(content)] == [
+        [Money("1920.00", "USD"), Money("8246.18", "USD"), Money("1163.01", "USD")],
+        [Money(5, "JPY")],
+    ]
+
+
+def test_write_blocks_path(tmp_path: Any) -> None:
+    path = tmp_path / "bankfile.txt"
+    assert write_blocks(path, [("SEK", range(1, 101))]) == 102
+    assert list(read_transactions(path)) == [Money(i, "SEK", from_sub_units=True) for i in range(1, 101)]
+
+
+def test_writer_buffering() -> None:
+    layout = BankFileLayout(
+        header=RecordLayout("H", [Field("date", 1, 8)]),
+        transaction=RecordLayout("T", [Field("reference", 1, 6), Field("amount", 8, 8, "amount")]),
+        trailer=RecordLayout("S", [Field("total_amount", 1, 10, "amount"), Field("currency", 11, 3, "currency")]),
+    )
+    fp = io.BytesIO()
+
+    with BankFileWriter(fp, layout=layout, buffer_size=64) as writer:
+        writer.begin_block("SEK", header={"date": "20240101"})
+        writer.write_transaction(Money("12.50", "SEK"), fields={"reference": "ref001"})
+        writer.write_transactions([250] * 10)
+        # the header doesn't depend on the transaction count, full chunks are written before the block ends
+        assert fp.getvalue().startswith(b"H20240101\nTref001 00001250\nT       00000250\n")
+        writer.end_block()
+
+    assert writer.line_count == 13
+    assert fp.getvalue().endswith(b"\nS0000003750SEK\n")
+    assert list(read_blocks(fp.getvalue(), layout=layout))[0].total == Money("37.50", "SEK")
+
+    fp = io.BytesIO()
+    with BankFileWriter(fp, buffer_size=64) as writer:
+        writer.begin_block("SEK")
+        writer.write_transactions([250] * 10)
+        # a placeholder header is written until the transaction count is known
+        assert fp.getvalue().startswith(b"00" + b" " * 62 + b"000000\n4")
+        writer.end_block(trailer={"transaction_count": 10})
+        writer.begin_block("SEK", header={"transaction_count": 0})
+        writer.end_block()
+        writer.begin_block("SEK")
+        writer.write_transactions([1, 2])
+        writer.end_block()
+
+    assert fp.getvalue().startswith(b"00" + b" " * 62 + b"000010\n4")
+    assert [len(b) for b in read_blocks(fp.getvalue())] == [10, 0, 2]
+    assert all(b.error is None for b in read_blocks(fp.getvalue()))
+
+
+def test_writer_non_seekable() -> None:
+    class Stream(io.BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    fp = Stream()
+    with BankFileWriter(fp, buffer_size=64) as writer:
+        writer.write_block([100, 200], "SEK", header={"transaction_count": 2})
+        writer.write_block(range(1000), "EUR")
+        writer.write_block([], "SEK")
+
+    blocks = list(read_blocks(fp.getvalue()))
+    assert [(b.header, b.amounts[:2], len(b)) for b in blocks] == [
+        ({"transaction_count": 2}, [Money(1, "SEK"), Money(2, "SEK")], 2),
+        ({"transaction_count": 1000}, [Money(0, "EUR"), Money("0.01", "EUR")], 1000),
+        ({"transaction_count": 0}, [], 0),
+    ]
+
+    fp, seekable_fp = Stream(), io.BytesIO()
+    assert write_blocks(fp, [("SEK", [Money(1, "SEK")]), ("JPY", [5, 10])]) == 7
+    assert write_blocks(seekable_fp, [("SEK", [Money(1, "SEK")]), ("JPY", [5, 10])]) == 7
+    assert fp.getvalue() == seekable_fp.getvalue()
+
+    writer = BankFileWriter(Stream())
+    writer.begin_block("SEK", header={"transaction_count": 3})
+    writer.write_transactions([100, 200])
+    with pytest.raises(BankFileError, match=r"Transaction count does not match \[header: 3, transactions: 2\]"):
+        writer.end_block()
+
+
+def test_writer_block_currency() -> None:
+    fp = io.BytesIO()
+    write_blocks(fp, [(None, [Money("100", "JPY"), 5]), (None, [Money("1.5"), 250]), (None, [])])
+    assert [(b.currency, b.amounts) for b in read_blocks(fp.getvalue())] == [
+        (Currency.JPY, [Money(100, "JPY"), Money(5, "JPY")]),
+        (None, [Money("1.50"), Money("2.50")]),
+        (None, []),
+    ]
+
+    writer = BankFileWriter(io.BytesIO())
+    writer.begin_block(None)
+    with pytest.raises(BankFileError, match=r"Amount with currency in a block without currency: 100.00 JPY \[block 1"):
+        writer.write_transactions([Money(100, "JPY")])
+    with pytest.raises(BankFileError, match="Amount with currency in a block without currency"):
+        write_blocks(io.BytesIO(), [(None, [Money(1), Money(1, "SEK")])])
+
+
+@pytest.mark.parametrize(
+    "amount, message",
+    [
+        (-1, "Amount does not fit in the 'amount' field: -1 [block 1, line 3]"),
+        (10**9, "Amount does not fit in the 'amount' field: 1000000000 [block 1, line 3]"),
+        (Money("1.001", "USD"), "Amount cannot be represented in minor units: 1.001 USD [block 1, line 3]"),
+        (Money("1.00", "EUR"), "Currency codes does not match [block: USD, amount: EUR] [block 1, line 3]"),
+        ("1.00", "Invalid amount: '1.00' [block 1, line 3]"),
+    ],
+)
+def test_writer_errors(amount: Any, message: str) -> None:
+    writer = BankFileWriter(io.BytesIO())
+    writer.begin_block("USD")
+    writer.write_transaction(100)
+
+    with pytest.raises(BankFileError) as exc_info:
+        writer.write_transactions([amount])
+
+    assert str(exc_info.value) == message
+    writer.end_block()
+    assert writer.line_count == 3
+
+
+def test_writer_state_errors() -> None:
+    writer = BankFileWriter(io.BytesIO())
+
+    with pytest.raises(BankFileError, match="Transaction record outside of a block"):
+        writer.write_transaction(100)
+    with pytest.raises(BankFileError, match="Trailer record outside of a block"):
+        writer.end_block()
+
+    writer.begin_block("USD")
+    with pytest.raises(BankFileError, match=r"Missing trailer record \[block 1, line 2\]"):
+        writer.begin_block("USD")
+    with pytest.raises(BankFileError, match="Missing trailer record"):
+        writer.close()
+    with pytest.raises(BankFileError, match=r"Value for field 'currency' exceeds the field length \[block 1, line 2\]"):
+        writer.end_block(trailer={"currency": "SEKX"})
+
+
+def test_render_record() -> None:
+    record = RecordLayout("T", [Field("reference", 1, 6), Field("amount", 8, 8, "amount")], length=20)
+    assert record.record_length == 20
+    assert record.render({"reference": "ref", "amount": 1250}) == b"Tref    00001250    "
+    assert record.render({}) == b"T       00000000    "
+    assert record.parse(record.render({"reference": "ref", "amount": 1250})) == {"reference": "ref", "amount": 1250}
+
+    with pytest.raises(ValueError):
+        record.render({"amount": -1})
+    with pytest.raises(ValueError):
+        record.render({"amount": "1250"})
+    with pytest.raises(ValueError):
+        record.render({"reference": "reference"})
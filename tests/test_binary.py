@@ -0,0 +1,88 @@
+import mmap
+import tempfile
+
+import pytest
+
+import stockholm.binary
+from stockholm import ConversionError, Currency, Money, Number, Rate
+
+
+def test_to_bytes():
+    assert stockholm.binary.RECORD_SIZE == 16
+    assert Money("4711.75 SEK").to_bytes() == b"g\x12\x00\x00\x00\x00\x00\x00\x80\x17\xb4,SEK\x00"
+    assert Money(0).to_bytes() == b"\x00" * 16
+    assert Money("-0.000000001", currency=Currency.DOGE).to_bytes() == b"\x00" * 8 + b"\xff\xff\xff\xffDOGE"
+    assert len(Money("999999999999999999.999999999 USDC").to_bytes()) == 16
+    assert Rate("0.073").to_bytes() == Money("0.073").to_bytes()
+
+
+def test_from_bytes():
+    assert Money.from_bytes(b"g\x12\x00\x00\x00\x00\x00\x00\x80\x17\xb4,SEK\x00") == Money("4711.75 SEK")
+    assert Money.from_bytes(b"g\x12\x00\x00\x00\x00\x00\x00\x80\x17\xb4,SEK\x00").currency == "SEK"
+    assert Money.from_bytes(b"\x00" * 16).currency is None
+    assert Money.from_bytes(b"\xff" * 4 + b"g\x12\x00\x00\x00\x00\x00\x00\x80\x17\xb4,SEK\x00", offset=4) == Money(
+        "4711.75 SEK"
+    )
+
+    for value in (
+        Money("999999999999999999.999999999 USDC"),
+        Money("-999999999999999999.999999999", currency=Currency.JPY),
+        Money("-0.5 EUR"),
+        Money("13384711 JPY"),
+    ):
+        assert Money.from_bytes(value.to_bytes()) == value
+        assert Money.from_bytes(value.to_bytes()).currency_code == value.currency_code
+
+    assert Rate.from_bytes(Rate("-1.5").to_bytes()) == Rate("-1.5")
+    assert isinstance(Number.from_bytes(Number(1).to_bytes()), Number)
+
+    with pytest.raises(ConversionError):
+        Rate.from_bytes(Money("1 SEK").to_bytes())
+    with pytest.raises(ConversionError):
+        Money.from_bytes(b"\x01" + b"\x00" * 7 + b"\xff\xff\xff\xff" + b"\x00" * 4)
+
+
+def test_unsupported_currency():
+    with pytest.raises(ConversionError):
+        Money("1 ABCDE").to_bytes()
+    with pytest.raises(ConversionError):
+        Money(1, currency=Currency("ÅÄÖ")).to_bytes()
+
+
+def test_pack_many():
+    amounts = [Money(f"{i}.{i:02d}", currency="EUR" if i % 2 else "SEK") for i in range(100)]
+    data = stockholm.binary.pack_many(amounts)
+
+    assert len(data) == 100 * stockholm.binary.RECORD_SIZE
+    assert data[16:32] == amounts[1].to_bytes()
+    assert stockholm.binary.unpack_many(data) == amounts
+    assert list(stockholm.binary.iter_unpack(memoryview(data)[160:320])) == amounts[10:20]
+    assert stockholm.binary.unpack(data, 16 * 99) == amounts[99]
+    assert stockholm.binary.pack_many([]) == b""
+    assert stockholm.binary.unpack_many(b"") == []
+
+    buffer = bytearray(32 + 100 * stockholm.binary.RECORD_SIZE)
+    assert stockholm.binary.pack_many_into(buffer, amounts, offset=32) == 100
+    assert bytes(buffer[32:]) == data
+    stockholm.binary.pack_into(buffer, 0, Money("1 USD"))
+    assert stockholm.binary.unpack(buffer) == Money("1 USD")
+
+    assert stockholm.binary.unpack_many(data, cls=Money) == amounts
+    assert stockholm.binary.unpack_many(stockholm.binary.pack_many([Rate(1), Rate(2)]), cls=Rate) == [Rate(1), Rate(2)]
+
+    with pytest.raises(ConversionError):
+        stockholm.binary.unpack_many(data[:-1])
+
+
+def test_unpack_mmap():
+    amounts = [Money(i, currency=Currency.JPY) / 7 for i in range(1000)]
+
+    with tempfile.TemporaryFile() as fp:
+        fp.write(stockholm.binary.pack_many(amounts))
+        fp.flush()
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            unpacked = stockholm.binary.unpack_many(mm)
+
+    assert len(unpacked) == 1000
+    assert unpacked == [Money(amount.asdict()) for amount in amounts]
+    assert Money.sum(unpacked) == Money.sum(Money(amount.asdict()) for amount in amounts)
@@ -2,7 +2,7 @@ from typing import Any
 
 import pytest
 
-from stockholm import CurrencyMismatchError, Money
+from stockholm import BaseCurrency, Currency, CurrencyMismatchError, InvalidOperandError, Money, Number, Rate
 
 
 @pytest.mark.parametrize(
@@ -210,3 +210,43 @@ def test_compare_different_currencies() -> None:
     assert Money(0) or Money(1) or Money(2) == Money(1)
     assert bool(Money(0) and Money(1)) is False
     assert bool(Money(2) and Money(1)) is True
+
+
+def test_compare_same_type_and_currency() -> None:
+    sek = Money("100.50", currency=Currency.SEK)
+
+    assert sek == Money("100.500", currency=Currency.SEK)
+    assert sek == Money("100.50")
+    assert Money("100.50") == sek
+    assert sek != Money("100.51", currency=Currency.SEK)
+    assert sek < Money("100.51", currency=Currency.SEK)
+    assert sek <= Money("100.50")
+    assert sek > Money("-100.50", currency=Currency.SEK)
+    assert sek >= Money("100.50 SEK")
+    assert Money("0 SEK") == Money("0", currency=Currency.USD)
+    assert Money(1, currency=BaseCurrency("XBT", decimal_digits=8)) == Money(1, currency="XBT")
+
+    with pytest.raises(CurrencyMismatchError):
+        sek < Money("100.51", currency=Currency.USD)
+
+    assert Number("0.5") < Number("0.75")
+    assert Rate("0.5") == Rate("0.50")
+    assert Number("0.5") == Rate("0.5")
+    assert sorted([Money(3, "SEK"), Money(-1, "SEK"), Money("2.5", "SEK")]) == [Money(-1), Money("2.5"), Money(3)]
+    assert len({Money("1.00 SEK"), Money("1.00 SEK"), Money("2.00 SEK")}) == 2
+
+
+def test_compare_int() -> None:
+    assert Money(4711, currency="SEK") == 4711
+    assert Money("4711.00", currency="SEK") == 4711
+    assert Money("4711.01", currency="SEK") != 4711
+    assert Money(4711, currency="SEK") > 4710
+    assert Money(4711, currency="SEK") >= 4711
+    assert Money(-1) < 0
+    assert Money(0) <= 0
+    assert Number(1) == 1
+    assert Money(1) != True  # noqa: E712
+
+    assert Money(1) != 10**30
+    with pytest.raises(InvalidOperandError):
+        Money(1) < 10**30
@@ -285,6 +285,28 @@ def test_string_formatting() -> None:
         f"{m:,s}"
 
 
+def test_string_formatting_large_amounts() -> None:
+    m = Money("123456789012345678.5", currency="SEK")
+    assert f"{m:,.1f}" == "123,456,789,012,345,678.5"
+    assert f"{m:_m}" == "123_456_789_012_345_678.50 SEK"
+    assert f"{-m:,d}" == "-123,456,789,012,345,679"
+
+
+def test_string_formatting_cached_format_spec() -> None:
+    values = [Money("1234.5", currency="SEK"), Money("-0.5", currency=Currency.JPY), Money(1000)]
+
+    for _ in range(3):
+        assert [f"{m:>15,.2m}" for m in values] == ["   1,234.50 SEK", "      -0.50 JPY", "       1,000.00"]
+        assert [f"{m:+010.1f}" for m in values] == ["+0001234.5", "-0000000.5", "+0001000.0"]
+        assert [f"{m:c}" for m in values] == ["SEK", "JPY", ""]
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            f"{values[0]:+c}"
+        with pytest.raises(ValueError):
+            f"{values[0]:,s}"
+
+
 def test_string_formatting_sentence() -> None:
     m1 = Money(1352953, "JPY")
     exchange_rate = Decimal("0.08861326")
@@ -1,8 +1,8 @@
 import pickle
 from copy import copy, deepcopy
 
-from stockholm.currency import Currency
-from stockholm.money import Money
+from stockholm.currency import BaseCurrency, Currency
+from stockholm.money import Money, _unpickle
 from stockholm.rate import Number, Rate
 
 
@@ -107,23 +107,29 @@ def test_copy_currency() -> None:
 
 
 def test_reduce() -> None:
-    assert Money(100).__reduce__() == (Money, ("100", None))
-    assert Money(0.01).__reduce__() == (Money, ("0.01", None))
-    assert Money("-100.50 SEK").__reduce__() == (Money, ("-100.50", "SEK"))
-    assert Money(31338559, Currency.USD).__reduce__() == (Money, ("31338559", Currency.USD))
-    assert Money("1012312112312.1412312321", "JPY").__reduce__() == (Money, ("1012312112312.1412312321", "JPY"))
-    assert Money("-1012312112312.1412312321 EUR").__reduce__() == (Money, ("-1012312112312.1412312321", "EUR"))
+    assert Money(100).__reduce__() == (_unpickle, (Money, "100", None))
+    assert Money(0.01).__reduce__() == (_unpickle, (Money, "0.01", None))
+    assert Money("-100.50 SEK").__reduce__() == (_unpickle, (Money, "-100.50", "SEK"))
+    assert Money(31338559, Currency.USD).__reduce__() == (_unpickle, (Money, "31338559", Currency.USD))
+    assert Money("1012312112312.1412312321", "JPY").__reduce__() == (
+        _unpickle,
+        (Money, "1012312112312.1412312321", "JPY"),
+    )
+    assert Money("-1012312112312.1412312321 EUR").__reduce__() == (
+        _unpickle,
+        (Money, "-1012312112312.1412312321", "EUR"),
+    )
 
 
 def test_reduce_numerics() -> None:
-    assert Number(100).__reduce__() == (Number, ("100", None))
-    assert Number(0.01).__reduce__() == (Number, ("0.01", None))
-    assert Number("-100.50").__reduce__() == (Number, ("-100.50", None))
-    assert Number("1012312112312.1412312321").__reduce__() == (Number, ("1012312112312.1412312321", None))
-    assert Number("-1012312112312.1412312321").__reduce__() == (Number, ("-1012312112312.1412312321", None))
+    assert Number(100).__reduce__() == (_unpickle, (Number, "100", None))
+    assert Number(0.01).__reduce__() == (_unpickle, (Number, "0.01", None))
+    assert Number("-100.50").__reduce__() == (_unpickle, (Number, "-100.50", None))
+    assert Number("1012312112312.1412312321").__reduce__() == (_unpickle, (Number, "1012312112312.1412312321", None))
+    assert Number("-1012312112312.1412312321").__reduce__() == (_unpickle, (Number, "-1012312112312.1412312321", None))
 
-    assert Rate(1).__reduce__() == (Rate, ("1", None))
-    assert Rate(31338559.1).__reduce__() == (Rate, ("31338559.1", None))
+    assert Rate(1).__reduce__() == (_unpickle, (Rate, "1", None))
+    assert Rate(31338559.1).__reduce__() == (_unpickle, (Rate, "31338559.1", None))
 
 
 def test_pickle() -> None:
@@ -147,9 +153,9 @@ def test_pickle() -> None:
     n = Number("1012312112312.1412312321")
     data = pickle.dumps(n)
     n2 = pickle.loads(data)
-    assert n2.__reduce__() == (Number, ("1012312112312.1412312321", None))
-    assert copy(n2).__reduce__() == (Number, ("1012312112312.1412312321", None))
-    assert deepcopy(n2).__reduce__() == (Number, ("1012312112312.1412312321", None))
+    assert n2.__reduce__() == (_unpickle, (Number, "1012312112312.1412312321", None))
+    assert copy(n2).__reduce__() == (_unpickle, (Number, "1012312112312.1412312321", None))
+    assert deepcopy(n2).__reduce__() == (_unpickle, (Number, "1012312112312.1412312321", None))
 
 
 def test_copy_list() -> None:
@@ -191,4 +197,61 @@ def test_copy_dict() -> None:
     assert d3["m"].currency == "SEK"
     assert d3["m"].currency is Currency.SEK
     assert str(d3["m"]) == "-5.50 SEK"
-    assert d2["r"].__reduce__() == (Rate, ("25.3", None))
+    assert d2["r"].__reduce__() == (_unpickle, (Rate, "25.3", None))
+
+
+def test_pickle_keeps_exact_amount() -> None:
+    m = Money("-1012312112312.1412312321 EUR")
+    m2 = pickle.loads(pickle.dumps(m))
+
+    assert m2 == m
+    assert str(m2.amount) == "-1012312112312.1412312321"
+    assert hash(m2) == hash(m)
+
+    m = Money("100.50", "SEK")
+    m2 = pickle.loads(pickle.dumps(m))
+    assert str(m2.amount) == "100.50"
+    assert m2.currency == "SEK"
+
+    r = Rate("0.000000000001")
+    r2 = pickle.loads(pickle.dumps(r))
+    assert type(r2) is Rate
+    assert r2.amount == r.amount
+
+
+def test_pickle_list_shares_currency() -> None:
+    values = [Money(f"{i}.25", "".join(("U", "S", "D"))) for i in range(100)]
+    values2 = pickle.loads(pickle.dumps(values))
+
+    assert values2 == values
+    assert all(m.currency is values2[0].currency for m in values2)
+
+
+def test_pickle_legacy_reduce() -> None:
+    # pickled with the previous (Money, (amount, currency)) reduce value
+    data = (
+        b"\x80\x04\x951\x00\x00\x00\x00\x00\x00\x00\x8c\x0fstockholm.money\x94\x8c\x05Money\x94\x93\x94"
+        b"\x8c\x074711.50\x94\x8c\x03SEK\x94\x86\x94R\x94."
+    )
+    m = pickle.loads(data)
+
+    assert m == Money("4711.50 SEK")
+    assert m.currency == "SEK"
+
+
+def test_pickle_currency_object() -> None:
+    currency = BaseCurrency("XBT", decimal_digits=8, interchangeable_with=("BTC",), preferred_ticker="BTC")
+    currency2 = pickle.loads(pickle.dumps(currency))
+
+    assert currency2 == currency
+    assert hash(currency2) == hash(currency)
+    assert currency2.decimal_digits == 8
+    assert currency2.interchangeable_with == ("BTC",)
+    assert currency2.preferred_ticker == "BTC"
+    assert currency2.money(1) == Money("1.00000000 XBT")
+
+    m = pickle.loads(pickle.dumps(Money("0.1 XBT", currency=currency)))
+    assert str(m) == "0.10000000 XBT"
+    assert m.currency == currency
+
+    assert pickle.loads(pickle.dumps(Currency.SEK)) is Currency.SEK
@@ -0,0 +1,152 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from stockholm import ConversionError, Currency, Money, Number
+from stockholm.csv import MoneyColumn, read_money, read_money_columns, write_rows
+
+CONTENT = """id,amount,currency,text
+1,1.50,SEK,first
+2,-2,usd,second
+3,0,EUR,third
+4,1234.50,SEK,fourth
+
+5,1000,JPY,fifth
+"""
+
+
+def test_read_money() -> None:
+    assert list(read_money(io.StringIO(CONTENT), "amount", "currency")) == [
+        Money("1.50", "SEK"),
+        Money("-2", "USD"),
+        Money(0, "EUR"),
+        Money("1234.50", "SEK"),
+        Money(1000, "JPY"),
+    ]
+
+    values = list(read_money(io.StringIO(CONTENT), 1, 2, header=True))
+    assert [str(m) for m in values] == ["1.50 SEK", "-2.00 USD", "0.00 EUR", "1234.50 SEK", "1000 JPY"]
+    assert [m.currency for m in values] == [Currency.SEK, Currency.USD, Currency.EUR, Currency.SEK, Currency.JPY]
+
+
+def test_read_money_default_currency() -> None:
+    content = "1.50\n2\n\n0.001\n"
+    assert list(read_money(io.StringIO(content), 0)) == [Money("1.50"), Money(2), Money("0.001")]
+    assert list(read_money(io.StringIO(content), 0, default_currency="SEK")) == [
+        Money("1.50", "SEK"),
+        Money(2, "SEK"),
+        Money("0.001", "SEK"),
+    ]
+    assert next(read_money(io.StringIO(content), 0, default_currency=Currency.SEK)).currency is Currency.SEK
+    assert next(read_money(io.StringIO("1,\n"), 0, 1, default_currency="NOK")).currency is Currency.NOK
+
+
+def test_read_money_cell_currency() -> None:
+    # a currency written in a cell isn't dropped when amounts are read as decimals
+    values = list(read_money(io.StringIO("5 EUR\n1.50\n-0 SEK\n"), amount=0))
+    assert values == [Money(5, "EUR"), Money("1.50"), Money(0, "SEK")]
+    assert [m.currency for m in values] == [Currency.EUR, None, Currency.SEK]
+
+    assert next(read_money(io.StringIO("5 EUR,EUR\n"), 0, 1)).currency is Currency.EUR
+    with pytest.raises(ConversionError, match="Invalid monetary amount on line 1"):
+        list(read_money(io.StringIO("5 EUR,SEK\n"), 0, 1))
+
+
+def test_read_money_with_currency() -> None:
+    content = "1.50 SEK\nEUR 2\n0.00 EUR\nMoney(-5.00 usd)\n"
+    values = list(read_money(io.StringIO(content), 0, kind="with_currency"))
+    assert values == [Money("1.50", "SEK"), Money(2, "EUR"), Money(0, "EUR"), Money(-5, "USD")]
+    assert [m.currency for m in values] == [Currency.SEK, Currency.EUR, Currency.EUR, Currency.USD]
+
+    assert list(read_money(io.StringIO("1.50\n"), 0, kind="with_currency", default_currency="SEK")) == [
+        Money("1.50", "SEK")
+    ]
+
+
+def test_read_money_minor_units() -> None:
+    content = "150;SEK\n2;JPY\n-1005;KWD\n99;\n-99999999999999999999;SEK\n"
+    assert [str(m) for m in read_money(io.StringIO(content), 0, 1, kind="minor_units", delimiter=";")] == [
+        "1.50 SEK",
+        "2 JPY",
+        "-1.005 KWD",
+        "0.99",
+        "-999999999999999999.99 SEK",
+    ]
+
+
+def test_read_money_columns() -> None:
+    content = "".join(f"{i}.{i % 100:02d},{('SEK', 'EUR')[i % 2]}\n" for i in range(25))
+    columns = list(read_money_columns(io.StringIO(content), 0, 1, chunk_size=10))
+
+    assert [len(column) for column in columns] == [10, 10, 5]
+    assert all(isinstance(column, MoneyColumn) for column in columns)
+    assert columns[0].amounts[:2] == [Decimal("0.00"), Decimal("1.01")]
+    assert columns[0].currencies[:2] == [Currency.SEK, Currency.EUR]
+    assert columns[0][1] == Money("1.01", "EUR")
+    assert columns[2].tolist() == [Money(f"{i}.{i}", ("SEK", "EUR")[i % 2]) for i in range(20, 25)]
+    assert [m for column in columns for m in column] == list(read_money(io.StringIO(content), 0, 1))
+    assert repr(columns[2]) == "<stockholm.csv.MoneyColumn: 5 values>"
+
+    assert list(read_money_columns(io.StringIO(""), "amount")) == []
+    with pytest.raises(ValueError):
+        MoneyColumn([Decimal(1)], [])
+
+
+@pytest.mark.parametrize(
+    "content, kwargs, message",
+    [
+        ("1.50,SEK\nabc,SEK\n", {}, "Invalid monetary amount on line 2"),
+        ("1.50,SEK\n1.50,S3K\n", {}, "Invalid currency code"),
+        ("1.50,SEK\n1.50\n", {}, "Missing column on line 2"),
+        ("1.50 SEK,SEK\n1.50 EUR,SEK\n", {"kind": "with_currency"}, "Invalid monetary amount on line 2"),
+        ("150,SEK\n1.50,SEK\n", {"kind": "minor_units"}, "Invalid monetary amount on line 2"),
+        ("1" + "0" * 20 + ",SEK\n", {"kind": "minor_units"}, "Input amount is too high"),
+        ("-1" + "0" * 20 + ",JPY\n", {"kind": "minor_units"}, "Input amount is too low"),
+        ("1e99,SEK\n", {}, "Invalid monetary amount on line 1"),
+    ],
+)
+def test_read_money_errors(content: str, kwargs: dict, message: str) -> None:
+    with pytest.raises(ConversionError, match=message):
+        list(read_money(io.StringIO(content), 0, 1, **kwargs))
+
+
+def test_read_money_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        list(read_money(io.StringIO(CONTENT), "amount", kind="float"))
+    with pytest.raises(ValueError):
+        list(read_money(io.StringIO(CONTENT), "amount", chunk_size=0))
+    with pytest.raises(ValueError, match="not found in header row"):
+        list(read_money(io.StringIO(CONTENT), "value"))
+    with pytest.raises(ValueError, match="without a header row"):
+        list(read_money(io.StringIO(CONTENT), "amount", header=False))
+
+
+def test_write_rows() -> None:
+    rows = [["id", "amount"], [1, Money("1.5", "SEK")], [2, Money(-2, Currency.JPY)], [3, Number("0.25")], [4, None]]
+
+    fp = io.StringIO()
+    assert write_rows(fp, rows, chunk_size=2) == 5
+    assert fp.getvalue().splitlines() == ["id,amount", "1,1.50 SEK", "2,-2 JPY", "3,0.25", "4,"]
+
+    fp = io.StringIO()
+    write_rows(fp, rows[1:], split_currency=True)
+    assert fp.getvalue().splitlines() == ["1,1.50,SEK", "2,-2,JPY", "3,0.25,", "4,"]
+
+    fp = io.StringIO()
+    write_rows(fp, rows[1:3], format_spec=",.3f", delimiter=";")
+    assert fp.getvalue().splitlines() == ["1;1.500", "2;-2.000"]
+
+
+def test_write_read_roundtrip() -> None:
+    values = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", ("SEK", "EUR", "JPY")[i % 3]) for i in range(0, 300, 3)]
+
+    fp = io.StringIO()
+    write_rows(fp, ([i, value] for i, value in enumerate(values)))
+    fp.seek(0)
+    assert list(read_money(fp, 1, kind="with_currency")) == values
+
+    fp = io.StringIO()
+    write_rows(fp, ([value] for value in values), split_currency=True)
+    fp.seek(0)
+    assert list(read_money(fp, 0, 1)) == values
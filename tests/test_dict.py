@@ -101,3 +101,66 @@ def test_json():
     json_string = json.dumps({"available": money.asdict()})
 
     str(Money(json.loads(json_string).get("available"))) == "-999999999999999999.999999999"
+
+
+def test_asdict_many():
+    amounts = [Money("4711.25", currency=Currency.SEK), Money("-0.000000001 EUR"), "1338 USD", Money(0)]
+    assert Money.asdict_many(amounts) == [
+        {"value": "4711.25 SEK", "units": 4711, "nanos": 250000000, "currency_code": "SEK"},
+        {"value": "-0.000000001 EUR", "units": 0, "nanos": -1, "currency_code": "EUR"},
+        {"value": "1338.00 USD", "units": 1338, "nanos": 0, "currency_code": "USD"},
+        {"value": "0.00", "units": 0, "nanos": 0, "currency_code": None},
+    ]
+    assert Money.asdict_many(amounts) == [Money(amount).asdict() for amount in amounts]
+    assert Money.asdict_many(amounts, keys=["amount", "currency", "does_not_exist"]) == [
+        {"amount": "4711.25", "currency": "SEK"},
+        {"amount": "-0.000000001", "currency": "EUR"},
+        {"amount": "1338.00", "currency": "USD"},
+        {"amount": "0.00", "currency": None},
+    ]
+    assert Money.asdict_many([]) == []
+
+
+def test_asdict_many_numbers():
+    from stockholm import Number, Rate
+
+    assert Rate.asdict_many([Rate("0.073"), "-1.5"]) == [
+        {"value": "0.073", "units": 0, "nanos": 73000000},
+        {"value": "-1.5", "units": -1, "nanos": -500000000},
+    ]
+    assert Number.asdict_many([Number(42)], keys=("amount", "units", "currency_code")) == [
+        {"amount": "42", "units": 42}
+    ]
+
+
+def test_as_json_many():
+    amounts = [Money("5767.50 EUR"), Money("-999999999999999999.999999999", currency=Currency.JPY)]
+    assert Money.as_json_many(amounts) == json.dumps([amount.asdict() for amount in amounts])
+    assert json.loads(Money.as_json_many(amounts, keys=("units", "nanos"))) == [
+        {"units": 5767, "nanos": 500000000},
+        {"units": -999999999999999999, "nanos": -999999999},
+    ]
+    assert [Money(value) for value in json.loads(Money.as_json_many(amounts))] == amounts
+
+
+def test_asdict_units_and_nanos_rounding():
+    assert Money("0.9999999995").asdict(keys=("units", "nanos")) == {"units": 1, "nanos": 0}
+    assert Money("-0.9999999994").asdict(keys=("units", "nanos")) == {"units": 0, "nanos": -999999999}
+    assert Money("-0.0000000004").asdict(keys=("units", "nanos")) == {"units": 0, "nanos": 0}
+    assert Money("-12.3456789015").asdict(keys=("nanos", "units")) == {"nanos": -345678902, "units": -12}
+
+
+def test_as_json_subclass_asdict():
+    from stockholm import Rate
+
+    class TaggedMoney(Money):
+        def asdict(self, keys=("value", "units", "nanos", "currency_code")):
+            return {**super().asdict(keys=keys), "tag": "invoice"}
+
+    class TaggedRate(Rate):
+        def asdict(self, keys=("value", "units", "nanos")):
+            return {**super().asdict(keys=keys), "tag": "interest"}
+
+    assert json.loads(TaggedMoney("1.50 EUR").as_json(keys=("value",))) == {"value": "1.50 EUR", "tag": "invoice"}
+    assert json.loads(TaggedMoney("1.50 EUR").json()) == TaggedMoney("1.50 EUR").asdict()
+    assert json.loads(TaggedRate("0.5").json(keys=("value",))) == {"value": "0.5", "tag": "interest"}
@@ -3,7 +3,7 @@ from typing import Any
 
 import pytest
 
-from stockholm import Money, MoneyProtobufMessage
+from stockholm import Currency, Money, MoneyProtobufMessage, Number
 
 
 @pytest.mark.parametrize(
@@ -159,3 +159,29 @@ def test_info_methods() -> None:
     assert m.as_protobuf().units == 0
     assert m.as_protobuf().nanos == 0
     assert m.as_protobuf().SerializeToString() == b""
+
+
+def test_amount_as_string_decimals() -> None:
+    assert Money("1234.5", currency=Currency.JPY).amount_as_string() == "1234.5"
+    assert Money("1234", currency=Currency.JPY).amount_as_string() == "1234"
+    assert Money("1234.5", currency=Currency.KWD).amount_as_string() == "1234.500"
+    assert Money("1234.5", currency=Currency.CLF).amount_as_string() == "1234.5000"
+    assert Money("1234.12345", currency=Currency.CLF).amount_as_string() == "1234.12345"
+    assert Money("1234.5", currency=Currency.CLF).amount_as_string(max_decimals=2) == "1234.50"
+
+    assert Money("-0.001", currency="SEK").amount_as_string() == "-0.001"
+    assert Money("-0.001", currency="SEK").amount_as_string(max_decimals=2) == "0.00"
+    assert Money("-0.0000000004", currency="SEK").amount_as_string() == "0.00"
+    assert Money("-0.0000000004", currency="SEK").amount_as_string(max_decimals=12) == "-0.0000000004"
+    assert Money("0.0049999999999").amount_as_string(max_decimals=9) == "0.005"
+    assert Money("0.0049999999999").amount_as_string(max_decimals=2) == "0.00"
+
+    assert Money("1.5").amount_as_string(min_decimals=20) == "1." + "5" + "0" * 19
+    assert Money(0).amount_as_string(min_decimals=30) == "0." + "0" * 30
+
+    assert Number("-0.001").amount_as_string() == "-0.001"
+    assert Number("100").amount_as_string() == "100"
+    assert Number("100").amount_as_string(min_decimals=2) == "100.00"
+
+    with pytest.raises(ValueError):
+        Number("100").amount_as_string(min_decimals=10)
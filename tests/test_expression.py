@@ -0,0 +1,143 @@
+import operator
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Callable
+
+import pytest
+
+from stockholm import ConversionError, Currency, CurrencyMismatchError, InvalidOperandError, Money, Number, Rate
+from stockholm.expression import Expression, evaluate, lazy
+
+
+def test_lazy_expression() -> None:
+    loan_amount = Money("250380.00", currency="EUR")
+    interest_rate = Rate(0.073)
+    fees = Money("12.50", "EUR")
+
+    expression = lazy(loan_amount) * (lazy(interest_rate) / 365) * 30 - fees
+    assert isinstance(expression, Expression)
+    assert str(expression) == "(((250380.00 EUR * (0.073 / 365)) * 30) - 12.50 EUR)"
+
+    result = expression.evaluate()
+    assert result == loan_amount * (interest_rate / 365) * 30 - fees
+    assert isinstance(result, Money)
+    assert result.currency == "EUR"
+    assert str(expression.evaluate(decimals=2)) == "1489.78 EUR"
+    assert expression.evaluate(decimals=0, rounding=ROUND_DOWN).amount == Decimal(1489)
+    assert evaluate(expression, decimals=2) == Money("1489.78", "EUR")
+
+
+def test_lazy_expression_types() -> None:
+    assert type(evaluate(lazy(Rate(1)) + Rate(2))) is Rate
+    assert type(evaluate(lazy(Number(2)) * Number(3))) is Number
+    assert type(evaluate(lazy(Rate(1)) * Number(2))) is Money
+    assert type(evaluate(lazy(Rate(1)) / 365)) is Money
+
+    assert evaluate(lazy(Money(5, "EUR")) / Money(2, "SEK")) == Money("2.5")
+    assert evaluate(lazy(Money(5, "EUR")) / Money(2, "SEK")).currency is None
+    assert evaluate(2 * lazy(Money(3, Currency.SEK))).currency is Currency.SEK
+    assert evaluate(10 - lazy(Money(3, "SEK"))) == Money(7, "SEK")
+    assert evaluate(-lazy(Money(1, "EUR")) + Money(1, "EUR")).amount.is_signed() is False
+    assert evaluate(abs(-lazy(Money("1.5", "EUR")))) == Money("1.5", "EUR")
+    assert evaluate(+lazy("1.50 EUR")) == Money("1.5", "EUR")
+    assert evaluate(lazy(Decimal("0.1")) + 0.2) == Money("0.3")
+    assert repr(lazy(Money(1, "EUR")) + 1) == "<stockholm.expression.Expression: (1 EUR + 1)>"
+
+
+def test_lazy_expression_precision() -> None:
+    expression = lazy(Money(1, "EUR")) / 3 * 3
+    assert expression.evaluate() == Money("0.9999999999999999999999999999", "EUR")
+    assert expression.evaluate(precision=10) == Money("0.9999999999", "EUR")
+    assert expression.evaluate(decimals=2) == Money(1, "EUR")
+
+    assert (lazy(Number(2)) / 3).evaluate(precision=50).amount == Decimal(
+        "0.66666666666666666666666666666666666666666666666667"
+    )
+
+
+def test_lazy_expression_errors() -> None:
+    with pytest.raises(CurrencyMismatchError):
+        evaluate(lazy(Money(1, "EUR")) + Money(1, "SEK"))
+    with pytest.raises(InvalidOperandError):
+        evaluate(lazy(Money(1, "EUR")) * Money(1, "EUR"))
+    with pytest.raises(ZeroDivisionError):
+        evaluate(lazy(Money(1, "EUR")) / 0)
+    with pytest.raises(ConversionError):
+        evaluate(lazy(Money("999999999999999999", "EUR")) * 10)
+    with pytest.raises(ConversionError):
+        lazy("abc")
+    with pytest.raises(InvalidOperandError, match="Unable to perform operations on"):
+        evaluate(lazy(Rate("0.5")) + "2.5 EUR")
+    with pytest.raises(CurrencyMismatchError):
+        evaluate(lazy(Money("0 SEK")) * "4 EUR")
+    with pytest.raises(TypeError):
+        1 / lazy(Number(4))  # type: ignore[operator]
+
+    # nothing is validated before the expression is evaluated
+    expression = lazy(Money(1, "EUR")) + Money(1, "SEK")
+    assert isinstance(expression, Expression)
+
+
+OPERATORS = [operator.add, operator.sub, operator.mul, operator.truediv]
+VALUES = [
+    Money("2.5", "EUR"),
+    Money(3),
+    Money("-0.00", "EUR"),
+    Money("0", "SEK"),
+    Money("999999999999999999", "SEK"),
+    Rate("0.5"),
+    Rate(0),
+    Number(2),
+]
+OPERANDS = VALUES + [
+    "2.5 EUR",
+    "4 EUR",
+    "1 SEK",
+    "1.5",
+    "-0",
+    "abc",
+    2,
+    0,
+    10**20,
+    Decimal("0.25"),
+    Decimal("-0.00"),
+    Decimal("NaN"),
+    0.5,
+    True,
+    None,
+]
+
+
+def result(function: Callable[[], Any]) -> Any:
+    # results are compared by class, amount (including its exponent) and currency, errors by class and message
+    try:
+        value = function()
+    except Exception as ex:
+        return type(ex), str(ex)
+    return type(value), value, value.currency, str(value.amount)
+
+
+@pytest.mark.parametrize("op", OPERATORS)
+def test_lazy_expression_matches_eager(op: Callable[[Any, Any], Any]) -> None:
+    for value in VALUES:
+        for other in OPERANDS:
+            expected = result(lambda: op(value, other))
+            assert result(lambda: evaluate(op(lazy(value), other))) == expected, (value, other)
+
+            # there's no reflected division of Money objects
+            if op is not operator.truediv and not isinstance(other, (Money, Rate, Number)):
+                expected = result(lambda: op(other, value))
+                assert result(lambda: evaluate(op(other, lazy(value)))) == expected, (other, value)
+
+
+@pytest.mark.parametrize("op", OPERATORS)
+def test_lazy_expression_chain_matches_eager(op: Callable[[Any, Any], Any]) -> None:
+    for value in VALUES:
+        for first_op in OPERATORS:
+            for other in OPERANDS[::2]:
+                for last in OPERANDS[1::2]:
+                    expected = result(lambda: op(first_op(value, other), last))
+                    assert result(lambda: evaluate(op(first_op(lazy(value), other), last))) == expected, (
+                        value,
+                        other,
+                        last,
+                    )
@@ -0,0 +1,77 @@
+import pytest
+
+from stockholm import Currency, Money
+from stockholm.extract import AmountMatch, find_amounts, finditer
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Total: 1,234.50 EUR", [Money("1234.50", "EUR")]),
+        ("SEK 99", [Money(99, "SEK")]),
+        ("Overdraft(12.00 USD)", [Money(-12, "USD")]),
+        ("Money(12.00 USD) and Money(JPY 5000)", [Money(12, "USD"), Money(5000, "JPY")]),
+        ("Money('5.50', 'SEK'), Money(\"1,000\", NOK)", [Money("5.50", "SEK"), Money(1000, "NOK")]),
+        ('<stockholm.Money: "-0.50 EUR">', [Money("-0.50", "EUR")]),
+        ("Paid EUR -3.25 and +4 EUR.", [Money("-3.25", "EUR"), Money(4, "EUR")]),
+        ("12 USDT, 5 USD, 1 DOGE", [Money(12, "USDT"), Money(5, "USD"), Money(1, "DOGE")]),
+        ("ABC 12 EUR", [Money(12, "EUR")]),
+        ("1,000,000.123456789 KWD", [Money("1000000.123456789", "KWD")]),
+    ],
+)
+def test_find_amounts(text: str, expected: list) -> None:
+    result = find_amounts(text)
+    assert result == expected
+    assert [m.currency for m in result] == [m.currency for m in expected]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "12 apples",
+        "5 sek",
+        "SEKS 12",
+        "XYZ 12",
+        "99,5 SEK",
+        "1,23 EUR",
+        "EUR 12,5",
+        "1234,567 EUR",
+        "EUR 1.2.3",
+        "A12 EUR",
+        "10-12 EUR",
+        "1234567890123456789 EUR",
+        "",
+    ],
+)
+def test_find_amounts_no_match(text: str) -> None:
+    assert find_amounts(text) == []
+
+
+def test_finditer() -> None:
+    text = "Invoice 4711 – Total: 1,234.50 EUR (SEK 99 shipping), Overdraft(12.00 USD)"
+    matches = list(finditer(text))
+
+    assert [match.span() for match in matches] == [(22, 34), (36, 42), (54, 74)]
+    assert [text[match.start : match.end] for match in matches] == [match.text for match in matches]
+    assert [match.text for match in matches] == ["1,234.50 EUR", "SEK 99", "Overdraft(12.00 USD)"]
+    assert matches[0] == AmountMatch(Money("1234.50", "EUR"), 22, 34, "1,234.50 EUR")
+    assert repr(matches[2]) == '<stockholm.extract.AmountMatch: "-12.00 USD" (54, 74)>'
+
+
+def test_finditer_options() -> None:
+    text = "5 sek, 6 NOK, Eur 7"
+    assert find_amounts(text) == [Money(6, "NOK")]
+    assert find_amounts(text, ignore_case=True) == [Money(5, "SEK"), Money(6, "NOK"), Money(7, "EUR")]
+    assert find_amounts(text, ignore_case=True)[0].currency is Currency.SEK
+    assert find_amounts(text, currencies=["sek", "eur"], ignore_case=True) == [Money(5, "SEK"), Money(7, "EUR")]
+    assert find_amounts("12 ABC", currencies=["ABC"]) == [Money(12, "ABC")]
+    assert find_amounts(text, currencies=[]) == []
+
+
+@pytest.mark.parametrize("text", ["-0 SEK", "SEK -0.00", "0.00 SEK", "+0 SEK", "Overdraft(0.00 SEK)", "Money(-0 SEK)"])
+def test_find_amounts_zero(text: str) -> None:
+    (money,) = find_amounts(text)
+    expected = Money(Money(text).amount, Currency.SEK)
+    assert money.amount.is_signed() is False
+    assert money.amount.as_tuple() == expected.amount.as_tuple()
+    assert hash(money) == hash(expected)
@@ -26,3 +26,40 @@ def test_update_data() -> None:
 
     with pytest.raises(AttributeError):
         del m._amount
+
+
+def test_slots() -> None:
+    from stockholm import BaseCurrency, Currency, Number, Rate, get_currency
+
+    for value in (Money("4711 SEK"), Money(1, Currency.SEK), Number(42), Rate("0.5")):
+        assert not hasattr(value, "__dict__")
+        assert not hasattr(value, "__weakref__")
+        with pytest.raises(AttributeError):
+            object.__setattr__(value, "attribute", 1)
+
+    currency = BaseCurrency("XYZ", decimal_digits=3)
+    assert not hasattr(currency, "__dict__")
+    assert not hasattr(get_currency("ABC"), "__dict__")
+    assert currency.ticker == "XYZ"
+    assert currency.decimal_digits == 3
+    assert currency.as_string() == "XYZ"
+    assert currency.as_str() == "XYZ"
+    assert str(currency.money(100)) == "100.000 XYZ"
+
+    with pytest.raises(AttributeError):
+        currency.ticker = "ABC"
+
+    assert Currency.SEK.ticker == "SEK"
+    assert Currency.SEK.as_string() == "SEK"
+    assert str(Currency.SEK.money(100)) == "100.00 SEK"
+
+
+def test_shared_values() -> None:
+    assert Money(0)._amount is Money(0, "SEK")._amount
+    assert Money(0)._amount is Money("-0.0")._amount
+    assert Money(42)._amount is Money(42, "SEK")._amount
+    assert Money("0.00")._amount == 0
+    assert str(Money("0.00")._amount) == "0.00"
+
+    currency_code = "".join(["S", "E", "K"])
+    assert Money(1, currency_code)._currency is Money("1 SEK")._currency
@@ -0,0 +1,96 @@
+import pytest
+
+from stockholm import CurrencyMismatchError, Money, Number, instrumentation
+from stockholm.protobuf import MoneyProtobufMessage
+
+
+@pytest.fixture
+def enabled_instrumentation():
+    instrumentation.enable()
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_instrumentation_disabled_by_default() -> None:
+    assert instrumentation.is_enabled() is False
+
+    Money("4711 SEK")
+    Money("1 SEK") + "2 SEK"
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["init_inputs"] == {}
+    assert snapshot["conversion_fallbacks"] == {}
+    assert snapshot["currency_mismatches"] == 0
+
+
+def test_instrumentation_init_inputs(enabled_instrumentation) -> None:
+    Money(1)
+    Money(1.5)
+    Money(Money(1))
+    Number(2)
+    Money(units=1, nanos=500000000, currency_code="SEK")
+    Money(value="1.50 SEK")
+    Money(MoneyProtobufMessage(units=1, nanos=0, currency_code="SEK"))
+
+    init_inputs = instrumentation.snapshot()["init_inputs"]
+    assert isinstance(init_inputs, dict)
+    assert init_inputs["float"] == 1
+    assert init_inputs["money"] == 1
+    assert init_inputs["units_and_nanos"] == 1
+    assert init_inputs["protobuf"] == 1
+    assert init_inputs["int"] >= 3
+    assert init_inputs["str"] >= 2
+
+
+def test_instrumentation_conversion_fallbacks_and_currency_mismatches(enabled_instrumentation) -> None:
+    Money("1 SEK") + Money("2 SEK")
+    Money("1 SEK") + "2 SEK"
+    Money("1 SEK") * 2
+
+    with pytest.raises(CurrencyMismatchError):
+        Money("1 SEK") - Money("1 EUR")
+    with pytest.raises(CurrencyMismatchError):
+        Money("1 SEK") - "1 EUR"
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["conversion_fallbacks"] == {"int": 1, "str": 2}
+    assert snapshot["currency_mismatches"] == 2
+
+
+def test_instrumentation_cache_counters(enabled_instrumentation) -> None:
+    value = Money("4711.1 SEK")
+    assert f"{value:*>13,.3f}" == "****4,711.100"
+    assert f"{value:*>13,.3f}" == "****4,711.100"
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["cache_hits"] == {"currency_code": 0, "format_spec": 1}
+    assert snapshot["cache_misses"] == {"currency_code": 0, "format_spec": 1}
+
+    instrumentation.disable()
+    f"{value:*>13,.3f}"
+    assert instrumentation.snapshot()["cache_hits"] == {"currency_code": 0, "format_spec": 1}
+
+
+def test_instrumentation_reset(enabled_instrumentation) -> None:
+    Money(1)
+    assert instrumentation.snapshot()["init_inputs"] == {"int": 1}
+
+    instrumentation.reset()
+    assert instrumentation.snapshot()["init_inputs"] == {}
+
+
+def test_instrumentation_prometheus_export(enabled_instrumentation) -> None:
+    Money("1 SEK") + "2 SEK"
+
+    output = instrumentation.to_prometheus()
+    assert output.endswith("\n")
+    assert "# TYPE stockholm_init_inputs_total counter\n" in output
+    assert 'stockholm_init_inputs_total{kind="str"} 2\n' in output
+    assert 'stockholm_conversion_fallbacks_total{kind="str"} 1\n' in output
+    assert "stockholm_currency_mismatches_total 0\n" in output
+    assert 'stockholm_cache_misses_total{cache="format_spec"} 0\n' in output
+
+    assert "\nmoney_init_inputs_total" in f"\n{instrumentation.to_prometheus(prefix='money')}"
@@ -0,0 +1,320 @@
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from xml.etree import ElementTree
+
+import pytest
+
+from stockholm import Currency, Money
+from stockholm.exceptions import BankFileError
+from stockholm.iso20022 import Payment, StatementEntry, read_camt053, read_camt053_columns, write_pain001
+
+CAMT053_V02 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+  <BkToCstmrStmt>
+    <GrpHdr><MsgId>MSG-1</MsgId><CreDtTm>2024-01-31T23:59:59</CreDtTm></GrpHdr>
+    <Stmt>
+      <Id>STMT-1</Id>
+      <Acct><Id><IBAN>SE4550000000058398257466</IBAN></Id><Ccy>SEK</Ccy></Acct>
+      <Bal><Amt Ccy="SEK">1000.00</Amt><CdtDbtInd>CRDT</CdtDbtInd></Bal>
+      <Ntry>
+        <NtryRef>1</NtryRef>
+        <Amt Ccy="SEK">1250.50</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Sts>BOOK</Sts>
+        <BookgDt><Dt>2024-01-02</Dt></BookgDt>
+        <ValDt><Dt>2024-01-03</Dt></ValDt>
+        <AcctSvcrRef>REF-1</AcctSvcrRef>
+        <NtryDtls><TxDtls>
+          <Refs><EndToEndId>E2E-1</EndToEndId></Refs>
+          <RmtInf><Ustrd>Invoice 1</Ustrd></RmtInf>
+        </TxDtls></NtryDtls>
+      </Ntry>
+      <Ntry>
+        <Amt Ccy="sek">99</Amt>
+        <CdtDbtInd>DBIT</CdtDbtInd>
+        <Sts>PDNG</Sts>
+        <BookgDt><DtTm>2024-01-04T10:00:00</DtTm></BookgDt>
+      </Ntry>
+    </Stmt>
+    <Stmt>
+      <Id>STMT-2</Id>
+      <Acct><Id><Othr><Id>5839-8257466</Id></Othr></Id></Acct>
+      <Ntry>
+        <Amt Ccy="JPY">500</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Sts>BOOK</Sts>
+      </Ntry>
+    </Stmt>
+  </BkToCstmrStmt>
+</Document>
+"""
+
+CAMT053_V08 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08">
+  <BkToCstmrStmt>
+    <GrpHdr><MsgId>MSG-1</MsgId></GrpHdr>
+    <Stmt>
+      <Id>STMT-1</Id>
+      <Acct><Id><IBAN>DE89370400440532013000</IBAN></Id></Acct>
+      <Ntry>
+        <Amt Ccy="EUR">10.00001</Amt>
+        <CdtDbtInd>DBIT</CdtDbtInd>
+        <Sts><Cd>BOOK</Cd></Sts>
+        <BookgDt><Dt>2024-02-29</Dt></BookgDt>
+      </Ntry>
+    </Stmt>
+  </BkToCstmrStmt>
+</Document>
+"""
+
+
+def test_read_camt053() -> None:
+    entries = list(read_camt053(CAMT053_V02))
+
+    assert [e.amount for e in entries] == [Money("1250.50", "SEK"), Money("99", "SEK"), Money("500", "JPY")]
+    assert [e.signed_amount for e in entries] == [Money("1250.50", "SEK"), Money("-99", "SEK"), Money("500", "JPY")]
+    assert all(e.amount.currency is Currency.SEK for e in entries[:2])
+    assert entries[2].amount.currency is Currency.JPY
+    assert [str(e.amount) for e in entries] == ["1250.50 SEK", "99.00 SEK", "500 JPY"]
+
+    assert entries[0] == StatementEntry(
+        Money("1250.50", "SEK"),
+        "CRDT",
+        status="BOOK",
+        booking_date=date(2024, 1, 2),
+        value_date=date(2024, 1, 3),
+        reference="1",
+        account_servicer_reference="REF-1",
+        end_to_end_id="E2E-1",
+        remittance_information="Invoice 1",
+        statement_id="STMT-1",
+        account="SE4550000000058398257466",
+    )
+    assert entries[1] == StatementEntry(
+        Money("99", "SEK"),
+        "DBIT",
+        status="PDNG",
+        booking_date=date(2024, 1, 4),
+        statement_id="STMT-1",
+        account="SE4550000000058398257466",
+    )
+    assert (entries[2].statement_id, entries[2].account) == ("STMT-2", "5839-8257466")
+    assert repr(entries[1]) == '<stockholm.iso20022.StatementEntry: "-99.00 SEK" (2024-01-04)>'
+
+
+def test_read_camt053_versions() -> None:
+    assert list(read_camt053(CAMT053_V08)) == [
+        StatementEntry(
+            Money("10.00001", "EUR"),
+            "DBIT",
+            status="BOOK",
+            booking_date=date(2024, 2, 29),
+            statement_id="STMT-1",
+            account="DE89370400440532013000",
+        )
+    ]
+
+    without_namespace = CAMT053_V02.replace(b' xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"', b"")
+    assert list(read_camt053(without_namespace)) == list(read_camt053(CAMT053_V02))
+
+
+def test_read_camt053_sources(tmp_path: Any) -> None:
+    path = tmp_path / "camt053.xml"
+    path.write_bytes(CAMT053_V02)
+    expected = list(read_camt053(CAMT053_V02))
+
+    assert list(read_camt053(path)) == expected
+    assert list(read_camt053(str(path))) == expected
+    assert list(read_camt053(bytearray(CAMT053_V02))) == expected
+    assert list(read_camt053(io.BytesIO(CAMT053_V02))) == expected
+
+    with open(path, "rb") as fp:
+        assert list(read_camt053(fp)) == expected
+
+
+def test_read_camt053_columns() -> None:
+    batches = list(read_camt053_columns(CAMT053_V02, batch_size=2))
+
+    assert [len(batch["amount"]) for batch in batches] == [2, 1]
+    assert batches[0]["amount"] == [Decimal("1250.50"), Decimal("99")]
+    assert batches[0]["currency"] == [Currency.SEK, Currency.SEK]
+    assert batches[0]["credit_debit"] == ["CRDT", "DBIT"]
+    assert batches[0]["booking_date"] == [date(2024, 1, 2), date(2024, 1, 4)]
+    assert batches[1]["statement_id"] == ["STMT-2"]
+    assert list(batches[1].keys()) == list(batches[0].keys())
+
+    assert len(list(read_camt053_columns(CAMT053_V02))) == 1
+
+    with pytest.raises(ValueError):
+        list(read_camt053_columns(CAMT053_V02, batch_size=0))
+
+
+@pytest.mark.parametrize(
+    "old, new, message",
+    [
+        (b'<Amt Ccy="JPY">500</Amt>', b'<Amt Ccy="JPY">-500</Amt>', "Invalid amount in entry 1: '-500' [block 2]"),
+        (b'<Amt Ccy="JPY">500</Amt>', b'<Amt Ccy="JPY">NaN</Amt>', "Invalid amount in entry 1: 'NaN' [block 2]"),
+        (
+            b'<Amt Ccy="JPY">500</Amt>',
+            b'<Amt Ccy="JPY">1.123456</Amt>',
+            "Invalid amount in entry 1: '1.123456' [block 2]",
+        ),
+        (b'<Amt Ccy="JPY">500</Amt>', b"", "Missing <Amt> element in entry 1 [block 2]"),
+        (b'<Amt Ccy="JPY">', b'<Amt Ccy="J1Y">', "Invalid currency code in entry 1: 'J1Y' [block 2]"),
+        (b'<Amt Ccy="JPY">', b"<Amt>", "Invalid currency code in entry 1: None [block 2]"),
+        (b"<CdtDbtInd>DBIT</CdtDbtInd>", b"", "Invalid credit or debit indicator in entry 2: None [block 1]"),
+        (b"<Dt>2024-01-03</Dt>", b"<Dt>2024-01-32</Dt>", "Invalid booking or value date in entry 1 [block 1]"),
+    ],
+)
+def test_read_camt053_errors(old: bytes, new: bytes, message: str) -> None:
+    with pytest.raises(BankFileError) as exc_info:
+        list(read_camt053(CAMT053_V02.replace(old, new)))
+
+    assert str(exc_info.value) == message
+
+
+def test_read_camt053_invalid_document() -> None:
+    with pytest.raises(SyntaxError):
+        list(read_camt053(b""))
+
+    with pytest.raises(SyntaxError):
+        list(read_camt053(CAMT053_V02[:-20]))
+
+
+def test_read_camt053_streaming() -> None:
+    # entries are yielded before the document has been fully read
+    chunks = [CAMT053_V02[: CAMT053_V02.index(b"</Ntry>") + 8], b"<Ntry>"]
+
+    class Source:
+        def read(self, size: int) -> bytes:
+            return chunks.pop(0) if chunks else b""
+
+    entries = read_camt053(Source())  # type: ignore
+    assert next(entries).amount == Money("1250.50", "SEK")
+    with pytest.raises(SyntaxError):
+        next(entries)
+
+
+PAIN001_NS = "{urn:iso:std:iso:20022:tech:xsd:pain.001.001.03}"
+
+PAYMENTS = [
+    Payment(Money("1", "JPY"), "A & B", "SE4550000000058398257466"),
+    Payment(
+        Money("1250.10", Currency.EUR),
+        "Creditor",
+        "DE89370400440532013000",
+        creditor_bic="COBADEFFXXX",
+        end_to_end_id="E2E-2",
+        remittance_information="Invoice <2>",
+    ),
+    Payment(Money("0.001", "KWD"), "Creditor", "KW81CBKU0000000000001234560101"),
+]
+
+
+def write_payments(destination: Any, payments: Any = PAYMENTS) -> Any:
+    return write_pain001(
+        destination,
+        payments,
+        message_id="MSG-1",
+        debtor_name="Debtor AB",
+        debtor_iban="SE4550000000058398257466",
+        execution_date=date(2024, 2, 1),
+        created_at=datetime(2024, 1, 31, 12, 30, 15, 500),
+    )
+
+
+def test_write_pain001() -> None:
+    fp = io.BytesIO()
+    assert write_payments(fp) == (3, Decimal("1251.101"))
+
+    document = ElementTree.fromstring(fp.getvalue())
+    for path in (
+        f"{PAIN001_NS}CstmrCdtTrfInitn/{PAIN001_NS}GrpHdr",
+        f"{PAIN001_NS}CstmrCdtTrfInitn/{PAIN001_NS}PmtInf",
+    ):
+        assert document.findtext(f"{path}/{PAIN001_NS}NbOfTxs") == "3"
+        assert document.findtext(f"{path}/{PAIN001_NS}CtrlSum") == "1251.101"
+
+    assert document.findtext(f".//{PAIN001_NS}CreDtTm") == "2024-01-31T12:30:15"
+    assert document.findtext(f".//{PAIN001_NS}ReqdExctnDt") == "2024-02-01"
+    assert document.findtext(f".//{PAIN001_NS}PmtInfId") == "MSG-1"
+    assert document.findtext(f".//{PAIN001_NS}InitgPty/{PAIN001_NS}Nm") == "Debtor AB"
+
+    transactions = document.findall(f".//{PAIN001_NS}CdtTrfTxInf")
+    amounts = [t.find(f"{PAIN001_NS}Amt/{PAIN001_NS}InstdAmt") for t in transactions]
+    assert [(a.text, a.get("Ccy")) for a in amounts if a is not None] == [
+        ("1", "JPY"),
+        ("1250.10", "EUR"),
+        ("0.001", "KWD"),
+    ]
+    assert [t.findtext(f".//{PAIN001_NS}EndToEndId") for t in transactions] == ["NOTPROVIDED", "E2E-2", "NOTPROVIDED"]
+    assert [t.findtext(f".//{PAIN001_NS}Cdtr/{PAIN001_NS}Nm") for t in transactions] == [
+        "A & B",
+        "Creditor",
+        "Creditor",
+    ]
+    assert transactions[1].findtext(f".//{PAIN001_NS}BIC") == "COBADEFFXXX"
+    assert transactions[1].findtext(f".//{PAIN001_NS}Ustrd") == "Invoice <2>"
+
+
+def test_write_pain001_destinations(tmp_path: Any) -> None:
+    fp = io.BytesIO()
+    write_payments(fp)
+    expected = fp.getvalue()
+
+    path = tmp_path / "pain001.xml"
+    assert write_payments(path) == (3, Decimal("1251.101"))
+    assert path.read_bytes() == expected
+
+    # output that can't be seeked is written in two passes
+    class Output:
+        def __init__(self) -> None:
+            self.data = b""
+
+        def write(self, data: bytes) -> int:
+            self.data += data
+            return len(data)
+
+        def seekable(self) -> bool:
+            return False
+
+    output = Output()
+    assert write_payments(output, iter(PAYMENTS)) == (3, Decimal("1251.101"))
+    assert output.data == expected
+
+    # the payments are streamed in a single pass with totals written to the header afterwards
+    fp = io.BytesIO(b"prefix")
+    fp.seek(0, io.SEEK_END)
+    assert write_payments(fp, (p for p in PAYMENTS * 1000)) == (3000, Decimal("1251101"))
+    assert fp.getvalue().startswith(b"prefix<?xml")
+    assert b"<NbOfTxs>3000</NbOfTxs>" in fp.getvalue()[:1000]
+    assert b"<CtrlSum>1251101.000</CtrlSum>" in fp.getvalue()[:1000]
+
+
+def test_write_pain001_empty(tmp_path: Any) -> None:
+    fp = io.BytesIO()
+    with pytest.raises(BankFileError, match="Payment files must contain at least one payment"):
+        write_payments(fp, [])
+    assert fp.getvalue() == b""
+
+    with pytest.raises(BankFileError, match="Payment files must contain at least one payment"):
+        write_payments(tmp_path / "pain001.xml", iter([]))
+    assert not (tmp_path / "pain001.xml").exists()
+
+
+@pytest.mark.parametrize(
+    "amount, message",
+    [
+        (Money("1.005", "EUR"), "Invalid amount for payment 2: 1.005 EUR"),
+        (Money("1.5", "JPY"), "Invalid amount for payment 2: 1.50 JPY"),
+        (Money("-1", "EUR"), "Invalid amount for payment 2: -1.00 EUR"),
+        (Money("1"), "Payment 2 is missing a currency"),
+    ],
+)
+def test_write_pain001_errors(amount: Money, message: str) -> None:
+    with pytest.raises(BankFileError) as exc_info:
+        write_payments(io.BytesIO(), [PAYMENTS[0], Payment(amount, "Creditor", "SE4550000000058398257466")])
+
+    assert str(exc_info.value) == message
@@ -0,0 +1,136 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+import stockholm.json
+from stockholm import ConversionError, Currency, Money, Number, Rate
+
+try:
+    import orjson
+
+    orjson_is_installed = True
+except ModuleNotFoundError:
+    orjson_is_installed = False
+
+
+def test_json_encoder():
+    document = {
+        "id": "abc123",
+        "amount": Money("4711.50", currency=Currency.SEK),
+        "lines": [Money("-1.25 EUR"), Money(0)],
+        "rate": Rate("0.073"),
+        "quantity": Number(3),
+        "currency": Currency.USD,
+    }
+    assert json.loads(json.dumps(document, cls=stockholm.json.JSONEncoder)) == {
+        "id": "abc123",
+        "amount": {"value": "4711.50 SEK", "units": 4711, "nanos": 500000000, "currency_code": "SEK"},
+        "lines": [
+            {"value": "-1.25 EUR", "units": -1, "nanos": -250000000, "currency_code": "EUR"},
+            {"value": "0.00", "units": 0, "nanos": 0, "currency_code": None},
+        ],
+        "rate": {"value": "0.073", "units": 0, "nanos": 73000000},
+        "quantity": {"value": "3", "units": 3, "nanos": 0},
+        "currency": "USD",
+    }
+    assert stockholm.json.dumps({"amount": Money("1 USD")}) == json.dumps(
+        {"amount": {"value": "1.00 USD", "units": 1, "nanos": 0, "currency_code": "USD"}}
+    )
+    assert stockholm.json.dumps([Currency("XYZ")]) == '["XYZ"]'
+
+    with pytest.raises(TypeError):
+        stockholm.json.dumps({"value": object()})
+
+
+def test_default():
+    assert stockholm.json.default(Money("1.5 SEK")) == Money("1.5 SEK").asdict()
+    assert stockholm.json.default(Currency.JPY) == "JPY"
+
+    with pytest.raises(TypeError):
+        stockholm.json.default(Decimal(1))
+
+
+@pytest.mark.skipif(orjson_is_installed is False, reason="orjson is not installed")
+def test_default_with_orjson():
+    document = {"amount": Money("-999999999999999999.999999999 EUR"), "rate": Rate(1)}
+    assert json.loads(orjson.dumps(document, default=stockholm.json.default)) == {
+        "amount": {
+            "value": "-999999999999999999.999999999 EUR",
+            "units": -999999999999999999,
+            "nanos": -999999999,
+            "currency_code": "EUR",
+        },
+        "rate": {"value": "1", "units": 1, "nanos": 0},
+    }
+
+
+def test_object_hook():
+    document = stockholm.json.loads(
+        '{"id": 1, "amount": {"value": "4711.50 SEK", "units": 4711, "nanos": 500000000, "currency_code": "SEK"},'
+        ' "other": {"units": 1, "nanos": 0, "note": "not a monetary amount"}, "minimal": {"units": -1, "nanos": -5}}'
+    )
+    assert document["id"] == 1
+    assert isinstance(document["amount"], Money)
+    assert document["amount"] == Money("4711.50 SEK")
+    assert document["amount"].currency == "SEK"
+    assert str(document["amount"]) == "4711.50 SEK"
+    assert document["other"] == {"units": 1, "nanos": 0, "note": "not a monetary amount"}
+    assert document["minimal"] == Money("-1.000000005")
+    assert document["minimal"].currency is None
+
+    assert json.loads('{"units": 0, "nanos": 10, "currency_code": "eur"}', object_hook=stockholm.json.object_hook) == (
+        Money("0.00000001 EUR")
+    )
+
+    with pytest.raises(ConversionError):
+        stockholm.json.loads('{"units": 1, "nanos": -1, "currency_code": "EUR"}')
+    with pytest.raises(ConversionError):
+        stockholm.json.loads('{"units": 1, "nanos": 1000000000}')
+    with pytest.raises(ConversionError):
+        stockholm.json.loads('{"units": 1, "nanos": 0, "currency_code": "E U R"}')
+    with pytest.raises(ConversionError):
+        stockholm.json.loads('{"value": "5.00 SEK", "units": 1, "nanos": 0, "currency_code": "EUR"}')
+    with pytest.raises(ConversionError):
+        stockholm.json.loads('{"value": "5.00 EUR", "units": 1, "nanos": 0, "currency_code": "EUR"}')
+
+    assert stockholm.json.loads('{"value": "1 EUR", "units": 1, "nanos": 0, "currency_code": "EUR"}') == Money(1, "EUR")
+    assert stockholm.json.loads('{"units": "kg", "nanos": 3}') == {"units": "kg", "nanos": 3}
+    assert stockholm.json.loads('{"units": "1", "nanos": 0}') == {"units": "1", "nanos": 0}
+    assert stockholm.json.loads('{"units": true, "nanos": 0}') == {"units": True, "nanos": 0}
+
+
+def test_json_roundtrip():
+    amounts = [Money("0.1", currency=Currency.EUR), Money("-0.000000001 USD"), Money(1338)]
+    assert stockholm.json.loads(stockholm.json.dumps(amounts)) == amounts
+    assert stockholm.json.loads(Money.as_json_many(amounts)) == amounts
+
+
+def test_ndjson_text_stream():
+    events = [{"event": i, "amount": Money(i, currency=Currency.SEK) / 3} for i in range(25)]
+
+    fp = io.StringIO()
+    assert stockholm.json.write_ndjson(fp, events, chunk_size=10) == 25
+    lines = fp.getvalue().splitlines()
+    assert len(lines) == 25
+    assert (
+        lines[1] == '{"event":1,"amount":{"value":"0.333333333 SEK","units":0,"nanos":333333333,"currency_code":"SEK"}}'
+    )
+
+    fp.seek(0)
+    decoded = list(stockholm.json.read_ndjson(fp))
+    assert [event["event"] for event in decoded] == list(range(25))
+    assert decoded[1]["amount"] == Money("0.333333333 SEK")
+    assert Money.sum(event["amount"] for event in decoded) == Money("100 SEK")
+
+
+def test_ndjson_binary_stream():
+    fp = io.BytesIO(b'{"amount": {"units": 1, "nanos": 0, "currency_code": "USD"}}\n\n["x"]\n')
+    assert list(stockholm.json.read_ndjson(fp)) == [{"amount": Money("1 USD")}, ["x"]]
+
+    fp.seek(0)
+    assert list(stockholm.json.read_ndjson(fp, object_hook=None)) == [
+        {"amount": {"units": 1, "nanos": 0, "currency_code": "USD"}},
+        ["x"],
+    ]
@@ -0,0 +1,190 @@
+import pytest
+
+from stockholm import BaseCurrency, ConversionError, Currency, Money, Number, Rate
+from stockholm.locale import (
+    LocaleFormatter,
+    LocaleParser,
+    available_locales,
+    format_many,
+    format_money,
+    get_formatter,
+    get_parser,
+    parse_many,
+    parse_money,
+)
+
+
+def test_format_money() -> None:
+    m = Money("1234.56", Currency.SEK)
+
+    assert format_money(m, "sv_SE") == "1\xa0234,56\xa0kr"
+    assert format_money(-m, "sv_SE") == "−1\xa0234,56\xa0kr"
+    assert format_money(Money("1234.56", Currency.EUR), "de_DE") == "1.234,56\xa0€"
+    assert format_money(Money("1234.56", Currency.EUR), "nl_NL") == "€\xa01.234,56"
+    assert format_money(Money("-1234.56", Currency.EUR), "nl_NL") == "€\xa0-1.234,56"
+    assert format_money(Money("1234.56", Currency.EUR), "fr_FR") == "1\u202f234,56\xa0€"
+    assert format_money(Money("-1234.56", Currency.CHF), "de_CH") == "CHF-1’234.56"
+    assert format_money(Money("1234.5", Currency.JPY), "en_US") == "¥1,235"
+    assert format_money(Money("1234.5", Currency.JPY), "ja_JP") == "￥1,235"
+    assert format_money(Money("-1234567.5", Currency.USD), "en_US") == "-$1,234,567.50"
+    assert format_money(Money("1234567.5", Currency.USD), "en_GB") == "US$1,234,567.50"
+    assert format_money(Money("1234567.5", Currency.INR), "en_IN") == "₹12,34,567.50"
+
+
+def test_format_money_currency_spacing() -> None:
+    assert format_money(Money("1234.56", Currency.SEK), "en_US") == "SEK\xa01,234.56"
+    assert format_money(Money("1234.56", Currency.DKK), "da_DK") == "1.234,56\xa0kr."
+    assert format_money(Money("1234.56", Currency.SEK), "en_US", currency_display="code") == "SEK\xa01,234.56"
+    assert format_money(Money("1234.56", Currency.USD), "en_US", currency_display="code") == "USD\xa01,234.56"
+    assert format_money(Money("-1234.56", Currency.USD), "en_US", currency_display="none") == "-1,234.56"
+    assert format_money(Money("1234.56", Currency.SEK), "sv_SE", currency_display="none") == "1\xa0234,56"
+
+
+def test_format_money_decimals() -> None:
+    assert format_money(Money("1234.565", "SEK"), "sv_SE") == "1\xa0234,57\xa0kr"
+    assert format_money(Money("1234.565", "SEK"), "sv_SE", decimals=3) == "1\xa0234,565\xa0kr"
+    assert format_money(Money("1234.565", "SEK"), "sv_SE", decimals=0) == "1\xa0235\xa0kr"
+    assert format_money(Money("1234.5", "JPY"), "en_US") == "¥1,235"
+    assert format_money(Money("1.5", Currency.KWD), "en_US") == "KWD\xa01.500"
+    assert format_money(Money("1.5", BaseCurrency("XBT", decimal_digits=8)), "en_US") == "XBT\xa01.50000000"
+    assert format_money(Money("-0.001", "SEK"), "sv_SE") == "0,00\xa0kr"
+
+    assert format_money(Number("-1234.5678"), "sv_SE") == "−1\xa0234,5678"
+    assert format_money(Money("1234.5"), "de_DE") == "1.234,50"
+    assert format_money(Money("1234.5"), "de_DE", decimals=0) == "1.235"
+
+
+def test_minimum_grouping_digits() -> None:
+    assert format_money(Money("1234.5", Currency.EUR), "es_ES") == "1234,50\xa0€"
+    assert format_money(Money("12345.5", Currency.EUR), "es_ES") == "12.345,50\xa0€"
+    assert format_money(Money("-1234567.5", Currency.PLN), "pl_PL") == "-1\xa0234\xa0567,50\xa0zł"
+
+
+def test_locale_names() -> None:
+    assert get_formatter("sv_SE").locale == "sv_SE"
+    assert get_formatter("sv-se").locale == "sv_SE"
+    assert get_formatter("sv_SE.UTF-8").locale == "sv_SE"
+    assert get_formatter("sv").locale == "sv_SE"
+    assert get_formatter("en").locale == "en_US"
+    assert get_formatter("sv_SE") is get_formatter("sv_SE")
+    assert repr(get_formatter("de_DE")) == '<stockholm.LocaleFormatter: "de_DE">'
+
+    assert "sv_SE" in available_locales()
+    assert len(available_locales()) >= 20
+
+    with pytest.raises(ValueError):
+        get_formatter("xx_XX")
+    with pytest.raises(ValueError):
+        get_formatter("sv_XX")
+    with pytest.raises(ValueError):
+        LocaleFormatter("sv_SE", currency_display="name")
+
+
+def test_format_many() -> None:
+    values = [Money("1234.5", "SEK"), Money("-0.5", "SEK"), Money(1000000, Currency.SEK)]
+    expected = ["1\xa0234,50\xa0kr", "−0,50\xa0kr", "1\xa0000\xa0000,00\xa0kr"]
+
+    assert format_many(values, "sv_SE") == expected
+    assert get_formatter("sv_SE").format_many(iter(values)) == expected
+    assert format_many(values, "en_US", decimals=0) == ["SEK\xa01,235", "-SEK\xa01", "SEK\xa01,000,000"]
+    assert format_many([], "en_US") == []
+
+
+@pytest.mark.parametrize(
+    "value, locale, expected",
+    [
+        ("$1,234.56", None, Money("1234.56", "USD")),
+        ("-$1,234,567.50", "en_US", Money("-1234567.50", "USD")),
+        ("$5", "en_CA", Money(5, "CAD")),
+        ("US$ 5", None, Money(5, "USD")),
+        ("1 234,56 kr", "sv_SE", Money("1234.56", "SEK")),
+        ("−1\xa0234,56\xa0kr", "sv_SE", Money("-1234.56", "SEK")),
+        ("1.234,56\xa0kr.", "da_DK", Money("1234.56", "DKK")),
+        ("1.234,56 €", "de_DE", Money("1234.56", "EUR")),
+        ("€\xa0-1.234,56", "nl_NL", Money("-1234.56", "EUR")),
+        ("CHF-1’234.56", "de_CH", Money("-1234.56", "CHF")),
+        ("CHF 1'234.56", "de_CH", Money("1234.56", "CHF")),
+        ("₹12,34,567.50", "en_IN", Money("1234567.50", "INR")),
+        ("￥1,235", "ja_JP", Money(1235, "JPY")),
+        ("¥1,235", "zh_CN", Money(1235, "CNY")),
+        ("¥1,235", None, Money(1235, "JPY")),
+        ("1 234,56 EUR", "fr_FR", Money("1234.56", "EUR")),
+        ("sek 12", None, Money(12, "SEK")),
+        ("+12.5", None, Money("12.5")),
+    ],
+)
+def test_parse_money(value: str, locale: str, expected: Money) -> None:
+    result = Money.parse(value, locale=locale)
+    assert result == expected
+    assert result.currency == expected.currency
+    assert parse_money(value, locale) == expected
+
+
+@pytest.mark.parametrize(
+    "value, locale",
+    [
+        ("5 kr", None),
+        ("1,23", None),
+        ("1.234,56", None),
+        ("1.23 €", "de_DE"),
+        ("1,234,567.50", "en_IN"),
+        ("1.2.3", None),
+        ("$ € 5", None),
+        ("--5", None),
+        ("5-", None),
+        ("abc", None),
+        ("", None),
+        ("1e5 USD", None),
+        ("1000000000000000000 USD", None),
+    ],
+)
+def test_parse_money_invalid(value: str, locale: str) -> None:
+    with pytest.raises(ConversionError):
+        Money.parse(value, locale=locale)
+
+
+def test_parse_money_currency_and_symbols() -> None:
+    assert Money.parse("5 kr", symbols={"kr": "nok"}) == Money(5, "NOK")
+    assert Money.parse("$5", symbols={"$": "AUD"}).currency is Currency.AUD
+    assert Money.parse("12", currency="SEK") == Money(12, "SEK")
+    assert Money.parse("12 kr", locale="sv_SE", currency=Currency.SEK) == Money(12, "SEK")
+    with pytest.raises(ConversionError):
+        Money.parse("$12", currency="SEK")
+
+    assert isinstance(Number.parse("1 234,5", locale="sv_SE"), Number)
+    assert Number.parse("1 234,5", locale="sv_SE") == Number("1234.5")
+    assert Rate.parse("1.50") + Rate(1) == Rate("2.5")
+
+    # rates and numbers does not have a currency
+    with pytest.raises(ConversionError, match="Rates and numbers does not have a currency"):
+        Rate.parse("$1.50")
+    with pytest.raises(ConversionError):
+        Number.parse("1,50 kr", locale="sv_SE")
+    with pytest.raises(ConversionError):
+        Rate.parse("1.50", currency="SEK")
+    with pytest.raises(ConversionError):
+        parse_many(["1", "2 EUR"], cls=Number)
+
+
+@pytest.mark.parametrize("value", ["-0.00 USD", "0.00 USD", "-0 USD", "0 USD", "USD -0.000"])
+def test_parse_money_zero(value: str) -> None:
+    # zeros are normalized as in the Money constructor
+    money = Money.parse(value)
+    expected = Money(Money(value).amount, Currency.USD)
+    assert money.amount.as_tuple() == expected.amount.as_tuple()
+    assert hash(money) == hash(expected)
+    assert str(money) == str(expected)
+
+    assert not Rate.parse(value.replace("USD", "")).amount.is_signed()
+
+
+def test_parse_many() -> None:
+    values = format_many([Money("1234.5", "SEK"), Money("-0.5", "SEK"), Money(1000000, Currency.SEK)], "sv_SE")
+    assert parse_many(values, "sv_SE") == [Money("1234.5", "SEK"), Money("-0.5", "SEK"), Money(1000000, "SEK")]
+    assert get_parser("sv-SE") is get_parser("sv-SE")
+    assert get_parser("sv_SE", symbols={"kr": "NOK"}).parse_many(["1 kr"]) == [Money(1, "NOK")]
+    assert repr(get_parser("de_DE")) == '<stockholm.LocaleParser: "de_DE">'
+    assert LocaleParser().locale is None
+
+    with pytest.raises(ValueError):
+        get_parser("xx_XX")
@@ -0,0 +1,131 @@
+from typing import Any, Type
+
+import pytest
+
+from stockholm import ConversionError, Currency, Money, MoneyProtobufMessage, Rate
+from stockholm.protobuf import GenericProtobufMessage
+
+
+def build_message_classes() -> Any:
+    from google.protobuf import descriptor_pb2, descriptor_pool
+
+    pool = descriptor_pool.Default()
+    try:
+        pool.FindMessageTypeByName("stockholm.tests.MoneyList")
+    except KeyError:
+        file_descriptor = descriptor_pb2.FileDescriptorProto(
+            name="stockholm/tests/test_protobuf.proto",
+            package="stockholm.tests",
+            syntax="proto3",
+            dependency=["google/type/money.proto"],
+        )
+        money_list = file_descriptor.message_type.add(name="MoneyList")
+        money_list.field.add(name="amounts", number=1, label=3, type=11, type_name=".google.type.Money")
+        custom_money = file_descriptor.message_type.add(name="CustomMoney")
+        custom_money.field.add(name="value", number=1, label=1, type=9)
+        custom_money.field.add(name="units", number=2, label=1, type=3)
+        custom_money.field.add(name="nanos", number=3, label=1, type=5)
+        custom_money.field.add(name="currency", number=4, label=1, type=9)
+        custom_money.field.add(name="original", number=5, label=1, type=11, type_name=".google.type.Money")
+        custom_money.field.add(name="tags", number=6, label=3, type=9)
+        pool.Add(file_descriptor)
+
+    def message_class(name: str) -> Type[GenericProtobufMessage]:
+        descriptor = pool.FindMessageTypeByName(name)
+        try:
+            from google.protobuf.message_factory import GetMessageClass
+
+            return GetMessageClass(descriptor)
+        except ImportError:  # pragma: no cover
+            from google.protobuf.message_factory import MessageFactory
+
+            return MessageFactory(pool).GetPrototype(descriptor)
+
+    return message_class("stockholm.tests.MoneyList"), message_class("stockholm.tests.CustomMoney")
+
+
+def test_as_protobuf_custom_message() -> None:
+    _, CustomMoney = build_message_classes()
+
+    message = Money("4711.75", currency=Currency.SEK).as_protobuf(proto_class=CustomMoney)
+    assert type(message) is CustomMoney
+    assert message.value == "4711.75 SEK"
+    assert message.units == 4711
+    assert message.nanos == 750000000
+    assert message.currency == "SEK"
+    assert not message.HasField("original")
+    assert list(message.tags) == []
+
+    message = Money("-0.5").as_protobuf(proto_class=CustomMoney)
+    assert message.value == "-0.50"
+    assert message.units == 0
+    assert message.nanos == -500000000
+    assert message.currency == ""
+
+    message = Rate("0.073").as_protobuf(proto_class=CustomMoney)
+    assert message.value == "0.073"
+    assert message.nanos == 73000000
+
+    assert (
+        Rate("-1.5").as_protobuf().SerializeToString()
+        == MoneyProtobufMessage(units=-1, nanos=-500000000).SerializeToString()
+    )
+
+
+def test_from_protobuf_custom_message() -> None:
+    _, CustomMoney = build_message_classes()
+
+    message = CustomMoney(value="4711.75 SEK", units=4711, nanos=750000000, currency="SEK")
+    assert Money.from_protobuf(message) == Money("4711.75 SEK")
+    assert Money.from_protobuf(message.SerializeToString(), proto_class=CustomMoney) == Money("4711.75 SEK")
+    assert Money(message) == Money("4711.75 SEK")
+
+    with pytest.raises(ConversionError):
+        Money.from_protobuf(CustomMoney(value="4711.75 SEK", units=1, currency="SEK"))
+
+
+def test_from_protobuf_google_type_money() -> None:
+    money = Money.from_protobuf(MoneyProtobufMessage(currency_code="JPY", units=13384711))
+    assert str(money) == "13384711.00 JPY"
+    assert money.currency == "JPY"
+
+    money = Money.from_protobuf(MoneyProtobufMessage(units=-1, nanos=-1))
+    assert str(money) == "-1.000000001"
+    assert money.currency is None
+
+    assert Rate.from_protobuf(MoneyProtobufMessage(units=1, nanos=5)) == Rate("1.000000005")
+
+    with pytest.raises(ConversionError):
+        Money.from_protobuf(MoneyProtobufMessage(units=-1, nanos=1))
+    with pytest.raises(ConversionError):
+        Rate.from_protobuf(MoneyProtobufMessage(currency_code="USD", units=1))
+
+
+def test_protobuf_repeated_field() -> None:
+    MoneyList, _ = build_message_classes()
+
+    amounts = [Money("4711.75 SEK"), Money("-0.000000001", currency=Currency.EUR), "13384711 JPY", 100]
+    message = MoneyList()
+    Money.extend_protobuf(message.amounts, amounts)
+
+    assert len(message.amounts) == 4
+    assert message.amounts[0] == MoneyProtobufMessage(currency_code="SEK", units=4711, nanos=750000000)
+    assert message.amounts[1] == MoneyProtobufMessage(currency_code="EUR", nanos=-1)
+    assert message.amounts[2] == MoneyProtobufMessage(currency_code="JPY", units=13384711)
+    assert message.amounts[3] == MoneyProtobufMessage(units=100)
+
+    parsed = MoneyList.FromString(message.SerializeToString())
+    assert Money.from_protobuf_many(parsed.amounts) == [Money(amount) for amount in amounts]
+    assert Money.from_protobuf_many([m.SerializeToString() for m in parsed.amounts]) == [
+        Money(amount) for amount in amounts
+    ]
+
+
+def test_as_protobuf_many() -> None:
+    amounts = [Money("1.10 USD"), Money(2), "3 EUR"]
+    messages = Money.as_protobuf_many(amounts)
+    assert [type(message) for message in messages] == [MoneyProtobufMessage] * 3
+    assert [message.SerializeToString() for message in messages] == [
+        Money(amount).as_protobuf().SerializeToString() for amount in amounts
+    ]
+    assert Money.from_protobuf_many(messages) == [Money(amount) for amount in amounts]
@@ -1,10 +1,11 @@
 import json
+import sys
 from decimal import Decimal
 from typing import Any
 
 import pytest
 
-from stockholm import Currency, Money, get_currency
+from stockholm import Currency, Money, Number, get_currency
 from stockholm.currency import JPY, USD, BaseCurrency
 from stockholm.types import (
     ConvertibleToCurrency,
@@ -129,3 +130,121 @@ def test_validate_currency() -> None:
     assert Currency._validate("JPY", validate_currency_code).ticker == "JPY"
     assert Currency._validate(Currency.USD, validate_currency_code).decimal_digits == 2
     assert Currency._validate("JPY", validate_currency_code).decimal_digits == 0
+
+
+@pytest.mark.skipif(pydantic_is_installed is False, reason="pydantic is not installed")
+def test_pydantic_core_schema_is_cached() -> None:
+    from pydantic import BaseModel
+
+    schema = Money.__get_pydantic_core_schema__(Money, None)
+    assert Money.__get_pydantic_core_schema__(Money, None) == schema
+    assert Money.__get_pydantic_core_schema__(Money, None) is not schema
+    assert Currency.__get_pydantic_core_schema__(Currency, None) == Currency.__get_pydantic_core_schema__(
+        Currency, None
+    )
+
+    class FirstModel(BaseModel):
+        value: Money
+        currency: Currency
+
+    class SecondModel(BaseModel):
+        value: Money
+        currency: Currency
+
+    assert Money.__get_pydantic_core_schema__(Money, None) == schema
+    assert FirstModel(value="4711 SEK", currency="SEK") == FirstModel(value=Money(4711, "SEK"), currency="SEK")
+    assert SecondModel(value="4711 SEK", currency="SEK").value == Money(4711, "SEK")
+
+
+@pytest.mark.skipif(pydantic_is_installed is False, reason="pydantic is not installed")
+def test_pydantic_json_schema_excludes_instance_checks() -> None:
+    schema = Money.__get_pydantic_core_schema__(Money, None)
+    assert "is-instance" not in repr(schema["json_schema"])
+    assert "is-instance" in repr(schema["python_schema"])
+    assert len(schema["json_schema"]["choices"]) == len(schema["python_schema"]["choices"]) - 1
+
+    schema = Currency.__get_pydantic_core_schema__(Currency, None)
+    assert "is-instance" not in repr(schema["json_schema"])
+    assert schema["json_schema"]["choices"][1] == {
+        "type": "chain",
+        "steps": [{"type": "str", "pattern": "^[a-zA-Z]+$"}, schema["python_schema"]["choices"][1]["steps"][1]],
+    }
+
+
+@pytest.mark.skipif(pydantic_is_installed is False, reason="pydantic is not installed")
+def test_pydantic_validate_units_and_nanos() -> None:
+    from pydantic import TypeAdapter, ValidationError
+
+    adapter = TypeAdapter(Money)
+    assert adapter.validate_python({"units": 42, "nanos": 15000000, "currency_code": "usd"}).as_dict() == {
+        "value": "42.015 USD",
+        "units": 42,
+        "nanos": 15000000,
+        "currency_code": "USD",
+    }
+    assert adapter.validate_python({"units": -1, "nanos": -500000000}) == Money("-1.5")
+    assert adapter.validate_python({"units": 1, "nanos": 0, "currency_code": None}).currency is None
+    assert adapter.validate_python({"nanos": 1}).amount == Decimal("0.000000001")
+    assert adapter.validate_json('{"units": 100, "nanos": 500000000, "currency_code": "SEK"}') == Money("100.50 SEK")
+    assert adapter.validate_python({"value": "1.50 SEK", "units": 1, "nanos": 500000000, "currency_code": "SEK"}) == (
+        Money("1.50 SEK")
+    )
+
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"units": 1, "nanos": -500000000})
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"units": 1, "nanos": 1000000000})
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"value": "2.50 SEK", "units": 1, "nanos": 500000000, "currency_code": "SEK"})
+    with pytest.raises(ValidationError):
+        TypeAdapter(Number).validate_python({"units": 1, "nanos": 0, "currency_code": "SEK"})
+
+
+@pytest.mark.skipif(pydantic_is_installed is False, reason="pydantic is not installed")
+def test_pydantic_serialization_modes() -> None:
+    from typing import List
+
+    from pydantic import BaseModel
+
+    from stockholm.types import MoneyAsString, MoneyAsUnitsAndNanos, MoneySerializer, NumberAsString
+
+    if sys.version_info < (3, 9):
+        from typing_extensions import Annotated
+    else:
+        from typing import Annotated
+
+    class TestModel(BaseModel):
+        default: Money
+        string: MoneyAsString
+        units_and_nanos: MoneyAsUnitsAndNanos
+        number: NumberAsString
+        convertible: Annotated[ConvertibleToMoney, MoneySerializer("string")]
+        amounts: List[MoneyAsString]
+
+    m = TestModel(
+        default="1.5 SEK",
+        string="4711.1 EUR",
+        units_and_nanos=Money("-2.5", "USD"),
+        number=42,
+        convertible=100,
+        amounts=["1 SEK", Money(2, "JPY")],
+    )
+
+    assert json.loads(m.model_dump_json()) == {
+        "default": {"value": "1.50 SEK", "units": 1, "nanos": 500000000, "currency_code": "SEK"},
+        "string": "4711.10 EUR",
+        "units_and_nanos": {"units": -2, "nanos": -500000000, "currency_code": "USD"},
+        "number": "42",
+        "convertible": "100.00",
+        "amounts": ["1.00 SEK", "2.00 JPY"],
+    }
+    assert m.model_dump()["string"] == Money("4711.10 EUR")
+    assert m.model_dump(mode="json")["units_and_nanos"] == {"units": -2, "nanos": -500000000, "currency_code": "USD"}
+    assert TestModel.model_validate_json(m.model_dump_json()) == m
+
+    with pytest.raises(ValueError):
+        MoneySerializer("asdict")
+    with pytest.raises(TypeError):
+
+        class InvalidModel(BaseModel):
+            value: Annotated[int, MoneySerializer("string")]
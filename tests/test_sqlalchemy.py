@@ -0,0 +1,97 @@
+from decimal import Decimal
+from typing import Any, Iterator, Optional
+
+import pytest
+
+from stockholm import CurrencyMismatchError, Money
+
+try:
+    from sqlalchemy import String, create_engine, func, select, update
+    from sqlalchemy.exc import StatementError
+    from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+    from stockholm.sqlalchemy import SQLMoney, money_composite
+
+    sqlalchemy_is_installed = True
+except ModuleNotFoundError:
+    sqlalchemy_is_installed = False
+
+pytestmark = pytest.mark.skipif(sqlalchemy_is_installed is False, reason="sqlalchemy is not installed")
+
+if sqlalchemy_is_installed:
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Account(Base):
+        __tablename__ = "accounts"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        balance: Mapped[Money] = mapped_column(SQLMoney(currency="EUR"))
+        limit_amount: Mapped[Optional[Money]] = mapped_column(SQLMoney(storage="numeric"), nullable=True)
+        limit_currency: Mapped[Optional[str]] = mapped_column(String(3), nullable=True)
+        limit: Mapped[Optional[Money]] = money_composite(limit_amount, limit_currency)
+
+
+@pytest.fixture
+def session() -> Iterator[Any]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Account(id=1, balance=Money("150.50", "EUR"), limit=Money(10, "SEK")),
+                Account(id=2, balance=Money(50, "EUR"), limit=Money(20, "NOK")),
+                Account(id=3, balance=Money("-0.000000001", "EUR"), limit=None),
+            ]
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_money_type(session: Any) -> None:
+    balances = session.scalars(select(Account.balance).order_by(Account.id)).all()
+    assert balances == [Money("150.50", "EUR"), Money(50, "EUR"), Money("-0.000000001", "EUR")]
+    assert all(isinstance(balance, Money) and balance.currency_code == "EUR" for balance in balances)
+
+    stored = session.connection().exec_driver_sql("SELECT balance, limit_amount FROM accounts ORDER BY id").all()
+    assert stored[0][0] == 150500000000
+    assert stored[2][0] == -1
+    assert Decimal(str(stored[0][1])) == Decimal(10)
+
+
+def test_money_type_comparison(session: Any) -> None:
+    statement = select(Account.id).where(Account.balance > Money("100", "EUR"))
+    assert "accounts.balance > :balance_1" in str(statement)
+    assert session.scalars(statement).all() == [1]
+    assert session.scalars(select(Account.id).where(Account.balance < 0)).all() == [3]
+    assert session.scalars(select(Account.id).order_by(Account.balance)).all() == [3, 2, 1]
+
+    assert session.scalar(select(func.sum(Account.balance))) == Money("200.499999999", "EUR")
+
+    with pytest.raises(StatementError) as exc_info:
+        session.scalars(select(Account.id).where(Account.balance > Money(100, "SEK"))).all()
+    assert isinstance(exc_info.value.orig, CurrencyMismatchError)
+
+
+def test_money_composite(session: Any) -> None:
+    limits = [account.limit for account in session.scalars(select(Account).order_by(Account.id))]
+    assert limits == [Money(10, "SEK"), Money(20, "NOK"), None]
+    assert limits[0].currency_code == "SEK"
+
+    statement = select(Account.id).where(Account.limit > Money(5, "SEK"))
+    assert "accounts.limit_amount > :limit_amount_1 AND accounts.limit_currency = :limit_currency_1" in str(statement)
+    assert session.scalars(statement).all() == [1]
+    assert session.scalars(select(Account.id).where(Account.limit >= 10).order_by(Account.id)).all() == [1, 2]
+    assert session.scalars(select(Account.id).where(Account.limit == Money(20, "NOK"))).all() == [2]
+    assert session.scalars(select(Account.id).where(Account.limit != Money(20, "NOK"))).all() == [1]
+    assert session.scalars(select(Account.id).where(Account.limit == None)).all() == [3]  # noqa: E711
+
+    session.execute(update(Account).where(Account.id == 3).values(limit=Money("0.5", "EUR")))
+    account = session.get(Account, 3)
+    session.refresh(account)
+    assert account.limit == Money("0.5", "EUR")
+
+    account.limit = Money(1, "USD")
+    session.commit()
+    assert session.scalars(select(Account.limit_currency).where(Account.id == 3)).one() == "USD"
@@ -0,0 +1,116 @@
+import sqlite3
+from typing import Iterator
+
+import pytest
+
+from stockholm import ConversionError, Currency, Money
+from stockholm.sqlite import connect, from_nanos, insert_many, money_params, read_money, to_nanos
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = connect(":memory:")
+    connection.execute("CREATE TABLE payments (id INTEGER PRIMARY KEY, amount NANOS, currency TEXT)")
+    yield connection
+    connection.close()
+
+
+def test_to_nanos() -> None:
+    assert to_nanos(Money("1.50", "SEK")) == 1500000000
+    assert to_nanos(Money("-0.000000001")) == -1
+    assert to_nanos(Money("0.0000000005")) == 1
+    assert to_nanos(Money("9223372036.854775807")) == 2**63 - 1
+
+    with pytest.raises(ConversionError):
+        to_nanos(Money("9223372036.854775808"))
+    with pytest.raises(ConversionError):
+        to_nanos(Money("-10000000000"))
+
+
+def test_from_nanos() -> None:
+    assert from_nanos(1500000000, "SEK") == Money("1.50", "SEK")
+    assert from_nanos(1500000000, "sek").currency is Currency.SEK
+    assert from_nanos(-1, Currency.EUR) == Money("-0.000000001", "EUR")
+    assert str(from_nanos(2000000000)) == "2.00"
+
+
+def test_money_params() -> None:
+    assert list(money_params([Money("1.50", "SEK"), Money(-2), Money(1000, Currency.JPY)])) == [
+        (1500000000, "SEK"),
+        (-2000000000, None),
+        (1000000000000, "JPY"),
+    ]
+
+
+def test_adapter_and_converter(connection: sqlite3.Connection) -> None:
+    connection.execute("INSERT INTO payments (amount, currency) VALUES (?, ?)", (Money("1.50"), "SEK"))
+    assert connection.execute("SELECT typeof(amount) FROM payments").fetchone() == ("integer",)
+
+    ((value,),) = connection.execute("SELECT amount FROM payments").fetchall()
+    assert isinstance(value, Money)
+    assert value == Money("1.50")
+
+    # the currency would be lost if an amount with a currency was bound as a single parameter
+    with pytest.raises(ConversionError, match="use money_params()"):
+        connection.execute("INSERT INTO payments (amount, currency) VALUES (?, ?)", (Money("1.50", "SEK"), "SEK"))
+
+    ((value,),) = connection.execute("SELECT '1.5 SEK' AS \"value [MONEY]\"").fetchall()
+    assert value == Money("1.5", "SEK")
+
+
+def test_insert_many_read_money(connection: sqlite3.Connection) -> None:
+    values = [Money(f"{i * 7919 % 1000003}.{i % 100:02d}", ("SEK", "EUR", "JPY")[i % 3]) for i in range(100)]
+    assert insert_many(connection, "payments", values) == 100
+
+    rows = connection.execute("SELECT CAST(amount AS INTEGER), currency FROM payments ORDER BY id").fetchall()
+    result = list(read_money(rows))
+    assert result == values
+    assert [m.currency for m in result] == [m.currency for m in values]
+
+    rows = connection.execute("SELECT id, currency, CAST(amount AS INTEGER) FROM payments ORDER BY id").fetchall()
+    assert list(read_money(rows, amount_index=2, currency_index=1)) == values
+
+    with pytest.raises(ConversionError):
+        list(read_money([(None, "SEK")]))
+
+
+def test_sql_arithmetic(connection: sqlite3.Connection) -> None:
+    insert_many(connection, "payments", [Money("0.1", "SEK"), Money("0.2", "SEK"), Money("-5", "SEK")])
+    ((total,),) = connection.execute('SELECT SUM(amount) AS "total [NANOS]" FROM payments').fetchall()
+    assert total == Money("-4.7")
+
+    ((smallest,),) = connection.execute("SELECT amount FROM payments ORDER BY amount LIMIT 1").fetchall()
+    assert smallest == Money(-5)
+
+
+def test_money_sum(connection: sqlite3.Connection) -> None:
+    assert connection.execute("SELECT money_sum(amount, currency) FROM payments").fetchone() == (None,)
+
+    insert_many(connection, "payments", [Money("0.1", "EUR"), Money("0.2", "EUR"), Money("9000000000", "EUR")] * 3)
+    ((total,),) = connection.execute('SELECT money_sum(amount, currency) AS "total [MONEY]" FROM payments').fetchall()
+    assert total == Money("27000000000.9", "EUR")
+    assert str(total) == "27000000000.90 EUR"
+
+    assert connection.execute("SELECT money_sum(amount) FROM payments").fetchone() == ("27000000000.90",)
+
+    insert_many(connection, "payments", [Money(1, "SEK")])
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("SELECT money_sum(amount, currency) FROM payments").fetchone()
+
+    connection.execute("INSERT INTO payments (amount, currency) VALUES (?, ?)", (Money(2), "sek"))
+    ((total,),) = connection.execute(
+        "SELECT money_sum(amount, currency) AS \"total [MONEY]\" FROM payments WHERE currency != 'EUR'"
+    ).fetchall()
+    assert total == Money(3, "SEK")
+
+    rows = connection.execute(
+        'SELECT currency, money_sum(amount, currency) AS "total [MONEY]" FROM payments GROUP BY currency ORDER BY 1'
+    ).fetchall()
+    assert rows == [("EUR", Money("27000000000.9", "EUR")), ("SEK", Money(1, "SEK")), ("sek", Money(2, "SEK"))]
+
+    connection.execute("INSERT INTO payments (amount, currency) VALUES (?, NULL)", (Money(4),))
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("SELECT money_sum(amount, currency) FROM payments WHERE currency IS NOT 'EUR'").fetchone()
+    assert connection.execute("SELECT money_sum(amount, currency) FROM payments WHERE currency IS NULL").fetchone() == (
+        "4.00",
+    )
@@ -0,0 +1,96 @@
+import io
+from decimal import Decimal
+
+from stockholm import Currency, Money, Number
+from stockholm.locale import get_formatter
+from stockholm.table import render_columns, render_table, write_table
+
+ROWS = [
+    ("2024-01-01", "Salary", Money("25000", "SEK"), Money("25000.5", "SEK")),
+    ("2024-01-03", "Groceries", Money("-1234.567", "SEK"), Money("23765.933", "SEK")),
+    ("2024-01-05", "Fee", Money("-5", "SEK"), None),
+]
+
+
+def test_render_table() -> None:
+    assert list(render_table(ROWS, headers=["Date", "Text", "Amount", "Balance"])) == [
+        "Date        Text              Amount        Balance",
+        "2024-01-01  Salary     25000.00 SEK   25000.50 SEK",
+        "2024-01-03  Groceries  -1234.567 SEK  23765.933 SEK",
+        "2024-01-05  Fee           -5.00 SEK",
+    ]
+
+
+def test_render_table_format_specs() -> None:
+    assert list(render_table(ROWS, format_specs=[None, None, ",.2M", ",.2f"], separator=" | ")) == [
+        "2024-01-01 | Salary    | SEK 25,000.00 | 25,000.50",
+        "2024-01-03 | Groceries | SEK -1,234.57 | 23,765.93",
+        "2024-01-05 | Fee       |     SEK -5.00 |",
+    ]
+
+    assert list(render_table([[Money(1, Currency.JPY)], [Money("1.5", Currency.SEK)]], format_specs="m")) == [
+        "1 JPY",
+        "1.50 SEK",
+    ]
+
+
+def test_render_table_decimal_alignment() -> None:
+    rows = [[Number("1.5")], [Number("-1000")], [Decimal("0.125")], [12]]
+    assert list(render_table(rows, headers=["Value"])) == [
+        "    Value",
+        "    1.5",
+        "-1000",
+        "    0.125",
+        "   12",
+    ]
+
+
+def test_render_table_streaming() -> None:
+    lines = render_table(
+        iter(ROWS), headers=["Date", "Text", "Amount", "Balance"], format_specs=",.2f", widths=[10, 9, 10, 10]
+    )
+    assert next(lines) == "Date        Text           Amount     Balance"
+    assert list(lines) == [
+        "2024-01-01  Salary      25,000.00   25,000.50",
+        "2024-01-03  Groceries   -1,234.57   23,765.93",
+        "2024-01-05  Fee             -5.00",
+    ]
+
+    # given the widths of the buffered table, streamed rows render the same as the buffered table
+    headers = ["Date", "Text", "Amount", "Balance"]
+    buffered = list(render_table(ROWS, headers=headers, format_specs=",.2f"))
+    assert list(render_table(iter(ROWS), headers=headers, format_specs=",.2f", widths=[10, 9, 9, 9])) == buffered
+
+    rows = [[Number("1.5"), "x"], [Number("-1000"), "y"], [Decimal("0.2"), "z"], [12, None]]
+    assert list(render_table(iter(rows), headers=["Value", "Text"], widths=[7, 4], decimal_point=".")) == [
+        "  Value  Text",
+        "    1.5  x",
+        "-1000    y",
+        "    0.2  z",
+        "   12",
+    ]
+    assert list(render_table(iter([]), headers=["Value"], widths=[7])) == ["Value"]
+
+
+def test_render_columns() -> None:
+    columns = {
+        "Belopp": [row[2] for row in ROWS],
+        "Saldo": [row[3] for row in ROWS],
+    }
+    formatter = get_formatter("sv_SE")
+    lines = list(render_columns(columns, format_specs={"Belopp": formatter.format}, decimal_point=","))
+    assert [line.replace("\xa0", " ") for line in lines] == [
+        "      Belopp          Saldo",
+        "25 000,00 kr   25000.50 SEK",
+        "−1 234,57 kr  23765.933 SEK",
+        "    −5,00 kr",
+    ]
+
+    assert list(render_columns({"a": [1, 2], "b": ["x", "y"]}, headers=False)) == ["1  x", "2  y"]
+
+
+def test_write_table() -> None:
+    fp = io.StringIO()
+    assert write_table(fp, ROWS, headers=["Date", "Text", "Amount", "Balance"], chunk_size=2) == 4
+    assert fp.getvalue().splitlines() == list(render_table(ROWS, headers=["Date", "Text", "Amount", "Balance"]))
+    assert write_table(fp, []) == 0
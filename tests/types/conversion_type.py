@@ -18,7 +18,7 @@ assert r == 50.5
 
 m = Money(Number("1012312112312.1412312321"), "USD")
 assert m == "1012312112312.1412312321"
-assert m.__reduce__() == (Money, ("1012312112312.1412312321", "USD"))
+assert m.__reduce__()[1] == (Money, "1012312112312.1412312321", "USD")
 
 # Type hint validation for .proto()
 m1 = Money(12984, Currency.JPY)
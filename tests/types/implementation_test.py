@@ -1,5 +1,6 @@
 import stockholm.currency
 from stockholm import BaseCurrency, Currency, Money, Number, Rate, get_currency
+from stockholm.money import _unpickle
 
 assert Money(100, stockholm.currency.EUR) == Money("100 EUR")
 assert Money(100, BaseCurrency("SEK")) == Money("100 SEK")
@@ -29,7 +30,7 @@ assert Money(100, BaseCurrency(Currency.SEK)).currency == stockholm.currency.SEK
 assert Money(100, Currency(stockholm.currency.SEK)).currency == stockholm.currency.SEK
 assert Money(100, Currency(Currency.SEK)).currency == stockholm.currency.SEK
 
-assert Rate(1).__reduce__() == (Rate, ("1", None))
-assert Number(1).__reduce__() == (Number, ("1", None))
-assert Rate(Number(100)).__reduce__() == (Rate, ("100", None))
-assert Rate(Money(4711)).__reduce__() == (Rate, ("4711", None))
+assert Rate(1).__reduce__() == (_unpickle, (Rate, "1", None))
+assert Number(1).__reduce__() == (_unpickle, (Number, "1", None))
+assert Rate(Number(100)).__reduce__() == (_unpickle, (Rate, "100", None))
+assert Rate(Money(4711)).__reduce__() == (_unpickle, (Rate, "4711", None))